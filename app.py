@@ -3,7 +3,15 @@ from flask_cors import CORS
 
 from routes.analyzer_route import app_analyzer
 from routes.index_route import app_index
+from routes.job_route import app_jobs
+from routes.lexicon_route import app_lexicon
+from routes.live_route import app_live
+from routes.stats_route import app_stats
+from services import analyzer_service as an
 from services import constants_service as ct
+from services import engine_service as es
+from services import job_service as js
+from services import pool_service as ps
 
 # Create the Flask app
 app = Flask(__name__)
@@ -11,12 +19,28 @@ app = Flask(__name__)
 # Add CORS handling
 cors = CORS(app)
 
+# Load the sentiment analyzer lexicon before serving the first request
+an.warm_up()
+
+# Load what the configured scoring engine needs, if it is not the VADER analyzer
+es.get_engine().warm_up()
+
+# Start the scoring worker processes, each one loading its own lexicon
+ps.warm_up()
+
+# Start the background job workers
+js.start_workers()
+
 # Log the server's activity
 app.debug = True
 
 # Register the routes
 app.register_blueprint(app_analyzer, url_prefix=f'/{ct.get_analyzer_endpoint_url_prefix()}')
 app.register_blueprint(app_index, url_prefix=f'/{ct.get_index_endpoint_url_prefix()}')
+app.register_blueprint(app_stats, url_prefix=f'/{ct.get_stats_endpoint_url_prefix()}')
+app.register_blueprint(app_jobs, url_prefix=f'/{ct.get_jobs_endpoint_url_prefix()}')
+app.register_blueprint(app_live, url_prefix=f'/{ct.get_live_endpoint_url_prefix()}')
+app.register_blueprint(app_lexicon, url_prefix=f'/{ct.get_lexicon_endpoint_url_prefix()}')
 
 
 @app.after_request
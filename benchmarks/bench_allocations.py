@@ -0,0 +1,63 @@
+import argparse
+import time
+import tracemalloc
+
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from benchmarks.bench_token_memo import get_novel_texts
+from services import analyzer_service as an
+
+# Default number of texts scored per measure
+default_size = 20000
+
+
+def measure(analyzer: SentimentIntensityAnalyzer, texts: list[str]) -> tuple[float, float, float]:
+    """
+    Return the memory allocated while the provided analyzer scores each text, traced request by request,
+    and its throughput measured without tracing.
+    :param analyzer: the sentiment analyzer to measure
+    :param texts: texts to score
+    :return: the mean peak of bytes allocated per text, the mean number of bytes still allocated after each text
+    and the number of texts scored per second
+    """
+    for text in texts:
+        analyzer.polarity_scores(text)
+    start = time.perf_counter()
+    for text in texts:
+        analyzer.polarity_scores(text)
+    throughput = len(texts) / (time.perf_counter() - start)
+    peak_total = 0
+    retained_total = 0
+    tracemalloc.start()
+    for text in texts:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        analyzer.polarity_scores(text)
+        after, peak = tracemalloc.get_traced_memory()
+        peak_total += peak - before
+        retained_total += after - before
+    tracemalloc.stop()
+    return peak_total / len(texts), retained_total / len(texts), throughput
+
+
+def main():
+    """
+    Print the memory allocated per request and the throughput of the stock VADER analyzer
+    and of the analyzer of the scoring path, once its token memo is warm.
+    """
+    parser = argparse.ArgumentParser(description='Memory allocated per request, stock versus scoring path analyzer')
+    parser.add_argument('--size', type=int, default=default_size)
+    arguments = parser.parse_args()
+    texts = get_novel_texts(arguments.size)
+    analyzer = an.reload()
+    stock_analyzer = SentimentIntensityAnalyzer.__new__(SentimentIntensityAnalyzer)
+    stock_analyzer.lexicon = analyzer.lexicon
+    stock_analyzer.emojis = analyzer.emojis
+    print(f'{"analyzer":>10}{"peak bytes/text":>18}{"retained bytes/text":>22}{"texts/s":>10}')
+    for name, measured_analyzer in [('stock', stock_analyzer), ('scoring', analyzer)]:
+        peak, retained, throughput = measure(measured_analyzer, texts)
+        print(f'{name:>10}{peak:>18.0f}{retained:>22.1f}{throughput:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+import argparse
+import random
+import time
+
+from services import analyzer_service as an
+from services import cache_service as cs
+from services import extractor_service as ex
+
+# Default number of single token inputs per measure
+default_size = 100000
+
+# Trailing punctuations of the generated single token inputs
+punctuations = ['', '.', '!', '!!', '!!!', '?', '??']
+
+
+def get_single_token_texts(size: int) -> list[str]:
+    """
+    Return the provided number of reproducible single token inputs : lexicon tokens in their own, lower, upper
+    and capitalized casings, followed by a trailing punctuation.
+    :param size: number of inputs
+    :return: the list of inputs
+    """
+    generator = random.Random(0)
+    tokens = sorted(an.get_analyzer().lexicon)
+    texts = []
+    for _ in range(size):
+        token = generator.choice(tokens)
+        word = generator.choice([token, token.lower(), token.upper(), token.capitalize()])
+        texts.append(word + generator.choice(punctuations))
+    return [text for text in texts if text.split() == [text]]
+
+
+def measure(texts: list[str]) -> float:
+    """
+    Return the mean duration in microseconds of the sentiment extraction of the provided inputs.
+    :param texts: inputs whose sentiment is extracted one by one
+    :return: the mean duration per input in microseconds
+    """
+    start = time.perf_counter()
+    for text in texts:
+        ex.get_sentiment(text)
+    return (time.perf_counter() - start) * 1e6 / len(texts)
+
+
+def main():
+    """
+    Print the sentiment extraction duration of single token inputs answered from the answer table,
+    filled on first use, from the result cache and by scoring them with the token memo, along with the number
+    of answers the table ends up holding.
+    """
+    parser = argparse.ArgumentParser(description='Single token sentiment extraction with and without the answer table')
+    parser.add_argument('--size', type=int, default=default_size)
+    arguments = parser.parse_args()
+    analyzer = an.get_analyzer()
+    texts = get_single_token_texts(arguments.size)
+    first_time = measure(texts)
+    table_time = measure(texts)
+    answer_size = analyzer.answer_size
+    answer_count = len(analyzer.answers)
+    analyzer.answer_size = 0
+    result_cache = cs.get_result_cache()
+    result_cache.clear()
+    scored_time = measure(list(dict.fromkeys(texts)))
+    cached_time = measure(texts)
+    analyzer.answer_size = answer_size
+    print(f'inputs: {len(texts)}, answers: {answer_count}')
+    print(f'{"path":>8}{"us/input":>10}')
+    for path, duration in [('first', first_time), ('table', table_time), ('cache', cached_time),
+                           ('scored', scored_time)]:
+        print(f'{path:>8}{duration:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+import argparse
+import time
+
+import pandas as pd
+
+from services import analyzer_service as an
+from services import batch_service as bs
+from services import extractor_service as ex
+
+# Default numbers of texts scored per measure
+default_sizes = [1000, 100000, 1000000]
+
+
+def get_texts(size: int) -> list[str]:
+    """
+    Return the provided number of texts, repeating the accuracy test dataset sentences.
+    :param size: number of texts
+    :return: the list of texts
+    """
+    sentences = pd.read_csv('./tests/unit/data/accuracy_test_data.csv')['text_snippet'].tolist()
+    return (sentences * (size // len(sentences) + 1))[:size]
+
+
+def measure(score, texts: list[str]) -> float:
+    """
+    Return the throughput in texts per second of the provided scoring function.
+    :param score: function scoring a list of texts
+    :param texts: texts to score
+    :return: the number of texts scored per second
+    """
+    start = time.perf_counter()
+    score(texts)
+    return len(texts) / (time.perf_counter() - start)
+
+
+def main():
+    """
+    Print the throughput of the scalar extractor and of the batch engine for each batch size.
+    """
+    parser = argparse.ArgumentParser(description='Scalar versus batch scoring throughput')
+    parser.add_argument('--sizes', type=int, nargs='+', default=default_sizes)
+    arguments = parser.parse_args()
+    an.warm_up()
+    print(f'{"texts":>9}{"scalar (texts/s)":>19}{"batch (texts/s)":>18}{"speedup":>10}')
+    for size in arguments.sizes:
+        texts = get_texts(size)
+        scalar_throughput = measure(lambda batch: [ex.get_sentiment(text) for text in batch], texts)
+        batch_throughput = measure(bs.get_sentiments, texts)
+        speedup = batch_throughput / scalar_throughput
+        print(f'{size:>9}{scalar_throughput:>19.0f}{batch_throughput:>18.0f}{speedup:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+import argparse
+import time
+
+from benchmarks.bench_token_memo import get_novel_texts
+from services import cache_service as cs
+from services import engine_service as es
+from services import extractor_service as ex
+
+# Default number of novel texts scored per engine
+default_size = 20000
+
+# Number of measures per engine, the best one being kept
+repeat_count = 3
+
+
+def measure(engine: es.Engine, texts: list[str]) -> tuple[float, list[str]]:
+    """
+    Return the best mean duration in microseconds of the scoring of each provided text, one by one,
+    by the provided engine with an empty result cache, and the extracted sentiments.
+    :param engine: the engine to measure
+    :param texts: texts to score
+    :return: the (duration per text, sentiments) tuple
+    """
+    durations = []
+    for _ in range(repeat_count):
+        cs.get_result_cache().clear()
+        start = time.perf_counter()
+        all_polarities = [engine.score(text) for text in texts]
+        durations.append((time.perf_counter() - start) * 1e6 / len(texts))
+    return min(durations), [ex.get_label(polarities['compound']) for polarities in all_polarities]
+
+
+def main():
+    """
+    Print the latency of the VADER and cascade engines on novel texts, the fraction of texts
+    the cascade escalated to VADER and the number of labels differing from VADER's.
+    """
+    parser = argparse.ArgumentParser(description='VADER versus cascade engine latency and escalation on novel texts')
+    parser.add_argument('--size', type=int, default=default_size)
+    arguments = parser.parse_args()
+    texts = get_novel_texts(arguments.size)
+    vader_engine = es.get_engine('vader')
+    cascade_engine = es.get_engine(es.CascadeEngine.name)
+    vader_engine.warm_up()
+    measure(vader_engine, texts)
+    vader_time, vader_sentiments = measure(vader_engine, texts)
+    stats_before = cascade_engine.get_stats()
+    cascade_time, cascade_sentiments = measure(cascade_engine, texts)
+    escalated_count = (cascade_engine.get_stats()['escalated'] - stats_before['escalated']) / repeat_count
+    flip_count = sum(vader_sentiment != cascade_sentiment
+                     for vader_sentiment, cascade_sentiment in zip(vader_sentiments, cascade_sentiments))
+    print(f'novel texts: {len(texts)}, escalated: {escalated_count / len(texts):.1%}, label flips: {flip_count}')
+    print(f'{"engine":>8}{"us/text":>10}')
+    for name, duration in [('vader', vader_time), ('cascade', cascade_time)]:
+        print(f'{name:>8}{duration:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+import argparse
+import time
+
+from benchmarks.bench_token_memo import get_novel_texts
+from services import analyzer_service as an
+from services import deadline_service as dl
+from services import extractor_service as ex
+
+# Default number of novel texts per measure
+default_size = 20000
+
+# Default number of characters of the long document
+default_document_length = 100000
+
+# Number of measures per path, the best one being kept
+repeat_count = 3
+
+
+def measure(score, texts: list[str]) -> float:
+    """
+    Return the best duration in nanoseconds per input character of the scoring of each provided text, one by one.
+    :param score: function returning the polarities of a text
+    :param texts: texts to score
+    :return: the duration per character in nanoseconds
+    """
+    character_count = sum(len(text) for text in texts)
+    durations = []
+    for _ in range(repeat_count):
+        start = time.perf_counter()
+        for text in texts:
+            score(text)
+        durations.append((time.perf_counter() - start) * 1e9 / character_count)
+    return min(durations)
+
+
+def main():
+    """
+    Print the full and approximated scoring durations per input character of novel texts and of a long document
+    made of them, the cost per character the deadlines are predicted with, and the share of novel texts
+    whose approximated label is the VADER one.
+    """
+    parser = argparse.ArgumentParser(description='Full versus approximated scoring cost per input character')
+    parser.add_argument('--size', type=int, default=default_size)
+    parser.add_argument('--document-length', type=int, default=default_document_length)
+    arguments = parser.parse_args()
+    analyzer = an.get_analyzer()
+    texts = get_novel_texts(arguments.size)
+    document = ' '.join(texts)[:arguments.document_length]
+    predicted_cost = dl.get_cost_per_character() * 1e9
+    rows = []
+    for name, inputs in [('texts', texts), ('document', [document])]:
+        full_time = measure(analyzer.polarity_scores, inputs)
+        approximated_time = measure(analyzer.approximate_scores, inputs)
+        rows.append((name, full_time, approximated_time))
+    agreement_count = sum(ex.get_label(analyzer.approximate_scores(text)['compound'])
+                          == ex.get_label(analyzer.polarity_scores(text)['compound']) for text in texts)
+    print(f'novel texts: {len(texts)}, document: {len(document)} characters, '
+          f'approximated labels kept: {agreement_count / len(texts):.1%}, predicted cost: {predicted_cost:.0f} ns/char')
+    print(f'{"input":>10}{"full ns/char":>14}{"approx ns/char":>16}{"speedup":>9}')
+    for name, full_time, approximated_time in rows:
+        print(f'{name:>10}{full_time:>14.1f}{approximated_time:>16.1f}{full_time / approximated_time:>8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+import argparse
+import os
+import time
+
+import pandas as pd
+
+from services import cache_service as cs
+from services import document_service as ds
+from services import pool_service as ps
+
+# Default document sizes in characters
+default_sizes = [4000, 16000, 64000]
+
+# Number of measures per document size and worker count, the best one being kept
+repeat_count = 5
+
+
+def get_document(size: int) -> str:
+    """
+    Return a document of about the provided number of characters, joining the accuracy test dataset sentences.
+    :param size: number of characters
+    :return: the document
+    """
+    sentences = pd.read_csv('./tests/unit/data/accuracy_test_data.csv')['text_snippet'].tolist()
+    document = ''
+    while len(document) < size:
+        document += ' '.join(sentences) + '\n\n'
+    return document[:size]
+
+
+def measure(document: str) -> float:
+    """
+    Return the best latency in milliseconds of scoring the provided document with an empty result cache.
+    :param document: document to score
+    :return: the lowest document scoring latency
+    """
+    latencies = []
+    for _ in range(repeat_count):
+        cs.get_result_cache().clear()
+        start = time.perf_counter()
+        ds.get_document_polarities(document)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return min(latencies)
+
+
+def main():
+    """
+    Print the document scoring latency for each document size and number of worker processes.
+    """
+    parser = argparse.ArgumentParser(description='Document scoring latency per number of worker processes')
+    parser.add_argument('--sizes', type=int, nargs='+', default=default_sizes)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, os.cpu_count() or 1])
+    arguments = parser.parse_args()
+    worker_counts = sorted(set(arguments.workers))
+    print(f'{"characters":>11}' + ''.join(f'{f"{count} workers (ms)":>18}' for count in worker_counts))
+    latencies = {}
+    for worker_count in worker_counts:
+        os.environ['SENTIMENT_POOL_WORKERS'] = str(worker_count)
+        os.environ['SENTIMENT_POOL_MIN_TEXTS'] = '1'
+        ps.shutdown()
+        ds.get_document_polarities(get_document(max(arguments.sizes)))
+        for size in arguments.sizes:
+            latencies[size, worker_count] = measure(get_document(size))
+    ps.shutdown()
+    for size in arguments.sizes:
+        print(f'{size:>11}' + ''.join(f'{latencies[size, count]:>18.1f}' for count in worker_counts))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+import argparse
+import random
+import time
+from collections.abc import Callable
+
+import pandas as pd
+
+from services import analyzer_service as an
+
+# Default number of texts replaced per measure
+default_size = 100000
+
+
+def replace_emojis(text: str, emojis: dict[str, str]) -> str:
+    """
+    Return the provided text with its emojis replaced character by character, as the stock VADER analyzer does.
+    :param text: input text
+    :param emojis: emoji to description mapping
+    :return: the text without emojis
+    """
+    text_no_emoji = ''
+    prev_space = True
+    for character in text:
+        if character in emojis:
+            if not prev_space:
+                text_no_emoji += ' '
+            text_no_emoji += emojis[character]
+            prev_space = False
+        else:
+            text_no_emoji += character
+            prev_space = character == ' '
+    return text_no_emoji.strip()
+
+
+def get_texts(size: int, emojis: dict[str, str]) -> dict[str, list[str]]:
+    """
+    Return the provided number of ASCII texts, of mixed texts holding accented letters and an emoji,
+    and of emoji-heavy texts, all built from the accuracy test dataset sentences.
+    :param size: number of texts per kind
+    :param emojis: emoji to description mapping
+    :return: the dictionary of texts by kind
+    """
+    sentences = pd.read_csv('./tests/unit/data/accuracy_test_data.csv')['text_snippet'].tolist()
+    sentences = [sentence for sentence in sentences if sentence.isascii()]
+    emoji_characters = [emoji for emoji in emojis if len(emoji) == 1]
+    generator = random.Random(0)
+    ascii_texts = [generator.choice(sentences) for _ in range(size)]
+    mixed_texts = [f'{text.replace("e", "é", 1)} {generator.choice(emoji_characters)}' for text in ascii_texts]
+    heavy_texts = [' '.join(f'{word}{generator.choice(emoji_characters)}' for word in text.split())
+                   for text in ascii_texts]
+    return {'ascii': ascii_texts, 'mixed': mixed_texts, 'emoji-heavy': heavy_texts}
+
+
+def measure(replace: Callable[[str], str], texts: list[str]) -> float:
+    """
+    Return the throughput in texts per second of the provided emoji replacement.
+    :param replace: function replacing the emojis of a text
+    :param texts: texts to replace the emojis of
+    :return: the number of texts replaced per second
+    """
+    start = time.perf_counter()
+    for text in texts:
+        replace(text)
+    return len(texts) / (time.perf_counter() - start)
+
+
+def main():
+    """
+    Print the throughput of the stock character by character emoji replacement
+    and of the single pass one, on ASCII, mixed and emoji-heavy texts.
+    """
+    parser = argparse.ArgumentParser(description='Stock versus single pass emoji replacement throughput')
+    parser.add_argument('--size', type=int, default=default_size)
+    arguments = parser.parse_args()
+    analyzer = an.get_analyzer()
+    emojis = analyzer.emojis
+    print(f'{"texts":>12}{"stock/s":>12}{"single pass/s":>15}{"speedup":>10}')
+    for kind, texts in get_texts(arguments.size, emojis).items():
+        assert [analyzer.emoji_replacer.replace(text) for text in texts] == [replace_emojis(text, emojis)
+                                                                            for text in texts]
+        stock_throughput = measure(lambda text: replace_emojis(text, emojis), texts)
+        throughput = measure(analyzer.emoji_replacer.replace, texts)
+        print(f'{kind:>12}{stock_throughput:>12.0f}{throughput:>15.0f}{throughput / stock_throughput:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+import argparse
+import time
+
+import pandas as pd
+from sklearn.metrics import accuracy_score
+
+from services import cache_service as cs
+from services import constants_service as ct
+from services import engine_service as es
+from services import extractor_service as ex
+
+# Number of measures per engine, the best one being kept
+repeat_count = 5
+
+
+def get_expected_sentiment(rating: float) -> str:
+    """
+    Return the sentiment of the provided accuracy test dataset rating.
+    :param rating: mean sentiment rating between -1 and 1
+    :return: the sentiment label
+    """
+    if rating >= ct.get_threshold():
+        return ct.get_positivity_label()
+    elif rating <= -ct.get_threshold():
+        return ct.get_negativity_label()
+    return ct.get_neutrality_label()
+
+
+def measure(engine: es.Engine, texts: list[str]) -> tuple[float, float, list[str]]:
+    """
+    Return the best single text latency and the best score_many throughput of the provided engine,
+    with an empty result cache, along with the sentiments it extracts from the provided texts.
+    :param engine: warmed up engine
+    :param texts: accuracy test dataset texts
+    :return: the (microseconds per text, texts per second, score_many sentiments) tuple
+    """
+    latencies = []
+    throughputs = []
+    for _ in range(repeat_count):
+        cs.get_result_cache().clear()
+        start = time.perf_counter()
+        for text in texts:
+            engine.score(text)
+        latencies.append((time.perf_counter() - start) * 10 ** 6 / len(texts))
+        cs.get_result_cache().clear()
+        start = time.perf_counter()
+        all_polarities = engine.score_many(texts)
+        throughputs.append(len(texts) / (time.perf_counter() - start))
+    sentiments = [ex.get_label(polarities['compound']) for polarities in all_polarities]
+    return min(latencies), max(throughputs), sentiments
+
+
+def main():
+    """
+    Print the warm-up time, the single text latency, the score_many throughput and the accuracy
+    of each registered engine on the accuracy test dataset.
+    """
+    parser = argparse.ArgumentParser(description='Latency, throughput and accuracy of each scoring engine')
+    parser.add_argument('--engines', nargs='+', default=es.get_engine_names())
+    parser.add_argument('--copies', type=int, default=10, help='times the dataset is repeated for score_many')
+    arguments = parser.parse_args()
+    df = pd.read_csv('./tests/unit/data/accuracy_test_data.csv')
+    expected_sentiments = df['mean_sentiment_rating'].apply(get_expected_sentiment).tolist()
+    texts = df['text_snippet'].tolist()
+    print(f'{"engine":>10}{"warm-up (ms)":>14}{"us/text":>10}{"texts/s":>11}{"accuracy":>10}')
+    for name in arguments.engines:
+        engine = es.get_engine(name)
+        start = time.perf_counter()
+        engine.warm_up()
+        warm_up_time = (time.perf_counter() - start) * 1000
+        latency, throughput, sentiments = measure(engine, texts * arguments.copies)
+        accuracy = accuracy_score(expected_sentiments, sentiments[:len(texts)])
+        print(f'{name:>10}{warm_up_time:>14.1f}{latency:>10.1f}{throughput:>11.0f}{accuracy:>10.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+import argparse
+import random
+import time
+from collections.abc import Callable
+
+import vaderSentiment.vaderSentiment as vader
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from services import analyzer_service as an
+from services import phrase_service as ph
+
+# Default numbers of words per text
+default_lengths = [50, 500, 5000]
+
+# Number of measures per text length and idioms rule, the best one being kept
+repeat_count = 5
+
+
+def get_text(length: int) -> list[str]:
+    """
+    Return a reproducible phrase-dense text : about one word out of two belongs to a VADER phrase,
+    the other ones being lexicon words.
+    :param length: number of words
+    :return: the words of the text
+    """
+    generator = random.Random(length)
+    phrases = [phrase.split(' ') for phrase in list(vader.SPECIAL_CASES) + list(vader.BOOSTER_DICT) if ' ' in phrase]
+    words = []
+    while len(words) < length:
+        words += generator.choice(phrases) + [generator.choice(['good', 'bad', 'love', 'horrible', 'great'])]
+    return words[:length]
+
+
+def window_idioms_rule(lowers: list[str], i: int) -> float:
+    """
+    Return the idioms rule valence of the lexicon token at the provided position, building the word windows
+    around the token and looking them up in the phrase dictionaries, as the analyzer did before the matcher.
+    :param lowers: lower cased words of the text
+    :param i: position of the lexicon token
+    :return: the float valence of the token
+    """
+    valence = 1.0
+    one_zero = f'{lowers[i - 1]} {lowers[i]}'
+    two_one_zero = f'{lowers[i - 2]} {lowers[i - 1]} {lowers[i]}'
+    two_one = f'{lowers[i - 2]} {lowers[i - 1]}'
+    three_two_one = f'{lowers[i - 3]} {lowers[i - 2]} {lowers[i - 1]}'
+    three_two = f'{lowers[i - 3]} {lowers[i - 2]}'
+    for sequence in [one_zero, two_one_zero, two_one, three_two_one, three_two]:
+        if sequence in vader.SPECIAL_CASES:
+            valence = vader.SPECIAL_CASES[sequence]
+            break
+    if len(lowers) - 1 > i:
+        zero_one = f'{lowers[i]} {lowers[i + 1]}'
+        if zero_one in vader.SPECIAL_CASES:
+            valence = vader.SPECIAL_CASES[zero_one]
+    if len(lowers) - 1 > i + 1:
+        zero_one_two = f'{lowers[i]} {lowers[i + 1]} {lowers[i + 2]}'
+        if zero_one_two in vader.SPECIAL_CASES:
+            valence = vader.SPECIAL_CASES[zero_one_two]
+    for n_gram in [three_two_one, three_two, two_one]:
+        if n_gram in vader.BOOSTER_DICT:
+            valence = valence + vader.BOOSTER_DICT[n_gram]
+    return valence
+
+
+def stock_idioms(words: list[str], positions: list[int]):
+    """
+    Apply the stock VADER idioms rule, which lower cases the whole text, to each provided position.
+    :param words: words of the text
+    :param positions: positions of the lexicon tokens
+    """
+    for i in positions:
+        SentimentIntensityAnalyzer._special_idioms_check(1.0, words, i)
+
+
+def window_idioms(words: list[str], positions: list[int]):
+    """
+    Apply the word window idioms rule to each provided position.
+    :param words: words of the text
+    :param positions: positions of the lexicon tokens
+    """
+    lowers = [word.lower() for word in words]
+    for i in positions:
+        window_idioms_rule(lowers, i)
+
+
+def matcher_idioms(words: list[str], positions: list[int]):
+    """
+    Find the phrases of the text in a single pass, then look them up for each provided position.
+    :param words: words of the text
+    :param positions: positions of the lexicon tokens
+    """
+    phrases = ph.VADER_PHRASE_MATCHER.find([word.lower() for word in words])
+    for i in positions:
+        for end_and_length in [(i, 2), (i, 3), (i - 1, 2), (i - 1, 3), (i - 2, 2), (i + 1, 2), (i + 2, 3)]:
+            phrases.get(end_and_length)
+
+
+def measure(apply_idioms: Callable[[list[str], list[int]], None], words: list[str], positions: list[int]) -> float:
+    """
+    Return the best duration in milliseconds of applying the provided idioms rule to a text.
+    :param apply_idioms: function applying the idioms rule to each lexicon token of a text
+    :param words: words of the text
+    :param positions: positions of the lexicon tokens
+    :return: the lowest duration in milliseconds
+    """
+    durations = []
+    for _ in range(repeat_count):
+        start = time.perf_counter()
+        apply_idioms(words, positions)
+        durations.append((time.perf_counter() - start) * 1000)
+    return min(durations)
+
+
+def main():
+    """
+    Print the duration of the idioms rule over every lexicon token of phrase-dense texts with the stock rule,
+    the word window rule and the phrase matcher, and the analyzer scoring duration of the same texts.
+    """
+    parser = argparse.ArgumentParser(description='Idioms rule duration on long phrase-dense texts')
+    parser.add_argument('--lengths', type=int, nargs='+', default=default_lengths)
+    parser.add_argument('--skip-stock', action='store_true', help='skip the quadratic stock rule')
+    arguments = parser.parse_args()
+    analyzer = an.get_analyzer()
+    print(f'{"words":>7}{"stock (ms)":>12}{"windows (ms)":>14}{"matcher (ms)":>14}{"scoring (ms)":>14}')
+    for length in arguments.lengths:
+        words = get_text(length)
+        positions = [i for i in range(3, len(words)) if words[i].lower() in analyzer.lexicon]
+        stock_duration = float('nan') if arguments.skip_stock else measure(stock_idioms, words, positions)
+        window_duration = measure(window_idioms, words, positions)
+        matcher_duration = measure(matcher_idioms, words, positions)
+        scoring_duration = measure(lambda text_words, _: analyzer.polarity_scores(' '.join(text_words)), words, [])
+        print(f'{length:>7}{stock_duration:>12.2f}{window_duration:>14.2f}{matcher_duration:>14.2f}'
+              f'{scoring_duration:>14.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import StratifiedKFold
+
+from services import cache_service as cs
+from services import constants_service as ct
+from services import engine_service as es
+from services import extractor_service as ex
+from services import linear_service as ls
+
+# Number of measures per engine, the best one being kept
+repeat_count = 5
+
+
+def get_expected_sentiment(rating: float) -> str:
+    """
+    Return the sentiment of the provided accuracy test dataset rating.
+    :param rating: mean sentiment rating between -1 and 1
+    :return: the sentiment label
+    """
+    if rating >= ct.get_threshold():
+        return ct.get_positivity_label()
+    elif rating <= -ct.get_threshold():
+        return ct.get_negativity_label()
+    return ct.get_neutrality_label()
+
+
+def get_sentiments(score_many, texts: list[str]) -> list[str]:
+    """
+    Return the sentiments extracted from the polarities of the provided texts.
+    :param score_many: function returning the polarities of a list of texts
+    :param texts: input texts
+    :return: the list of sentiment labels
+    """
+    return [ex.get_label(polarities['compound']) for polarities in score_many(texts)]
+
+
+def measure_throughput(score_many, texts: list[str]) -> float:
+    """
+    Return the best number of texts scored per second by the provided function, with an empty result cache.
+    :param score_many: function returning the polarities of a list of texts
+    :param texts: input texts
+    :return: the highest throughput in texts per second
+    """
+    throughputs = []
+    for _ in range(repeat_count):
+        cs.get_result_cache().clear()
+        start = time.perf_counter()
+        score_many(texts)
+        throughputs.append(len(texts) / (time.perf_counter() - start))
+    return max(throughputs)
+
+
+def main():
+    """
+    Print the accuracy of the linear engine and of VADER on the held-out folds of the accuracy test dataset,
+    their throughput, and the size and loading time of the linear engine artifact.
+    """
+    parser = argparse.ArgumentParser(description='Hashed features linear engine against VADER')
+    parser.add_argument('--folds', type=int, default=5)
+    parser.add_argument('--copies', type=int, default=10, help='times the dataset is repeated for throughput')
+    arguments = parser.parse_args()
+    df = pd.read_csv('./tests/unit/data/accuracy_test_data.csv')
+    texts = df['text_snippet'].tolist()
+    ratings = df['mean_sentiment_rating'].tolist()
+    expected_sentiments = [get_expected_sentiment(rating) for rating in ratings]
+    vader_engine = es.get_engine('vader')
+    vader_engine.warm_up()
+    folds = StratifiedKFold(arguments.folds, shuffle=True, random_state=0).split(texts, expected_sentiments)
+    linear_sentiments = [''] * len(texts)
+    for train_indexes, test_indexes in folds:
+        model = ls.train_model([texts[index] for index in train_indexes], [ratings[index] for index in train_indexes])
+        fold_sentiments = get_sentiments(model.score_many, [texts[index] for index in test_indexes])
+        for index, sentiment in zip(test_indexes, fold_sentiments):
+            linear_sentiments[index] = sentiment
+    majority_sentiment = max(set(expected_sentiments), key=expected_sentiments.count)
+    linear_accuracy = accuracy_score(expected_sentiments, linear_sentiments)
+    vader_accuracy = accuracy_score(expected_sentiments, get_sentiments(vader_engine.score_many, texts))
+    print(f'held-out accuracy over {arguments.folds} folds : linear {linear_accuracy:.3f}, vader {vader_accuracy:.3f}, '
+          f'majority label {expected_sentiments.count(majority_sentiment) / len(texts):.3f}')
+    model = ls.train_model(texts, ratings)
+    with tempfile.TemporaryDirectory() as directory:
+        model_path = ls.save_model(model, os.path.join(directory, 'linear_model.npz'))
+        start = time.perf_counter()
+        ls.load_model(model_path)
+        load_time = (time.perf_counter() - start) * 1000
+        print(f'artifact : {os.path.getsize(model_path)} bytes, loaded in {load_time:.1f} ms')
+    many_texts = texts * arguments.copies
+    linear_throughput = measure_throughput(model.score_many, many_texts)
+    vader_throughput = measure_throughput(vader_engine.score_many, many_texts)
+    print(f'throughput on {len(many_texts)} texts : linear {linear_throughput:.0f} texts/s, '
+          f'vader {vader_throughput:.0f} texts/s ({linear_throughput / vader_throughput:.1f}x)')
+    print(f'model : {np.count_nonzero(model.weights.any(axis=1))} non zero weight rows out of {model.feature_count}')
+
+
+if __name__ == '__main__':
+    main()
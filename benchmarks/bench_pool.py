@@ -0,0 +1,62 @@
+import argparse
+import os
+import time
+
+import pandas as pd
+
+from services import pool_service as ps
+
+# Default number of texts scored per measure
+default_size = 50000
+
+
+def get_texts(size: int) -> list[str]:
+    """
+    Return the provided number of texts, repeating the accuracy test dataset sentences.
+    :param size: number of texts
+    :return: the list of texts
+    """
+    sentences = pd.read_csv('./tests/unit/data/accuracy_test_data.csv')['text_snippet'].tolist()
+    return (sentences * (size // len(sentences) + 1))[:size]
+
+
+def measure(texts: list[str], worker_count: int) -> float:
+    """
+    Return the throughput in texts per second of the process pool with the provided number of workers,
+    once its workers are started.
+    :param texts: texts to score
+    :param worker_count: number of worker processes, 1 scoring in the current process
+    :return: the number of texts scored per second
+    """
+    os.environ['SENTIMENT_POOL_WORKERS'] = str(worker_count)
+    os.environ['SENTIMENT_POOL_MIN_TEXTS'] = '1'
+    ps.shutdown()
+    ps.warm_up()
+    start = time.perf_counter()
+    ps.score_texts(texts)
+    throughput = len(texts) / (time.perf_counter() - start)
+    ps.shutdown()
+    return throughput
+
+
+def main():
+    """
+    Print the process pool throughput, speedup and parallel efficiency from 1 to N worker processes.
+    """
+    parser = argparse.ArgumentParser(description='Process pool scoring throughput per number of worker processes')
+    parser.add_argument('--size', type=int, default=default_size)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    arguments = parser.parse_args()
+    texts = get_texts(arguments.size)
+    print(f'texts: {len(texts)}, CPUs: {os.cpu_count()}')
+    print(f'{"workers":>8}{"texts/s":>10}{"speedup":>10}{"efficiency":>12}')
+    baseline = None
+    for worker_count in range(1, arguments.max_workers + 1):
+        throughput = measure(texts, worker_count)
+        baseline = baseline or throughput
+        speedup = throughput / baseline
+        print(f'{worker_count:>8}{throughput:>10.0f}{speedup:>9.2f}x{speedup / worker_count:>11.0%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+import argparse
+import time
+
+import pandas as pd
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from services import scorer_service as sc
+
+# Default numbers of words per text
+default_lengths = [5, 20, 100, 1000, 10000]
+
+# Min total number of words scored per measure, so that short texts are measured over many calls
+words_per_measure = 20000
+
+# Number of measures per text length and analyzer, the best one being kept
+repeat_count = 5
+
+
+def get_texts(length: int) -> list[str]:
+    """
+    Return texts of the provided number of words, cut from the accuracy test dataset sentences joined by "but".
+    :param length: number of words per text
+    :return: enough texts to score about the configured number of words
+    """
+    sentences = pd.read_csv('./tests/unit/data/accuracy_test_data.csv')['text_snippet'].tolist()
+    words = ' but '.join(sentences).split()
+    while len(words) < length:
+        words += words
+    count = max(1, words_per_measure // length)
+    starts = [(index * length) % (len(words) - length + 1) for index in range(count)]
+    return [' '.join(words[start:start + length]) for start in starts]
+
+
+def measure(analyzer: SentimentIntensityAnalyzer, texts: list[str]) -> float:
+    """
+    Return the best scoring duration in microseconds per text of the provided analyzer.
+    :param analyzer: the analyzer to measure
+    :param texts: texts to score
+    :return: the lowest duration per text
+    """
+    durations = []
+    for _ in range(repeat_count):
+        start = time.perf_counter()
+        for text in texts:
+            analyzer.polarity_scores(text)
+        durations.append((time.perf_counter() - start) * 10 ** 6 / len(texts))
+    return min(durations)
+
+
+def main():
+    """
+    Print the scoring duration per text of the stock analyzer and of the memoized analyzer,
+    and the speedup, for each text length.
+    """
+    parser = argparse.ArgumentParser(description='Stock versus memoized analyzer scoring duration per text length')
+    parser.add_argument('--lengths', type=int, nargs='+', default=default_lengths)
+    arguments = parser.parse_args()
+    stock_analyzer = SentimentIntensityAnalyzer()
+    analyzer = sc.MemoizedAnalyzer(stock_analyzer.lexicon, stock_analyzer.emojis, 100000)
+    print(f'{"words":>7}{"stock (us)":>14}{"memoized (us)":>15}{"speedup":>10}')
+    for length in arguments.lengths:
+        texts = get_texts(length)
+        for text in texts:
+            assert analyzer.polarity_scores(text) == stock_analyzer.polarity_scores(text)
+        stock_duration = measure(stock_analyzer, texts)
+        duration = measure(analyzer, texts)
+        print(f'{length:>7}{stock_duration:>14.1f}{duration:>15.1f}{stock_duration / duration:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
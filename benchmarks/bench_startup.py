@@ -0,0 +1,68 @@
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from services import snapshot_service as ss
+
+# Number of measured builds for each loading path
+repeat = 50
+
+# Number of measured cold starts for each loading path
+cold_start_repeat = 5
+
+# Python code warming up the analyzer in a fresh interpreter
+warm_up_code = 'from services import analyzer_service as an; an.warm_up()'
+
+
+def measure_build(build) -> float:
+    """
+    Return the median duration in milliseconds of the provided analyzer build function.
+    :param build: function building a sentiment analyzer
+    :return: the median build duration in milliseconds
+    """
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def measure_cold_start(snapshot_path: str) -> float:
+    """
+    Return the median duration in milliseconds of a fresh interpreter warming up the analyzer.
+    :param snapshot_path: lexicon snapshot path given to the interpreter
+    :return: the median cold start duration in milliseconds
+    """
+    environment = dict(os.environ, SENTIMENT_LEXICON_SNAPSHOT=snapshot_path)
+    durations = []
+    for _ in range(cold_start_repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', warm_up_code], env=environment, check=True)
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def main():
+    """
+    Print the analyzer build and cold start durations of the text files and snapshot loading paths.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot_path = ss.build_snapshot(os.path.join(directory, 'lexicon.snapshot'))
+        missing_path = os.path.join(directory, 'missing.snapshot')
+        text_build = measure_build(SentimentIntensityAnalyzer)
+        snapshot_build = measure_build(lambda: ss.load_analyzer(snapshot_path))
+        text_cold_start = measure_cold_start(missing_path)
+        snapshot_cold_start = measure_cold_start(snapshot_path)
+    print(f'{"path":<10}{"build (ms)":>14}{"cold start (ms)":>18}')
+    print(f'{"text":<10}{text_build:>14.2f}{text_cold_start:>18.1f}')
+    print(f'{"snapshot":<10}{snapshot_build:>14.2f}{snapshot_cold_start:>18.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+import argparse
+import random
+import time
+
+import pandas as pd
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from services import analyzer_service as an
+
+# Default number of novel texts scored per measure
+default_size = 100000
+
+
+def get_novel_texts(size: int) -> list[str]:
+    """
+    Return the provided number of texts, each one joining the first half of an accuracy test dataset sentence
+    to the second half of another one, so that texts are novel but share a realistic vocabulary.
+    :param size: number of texts
+    :return: the list of texts
+    """
+    sentences = [sentence.split() for sentence in
+                 pd.read_csv('./tests/unit/data/accuracy_test_data.csv')['text_snippet'].tolist()]
+    generator = random.Random(0)
+    texts = []
+    for _ in range(size):
+        first, second = generator.choice(sentences), generator.choice(sentences)
+        texts.append(' '.join(first[:len(first) // 2] + second[len(second) // 2:]))
+    return texts
+
+
+def measure(analyzer: SentimentIntensityAnalyzer, texts: list[str]) -> float:
+    """
+    Return the throughput in texts per second of the provided analyzer.
+    :param analyzer: the sentiment analyzer to measure
+    :param texts: texts to score
+    :return: the number of texts scored per second
+    """
+    start = time.perf_counter()
+    for text in texts:
+        analyzer.polarity_scores(text)
+    return len(texts) / (time.perf_counter() - start)
+
+
+def main():
+    """
+    Print the throughput of the stock VADER analyzer and of the memoized analyzer,
+    with an empty and with a warm token memo.
+    """
+    parser = argparse.ArgumentParser(description='Stock versus memoized analyzer throughput on novel texts')
+    parser.add_argument('--size', type=int, default=default_size)
+    arguments = parser.parse_args()
+    texts = get_novel_texts(arguments.size)
+    memoized_analyzer = an.reload()
+    stock_analyzer = SentimentIntensityAnalyzer.__new__(SentimentIntensityAnalyzer)
+    stock_analyzer.lexicon = memoized_analyzer.lexicon
+    stock_analyzer.emojis = memoized_analyzer.emojis
+    stock_throughput = measure(stock_analyzer, texts)
+    cold_throughput = measure(memoized_analyzer, texts)
+    warm_throughput = measure(memoized_analyzer, texts)
+    print(f'novel texts: {len(texts)}, memoized tokens: {memoized_analyzer.get_memo_stats()["entries"]}')
+    print(f'{"analyzer":>16}{"texts/s":>10}{"speedup":>10}')
+    for name, throughput in [('stock', stock_throughput), ('memoized (cold)', cold_throughput),
+                             ('memoized (warm)', warm_throughput)]:
+        print(f'{name:>16}{throughput:>10.0f}{throughput / stock_throughput:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
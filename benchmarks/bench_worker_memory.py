@@ -0,0 +1,81 @@
+import argparse
+import csv
+import multiprocessing
+import os
+
+# Numbers of simultaneous worker processes to measure
+worker_counts = [1, 4, 16]
+
+# Sentences scored by every worker before its memory is measured
+with open('./tests/unit/data/accuracy_test_data.csv', newline='', encoding='utf-8') as data_file:
+    sentences = [row['text_snippet'] for row in csv.DictReader(data_file)]
+
+
+def read_memory_usage() -> dict[str, int]:
+    """
+    Return the resident, proportional and unique set sizes of the current process in kB.
+    :return: a dictionary with the "rss", "pss" and "uss" memory usages
+    """
+    fields = {}
+    with open('/proc/self/smaps_rollup') as smaps_file:
+        for line in smaps_file:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == 'kB':
+                fields[parts[0].rstrip(':')] = int(parts[1])
+    uss = fields['Private_Clean'] + fields['Private_Dirty']
+    return {'rss': fields['Rss'], 'pss': fields['Pss'], 'uss': uss}
+
+
+def run_worker(barrier, results):
+    """
+    Build the analyzer, score the sentences, wait for every other worker then report the memory usage.
+    :param barrier: barrier shared by all the workers of the measure
+    :param results: queue receiving the memory usage of the worker
+    """
+    from services import extractor_service as ex
+    for sentence in sentences:
+        ex.get_sentiment(sentence)
+    barrier.wait()
+    results.put(read_memory_usage())
+    barrier.wait()
+
+
+def measure(backend: str, worker_count: int, start_method: str) -> dict[str, float]:
+    """
+    Return the mean memory usage per worker with the provided lexicon backend and number of workers.
+    :param backend: lexicon backend given to the workers
+    :param worker_count: number of simultaneous workers
+    :param start_method: multiprocessing start method of the workers
+    :return: the mean "rss", "pss" and "uss" memory usages per worker in kB
+    """
+    os.environ['SENTIMENT_LEXICON_BACKEND'] = backend
+    context = multiprocessing.get_context(start_method)
+    barrier = context.Barrier(worker_count)
+    results = context.Queue()
+    workers = [context.Process(target=run_worker, args=(barrier, results)) for _ in range(worker_count)]
+    for worker in workers:
+        worker.start()
+    usages = [results.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+    return {key: sum(usage[key] for usage in usages) / worker_count for key in ['rss', 'pss', 'uss']}
+
+
+def main():
+    """
+    Print the memory usage per worker of the dict and mapped lexicon backends with 1, 4 and 16 workers.
+    """
+    parser = argparse.ArgumentParser(description='Per-worker memory usage of the lexicon backends')
+    parser.add_argument('--start-method', choices=['spawn', 'fork'], default='spawn')
+    arguments = parser.parse_args()
+    from services import analyzer_service as an
+    an.warm_up()
+    print(f'{"backend":<9}{"workers":>8}{"RSS (kB)":>12}{"PSS (kB)":>12}{"USS (kB)":>12}')
+    for backend in ['dict', 'mapped']:
+        for worker_count in worker_counts:
+            usage = measure(backend, worker_count, arguments.start_method)
+            print(f'{backend:<9}{worker_count:>8}{usage["rss"]:>12.0f}{usage["pss"]:>12.0f}{usage["uss"]:>12.0f}')
+
+
+if __name__ == '__main__':
+    main()
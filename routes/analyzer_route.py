@@ -1,4 +1,12 @@
-from flask import Blueprint, request, make_response, jsonify, Response
+import json
+import time
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+from flask import Blueprint, request, make_response, jsonify, Response, stream_with_context
+from services import deadline_service as dl
+from services import document_service as ds
+from services import engine_service as es
 from services import extractor_service as ex
 from services import constants_service as ct
 
@@ -12,13 +20,61 @@ def analyze() -> Response:
     Return a 200 OK Flask Response containing the extracted sentiment string
     from the request JSON "input" component if the input is valid,
     otherwise return a 400 Bad Request.
+    The optional "threshold" and "labels" components replace the extractor threshold and label names,
+    a true "scores" component returns the sentiment along with the polarity scores it comes from
+    and the optional "engine" component selects the scoring engine instead of the configured one.
+    Polarities are cached, so changing the threshold or the labels never scores the input again.
+    When the full scoring would end after the deadline of the request, set by its deadline header
+    or by the configured default budget, the polarities are approximated and the response is marked as degraded.
     :return: the extracted sentiment (between "positive", "neutral" and "negative"
     """
+    start = time.perf_counter()
     if is_invalid_request_json(request.json):
         return get_400_response_from_input(request.json)
+    deadline_header = request.headers.get(ct.get_deadline_header())
+    if is_invalid_deadline_header(deadline_header):
+        return get_400_response({ct.get_response_message_key(): ct.get_invalid_deadline_message()})
+    budget = dl.get_budget(deadline_header)
     user_input = request.json[ct.get_analyzer_endpoint_key()]
-    extracted_sentiment = ex.get_sentiment(user_input)
-    return make_response(jsonify(extracted_sentiment))
+    polarities, is_degraded = dl.get_polarities(user_input, request.json.get(ct.get_analyzer_endpoint_engine_key()),
+                                                start, budget)
+    threshold = request.json.get(ct.get_analyzer_endpoint_threshold_key())
+    labels = request.json.get(ct.get_analyzer_endpoint_labels_key())
+    extracted_sentiment = ex.get_label(polarities['compound'], threshold, labels)
+    if request.json.get(ct.get_analyzer_endpoint_scores_key(), False):
+        return get_degradable_response({ct.get_response_sentiment_key(): extracted_sentiment,
+                                        ct.get_response_scores_key(): polarities}, is_degraded)
+    return get_degradable_response(extracted_sentiment, is_degraded)
+
+
+def is_invalid_deadline_header(header_value: Optional[str]) -> bool:
+    """
+    Return whether the provided deadline header value of a request is not a positive number of milliseconds.
+    :param header_value: value of the deadline header, None if it is missing
+    :return: True if the deadline header is invalid, else False
+    """
+    try:
+        dl.get_budget(header_value)
+    except ValueError:
+        return True
+    return False
+
+
+def get_degradable_response(data, is_degraded: bool) -> Response:
+    """
+    Return a 200 OK Flask Response containing the provided data, marked as degraded when its polarities
+    were approximated to meet the deadline of the request : a degraded object gets a true "degraded" component
+    and every degraded response gets the degraded header.
+    :param data: JSON serializable response content
+    :param is_degraded: whether the polarities of the response were approximated
+    :return: the built Flask Response object
+    """
+    if is_degraded and isinstance(data, dict):
+        data = {**data, ct.get_response_degraded_key(): True}
+    response = make_response(jsonify(data))
+    if is_degraded:
+        response.headers[ct.get_degraded_header()] = 'true'
+    return response
 
 
 def get_400_response_from_input(request_json: dict[str, str]) -> Response:
@@ -27,16 +83,15 @@ def get_400_response_from_input(request_json: dict[str, str]) -> Response:
     :return: the built Flask Response object with status code 400
     """
     response_content = get_response_400_data_by_reason(request_json)
-    response = make_response(jsonify(response_content))
-    response.status_code = 400
-    return response
+    return get_400_response(response_content)
 
 
 def is_invalid_request_json(request_json: dict[str, str]) -> bool:
     """
     Return whether the provided json input is None
     or has no "input" key
-    or has an "input" value that has a length that is superior to the max accepted length.
+    or has an "input" value that has a length that is superior to the max accepted length
+    or has an invalid "scores", "threshold" or "labels" option.
     :param request_json: the user input provided from the JSON request object
     :return: True if the input is invalid, else False
     """
@@ -44,7 +99,8 @@ def is_invalid_request_json(request_json: dict[str, str]) -> bool:
     return request_json is None \
            or input_key not in request_json \
            or request_json[input_key] is None \
-           or len(request_json[input_key]) > ct.get_max_input_length()
+           or len(request_json[input_key]) > ct.get_max_input_length() \
+           or get_options_error_message(request_json) is not None
 
 
 def get_response_400_data_by_reason(request_json: dict[str, str]) -> dict[str, str]:
@@ -61,6 +117,334 @@ def get_response_400_data_by_reason(request_json: dict[str, str]) -> dict[str, s
         error_message = ct.get_missing_input_key_message()
     elif request_json[input_key] is None:
         error_message = ct.get_none_input_key_message()
-    else:
+    elif len(request_json[input_key]) > ct.get_max_input_length():
         error_message = ct.get_too_big_input_length_message()
-    return {ct.get_response_message_key(): error_message}
\ No newline at end of file
+    else:
+        error_message = get_options_error_message(request_json)
+    return {ct.get_response_message_key(): error_message}
+
+
+def get_options_error_message(request_json: dict) -> Optional[str]:
+    """
+    Return the reason why the optional "scores", "threshold", "labels" or "engine" component of the request JSON
+    is invalid, or None if they are all missing or valid.
+    :param request_json: The input request JSON
+    :return: the relevant error message, or None
+    """
+    scores = request_json.get(ct.get_analyzer_endpoint_scores_key(), False)
+    if not isinstance(scores, bool):
+        return ct.get_not_boolean_scores_flag_message()
+    threshold = request_json.get(ct.get_analyzer_endpoint_threshold_key())
+    if threshold is not None and (isinstance(threshold, bool) or not isinstance(threshold, (int, float))
+                                  or not 0 < threshold <= 1):
+        return ct.get_invalid_threshold_message()
+    labels = request_json.get(ct.get_analyzer_endpoint_labels_key())
+    label_keys = {ct.get_positivity_label_key(), ct.get_neutrality_label_key(), ct.get_negativity_label_key()}
+    if labels is not None and (not isinstance(labels, dict) or not set(labels) <= label_keys
+                               or not all(isinstance(label, str) for label in labels.values())):
+        return ct.get_invalid_labels_message()
+    if not is_valid_engine_name(request_json.get(ct.get_analyzer_endpoint_engine_key())):
+        return ct.get_unknown_engine_message()
+    return None
+
+
+def is_valid_engine_name(engine_name) -> bool:
+    """
+    Return whether the provided optional "engine" component of a request JSON is missing
+    or the name of a registered scoring engine.
+    :param engine_name: the "engine" component value, None if it is missing
+    :return: True if the engine name is valid, else False
+    """
+    return engine_name is None or (isinstance(engine_name, str) and engine_name in es.get_engine_names())
+
+
+@app_analyzer.route(f'/{ct.get_analyzer_batch_endpoint_url_suffix()}', methods=['POST'])
+def analyze_batch() -> Response:
+    """
+    Return a 200 OK Flask Response containing, for each text of the request JSON "inputs" array
+    and in the same order, either its extracted sentiment or the reason why it is invalid.
+    Identical texts are scored only once, and all the texts are scored in one batch,
+    by the scoring engine of the optional "engine" component.
+    Return a 400 Bad Request if the request itself is invalid.
+    :return: the list of extracted sentiments or input error messages
+    """
+    max_payload_size = ct.get_max_batch_payload_size()
+    body = None if is_too_big_batch_request(request.content_length) else read_request_body(max_payload_size)
+    if body is None:
+        return get_400_response({ct.get_response_message_key(): ct.get_too_big_batch_payload_message()})
+    request_json = parse_request_json(body)
+    if is_invalid_batch_request_json(request_json):
+        return get_400_response(get_batch_response_400_data_by_reason(request_json))
+    user_inputs = request_json[ct.get_analyzer_batch_endpoint_key()]
+    engine_name = request_json.get(ct.get_analyzer_endpoint_engine_key())
+    return make_response(jsonify(get_batch_results(user_inputs, engine_name)))
+
+
+@app_analyzer.route(f'/{ct.get_analyzer_document_endpoint_url_suffix()}', methods=['POST'])
+def analyze_document() -> Response:
+    """
+    Return a 200 OK Flask Response containing the sentiment and polarity scores of the request JSON "input"
+    document, averaged over its sentences weighted by their length, along with the sentiment and
+    polarity scores of each sentence. Sentences are scored in parallel across worker processes.
+    The optional "threshold" and "labels" components are applied to the document and to every sentence.
+    When the full scoring would end after the deadline of the request, the polarities of the sentences
+    are approximated and the response is marked as degraded.
+    Return a 400 Bad Request if the request is invalid.
+    :return: the document sentiment, polarity scores and sentence results
+    """
+    start = time.perf_counter()
+    request_json = request.get_json(silent=True)
+    response_400_data = get_document_response_400_data_by_reason(request_json)
+    if response_400_data is not None:
+        return get_400_response(response_400_data)
+    deadline_header = request.headers.get(ct.get_deadline_header())
+    if is_invalid_deadline_header(deadline_header):
+        return get_400_response({ct.get_response_message_key(): ct.get_invalid_deadline_message()})
+    document = request_json[ct.get_analyzer_endpoint_key()]
+    is_degraded = dl.check_deadline(len(document), start, dl.get_budget(deadline_header))
+    threshold = request_json.get(ct.get_analyzer_endpoint_threshold_key())
+    labels = request_json.get(ct.get_analyzer_endpoint_labels_key())
+    document_polarities, sentences = ds.get_document_polarities(document,
+                                                                request_json.get(ct.get_analyzer_endpoint_engine_key()),
+                                                                is_degraded)
+    return get_degradable_response({
+        ct.get_response_sentiment_key(): ex.get_label(document_polarities['compound'], threshold, labels),
+        ct.get_response_scores_key(): document_polarities,
+        ct.get_response_sentences_key(): [{
+            ct.get_response_sentence_key(): sentence,
+            ct.get_response_sentiment_key(): ex.get_label(polarities['compound'], threshold, labels),
+            ct.get_response_scores_key(): polarities
+        } for sentence, polarities in sentences]
+    }, is_degraded)
+
+
+@app_analyzer.route(f'/{ct.get_analyzer_stream_endpoint_url_suffix()}', methods=['POST'])
+def analyze_stream() -> Response:
+    """
+    Return a 200 OK Flask Response streaming one newline-delimited JSON result per
+    newline-delimited JSON request line of the form {"input": "..."}, in the same order.
+    The request body is read incrementally and scored in bounded chunks, and the next chunk
+    is only read once the previous results have been written to the client.
+    :return: the streamed extracted sentiments or line error messages
+    """
+    lines = read_lines(request.stream, get_max_stream_line_size())
+    results = generate_stream_results(lines, ct.get_stream_chunk_size())
+    return Response(stream_with_context(results), mimetype=ct.get_ndjson_content_type())
+
+
+def get_batch_results(user_inputs: list, engine_name: Optional[str] = None) -> list[dict[str, str]]:
+    """
+    Return, for each provided input and in the same order, either its extracted sentiment
+    or the reason why it is invalid. Identical texts are scored only once, all in one batch.
+    :param user_inputs: the inputs of a batch
+    :param engine_name: name of the scoring engine, defaults to the configured one
+    :return: the list of sentiment or error message dictionaries
+    """
+    error_messages = [get_batch_input_error_message(user_input) for user_input in user_inputs]
+    valid_inputs = [user_input for user_input, error in zip(user_inputs, error_messages) if error is None]
+    unique_inputs = list(dict.fromkeys(valid_inputs))
+    sentiments = dict(zip(unique_inputs, ex.get_sentiments(unique_inputs, engine_name)))
+    return [{ct.get_response_message_key(): error} if error is not None
+            else {ct.get_response_sentiment_key(): sentiments[user_input]}
+            for user_input, error in zip(user_inputs, error_messages)]
+
+
+def get_400_response(response_content: dict[str, str]) -> Response:
+    """
+    Return a 400 Bad Request response with the provided content
+    :param response_content: the response data object
+    :return: the built Flask Response object with status code 400
+    """
+    response = make_response(jsonify(response_content))
+    response.status_code = 400
+    return response
+
+
+def read_request_body(max_payload_size: int) -> Optional[bytes]:
+    """
+    Return the body of the current request, or None if it is bigger than the provided size.
+    The body is read up to one byte past the size, so that bodies without a Content-Length header,
+    such as chunked ones, are bounded by the bytes actually read.
+    :param max_payload_size: max accepted body size in bytes
+    :return: the body bytes, or None if the body is too big
+    """
+    chunks = []
+    body_size = 0
+    while body_size <= max_payload_size:
+        chunk = request.stream.read(max_payload_size + 1 - body_size)
+        if not chunk:
+            return b''.join(chunks)
+        chunks.append(chunk)
+        body_size += len(chunk)
+    return None
+
+
+def parse_request_json(body: bytes):
+    """
+    Return the JSON of a request body read with read_request_body, or None if the request
+    does not have a JSON content type or its body is not valid JSON, like request.get_json(silent=True).
+    :param body: the request body bytes
+    :return: the parsed request JSON, or None
+    """
+    if not request.is_json:
+        return None
+    try:
+        return json.loads(body)
+    except ValueError:
+        return None
+
+
+def is_too_big_batch_request(content_length: Optional[int]) -> bool:
+    """
+    Return whether the provided request body size is superior to the max accepted batch payload size.
+    :param content_length: the request body size in bytes, None if unknown
+    :return: True if the request body is too big, else False
+    """
+    return content_length is not None and content_length > ct.get_max_batch_payload_size()
+
+
+def is_invalid_batch_request_json(request_json: dict[str, list]) -> bool:
+    """
+    Return whether the provided batch json input is None
+    or has no "inputs" key
+    or has an "inputs" value that is not an array
+    or has more inputs than the max accepted number of inputs.
+    :param request_json: the user inputs provided from the JSON request object
+    :return: True if the request is invalid, else False
+    """
+    return get_batch_response_400_data_by_reason(request_json) is not None
+
+
+def get_batch_response_400_data_by_reason(request_json: dict[str, list]) -> Optional[dict[str, str]]:
+    """
+    Return the batch 400 Bad Request response data object with a different message
+    for each issue, or None if the request is valid.
+    :param request_json: The input request JSON
+    :return: the dictionary containing the relevant error message, or None
+    """
+    batch_input_key = ct.get_analyzer_batch_endpoint_key()
+    if not isinstance(request_json, dict):
+        error_message = ct.get_none_json_request_body_message()
+    elif batch_input_key not in request_json:
+        error_message = ct.get_missing_batch_input_key_message()
+    elif not isinstance(request_json[batch_input_key], list):
+        error_message = ct.get_not_array_batch_input_message()
+    elif len(request_json[batch_input_key]) > ct.get_max_batch_items():
+        error_message = ct.get_too_many_batch_inputs_message()
+    elif not is_valid_engine_name(request_json.get(ct.get_analyzer_endpoint_engine_key())):
+        error_message = ct.get_unknown_engine_message()
+    else:
+        return None
+    return {ct.get_response_message_key(): error_message}
+
+
+def get_document_response_400_data_by_reason(request_json: dict) -> Optional[dict[str, str]]:
+    """
+    Return the document 400 Bad Request response data object with a different message
+    for each issue, or None if the request is valid.
+    :param request_json: The input request JSON
+    :return: the dictionary containing the relevant error message, or None
+    """
+    input_key = ct.get_analyzer_endpoint_key()
+    if not isinstance(request_json, dict):
+        error_message = ct.get_none_json_request_body_message()
+    elif input_key not in request_json:
+        error_message = ct.get_missing_input_key_message()
+    elif request_json[input_key] is None:
+        error_message = ct.get_none_input_key_message()
+    elif not isinstance(request_json[input_key], str):
+        error_message = ct.get_not_text_input_message()
+    elif len(request_json[input_key]) > ct.get_max_document_length():
+        error_message = ct.get_too_big_document_length_message()
+    else:
+        error_message = get_options_error_message(request_json)
+    if error_message is None:
+        return None
+    return {ct.get_response_message_key(): error_message}
+
+
+def get_batch_input_error_message(user_input) -> Optional[str]:
+    """
+    Return the reason why the provided input of a batch is invalid, or None if it is valid.
+    :param user_input: one of the batch JSON "inputs" values
+    :return: the relevant error message, or None
+    """
+    if user_input is None:
+        return ct.get_none_batch_input_message()
+    if not isinstance(user_input, str):
+        return ct.get_not_text_input_message()
+    if len(user_input) > ct.get_max_input_length():
+        return ct.get_too_big_input_length_message()
+    return None
+
+
+def generate_stream_results(lines: Iterable[bytes], chunk_size: int) -> Iterator[str]:
+    """
+    Lazily yield the newline-delimited JSON results of the provided request lines, chunk by chunk.
+    At most one chunk of lines is held in memory, and the next lines are only consumed
+    when the results of the previous chunk have been consumed.
+    :param lines: the non empty newline-delimited JSON request lines
+    :param chunk_size: the number of lines scored at once
+    :return: an iterator over the newline-delimited JSON results of each chunk
+    """
+    lines = iter(lines)
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return
+        user_inputs = [get_stream_line_input(line) for line in chunk]
+        results = get_batch_results([user_input for user_input, _ in user_inputs])
+        for index, (_, error) in enumerate(user_inputs):
+            if error is not None:
+                results[index] = {ct.get_response_message_key(): error}
+        yield ''.join(json.dumps(result) + '\n' for result in results)
+
+
+def get_stream_line_input(line: bytes) -> tuple:
+    """
+    Return the "input" value of the provided newline-delimited JSON request line
+    and the reason why the line is invalid, if it is.
+    :param line: a newline-delimited JSON request line
+    :return: the (input, error message) tuple, with a None error message for valid lines
+    """
+    try:
+        line_json = json.loads(line)
+    except ValueError:
+        return None, ct.get_invalid_json_line_message()
+    if not isinstance(line_json, dict):
+        return None, ct.get_invalid_json_line_message()
+    if ct.get_analyzer_endpoint_key() not in line_json:
+        return None, ct.get_missing_input_key_message()
+    return line_json[ct.get_analyzer_endpoint_key()], None
+
+
+def read_lines(stream, max_line_size: int) -> Iterator[bytes]:
+    """
+    Lazily yield the non empty lines of the provided binary stream.
+    Lines longer than the provided size are truncated, which makes them invalid JSON lines,
+    and the rest of them is skipped so that no line is ever fully held in memory.
+    :param stream: the binary request body stream
+    :param max_line_size: the max number of bytes read per line
+    :return: an iterator over the stripped lines
+    """
+    while True:
+        line = stream.readline(max_line_size)
+        if not line:
+            return
+        if len(line) == max_line_size and not line.endswith(b'\n'):
+            while True:
+                rest = stream.readline(max_line_size)
+                if not rest or rest.endswith(b'\n'):
+                    break
+        line = line.strip()
+        if line:
+            yield line
+
+
+def get_max_stream_line_size() -> int:
+    """
+    Return the max number of bytes read from a streamed request line : the max input length
+    of 4 bytes UTF-8 characters, JSON escaped, and room for the rest of the JSON object.
+    :return: the max streamed line size in bytes
+    """
+    return ct.get_max_input_length() * 12 + 1024
\ No newline at end of file
@@ -17,7 +17,13 @@ def index() -> str:
     url_prefix = ct.get_analyzer_endpoint_url_prefix()
     application_content_type = ct.get_application_content_type()
     input_key = ct.get_analyzer_endpoint_key()
+    live_url_prefix = ct.get_live_endpoint_url_prefix()
     return render_template('index.html',
                            analyzerEndpointUrl=f'http://{host}:{port}/{url_prefix}',
                            applicationContentType=application_content_type,
-                           inputKey=input_key)
\ No newline at end of file
+                           inputKey=input_key,
+                           liveEndpointUrl=f'http://{host}:{port}/{live_url_prefix}',
+                           liveEventsUrlSuffix=ct.get_live_events_endpoint_url_suffix(),
+                           liveUpdateInterval=int(ct.get_live_update_interval() * 1000),
+                           sessionIdKey=ct.get_response_session_id_key(),
+                           sentimentKey=ct.get_response_sentiment_key())
\ No newline at end of file
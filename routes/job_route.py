@@ -0,0 +1,137 @@
+from collections.abc import Mapping
+from typing import Optional
+
+from flask import Blueprint, request, make_response, jsonify, Response
+
+from routes import analyzer_route as ar
+from services import constants_service as ct
+from services import job_service as js
+
+# Create the jobs route
+app_jobs = Blueprint('jobs', __name__)
+
+
+@app_jobs.route('', methods=['POST'])
+def submit_job() -> Response:
+    """
+    Return a 202 Accepted Flask Response containing the id of a new job scoring every text
+    of the request JSON "inputs" array in the background, and the job status url in its Location header.
+    Return a 400 Bad Request if the request is invalid.
+    :return: the job id and status
+    """
+    content_length = request.content_length
+    max_payload_size = ct.get_max_job_payload_size()
+    is_too_big = content_length is not None and content_length > max_payload_size
+    body = None if is_too_big else ar.read_request_body(max_payload_size)
+    if body is None:
+        return ar.get_400_response({ct.get_response_message_key(): ct.get_too_big_job_payload_message()})
+    request_json = ar.parse_request_json(body)
+    response_400_data = get_job_response_400_data_by_reason(request_json)
+    if response_400_data is not None:
+        return ar.get_400_response(response_400_data)
+    user_inputs = request_json[ct.get_analyzer_batch_endpoint_key()]
+    error_messages = [ar.get_batch_input_error_message(user_input) for user_input in user_inputs]
+    job_id = js.submit_job(user_inputs, error_messages)
+    response = make_response(jsonify(get_job_data(job_id, js.get_job(job_id))))
+    response.status_code = 202
+    response.headers['Location'] = f'/{ct.get_jobs_endpoint_url_prefix()}/{job_id}'
+    return response
+
+
+@app_jobs.route('/<job_id>', methods=['GET'])
+def get_job(job_id: str) -> Response:
+    """
+    Return a 200 OK Flask Response containing the status of the provided job and the number of inputs
+    already scored, or a 404 Not Found if the job does not exist.
+    :param job_id: the id of a job
+    :return: the job id, status and progress
+    """
+    job = js.get_job(job_id)
+    if job is None:
+        return get_404_response()
+    return make_response(jsonify(get_job_data(job_id, job)))
+
+
+@app_jobs.route(f'/<job_id>/{ct.get_jobs_results_endpoint_url_suffix()}', methods=['GET'])
+def get_job_results(job_id: str) -> Response:
+    """
+    Return a 200 OK Flask Response containing a page of the results already computed for the provided job,
+    starting at the "offset" query parameter and holding at most "limit" results,
+    along with the offset of the next page, null once every result was returned for a finished job.
+    Return a 404 Not Found if the job does not exist and a 400 Bad Request if the page is invalid.
+    :param job_id: the id of a job
+    :return: the page of sentiments or input error messages
+    """
+    job = js.get_job(job_id)
+    if job is None:
+        return get_404_response()
+    page = get_results_page(request.args)
+    if page is None:
+        return ar.get_400_response({ct.get_response_message_key(): ct.get_invalid_results_page_message()})
+    offset, limit = page
+    results = js.get_job_results(job_id, offset, limit)
+    next_offset = offset + len(results)
+    is_finished = job['status'] in [js.DONE, js.FAILED] and next_offset >= job['done']
+    return make_response(jsonify({
+        ct.get_response_job_id_key(): job_id,
+        ct.get_response_results_key(): results,
+        ct.get_response_next_offset_key(): None if is_finished else next_offset
+    }))
+
+
+def get_results_page(query_parameters: Mapping[str, str]) -> Optional[tuple[int, int]]:
+    """
+    Return the offset and the limit of the requested results page from the "offset" and "limit" query parameters,
+    defaulting to the first page of the max size.
+    :param query_parameters: the query parameters of the request
+    :return: the (offset, limit) tuple, or None if a parameter is not an integer or is out of range
+    """
+    try:
+        offset = int(query_parameters.get(ct.get_results_offset_parameter(), 0))
+        limit = int(query_parameters.get(ct.get_results_limit_parameter(), ct.get_max_job_results_page_size()))
+    except ValueError:
+        return None
+    if offset < 0 or not 0 < limit <= ct.get_max_job_results_page_size():
+        return None
+    return offset, limit
+
+
+def get_job_data(job_id: str, job: dict) -> dict:
+    """
+    Return the response data object of the provided job.
+    :param job_id: the id of the job
+    :param job: the job fields returned by the job service
+    :return: the dictionary of the job id, status, number of inputs, number of scored inputs and error
+    """
+    return {ct.get_response_job_id_key(): job_id, **job}
+
+
+def get_job_response_400_data_by_reason(request_json: dict) -> Optional[dict[str, str]]:
+    """
+    Return the job 400 Bad Request response data object with a different message
+    for each issue, or None if the request is valid.
+    :param request_json: The input request JSON
+    :return: the dictionary containing the relevant error message, or None
+    """
+    batch_input_key = ct.get_analyzer_batch_endpoint_key()
+    if not isinstance(request_json, dict):
+        error_message = ct.get_none_json_request_body_message()
+    elif batch_input_key not in request_json:
+        error_message = ct.get_missing_batch_input_key_message()
+    elif not isinstance(request_json[batch_input_key], list):
+        error_message = ct.get_not_array_batch_input_message()
+    elif len(request_json[batch_input_key]) > ct.get_max_job_items():
+        error_message = ct.get_too_many_job_inputs_message()
+    else:
+        return None
+    return {ct.get_response_message_key(): error_message}
+
+
+def get_404_response() -> Response:
+    """
+    Return a 404 Not Found response with the unknown job message
+    :return: the built Flask Response object with status code 404
+    """
+    response = make_response(jsonify({ct.get_response_message_key(): ct.get_unknown_job_message()}))
+    response.status_code = 404
+    return response
@@ -0,0 +1,59 @@
+import hmac
+from typing import Optional
+
+from flask import Blueprint, make_response, jsonify, request, Response
+
+from services import analyzer_service as an
+from services import constants_service as ct
+
+# Create the lexicon route
+app_lexicon = Blueprint('lexicon', __name__)
+
+
+@app_lexicon.route('', methods=['GET'])
+def get_lexicon() -> Response:
+    """
+    Return a 200 OK Flask Response containing the version of the lexicon and its number of overlaid tokens.
+    :return: the lexicon version and overlay size
+    """
+    return make_response(jsonify(an.get_lexicon_stats()))
+
+
+@app_lexicon.route(f'/{ct.get_lexicon_reload_endpoint_url_suffix()}', methods=['POST'])
+def reload_lexicon() -> Response:
+    """
+    Return a 200 OK Flask Response containing the version of the lexicon and its number of overlaid tokens
+    after reloading the lexicon overlay files. Requests being scored finish with the previous lexicon,
+    and cached polarities of texts whose tokens changed valence are scored again.
+    Concurrent reload requests share a single rebuild.
+    Return a 403 Forbidden if no reload token is configured or the request does not provide it,
+    a 400 Bad Request if an overlay file is invalid or a 500 Internal Server Error if it can not be read,
+    the previous lexicon being kept.
+    :return: the lexicon version and overlay size
+    """
+    if not is_authorized_reload(request.headers.get(ct.get_lexicon_reload_token_header())):
+        response = make_response(jsonify({ct.get_response_message_key(): ct.get_forbidden_lexicon_reload_message()}))
+        response.status_code = 403
+        return response
+    try:
+        an.reload()
+    except (OSError, ValueError) as error:
+        response = make_response(jsonify({
+            ct.get_response_message_key(): f'{ct.get_invalid_lexicon_overlays_message()} : {error}'
+        }))
+        response.status_code = 500 if isinstance(error, OSError) else 400
+        return response
+    return make_response(jsonify(an.get_lexicon_stats()))
+
+
+def is_authorized_reload(reload_token: Optional[str]) -> bool:
+    """
+    Return whether a lexicon reload request provided the configured reload token,
+    no request being authorized when no token is configured.
+    :param reload_token: value of the reload token header of the request, None if it is missing
+    :return: True if the lexicon can be reloaded, else False
+    """
+    configured_token = ct.get_lexicon_reload_token()
+    if not configured_token or reload_token is None:
+        return False
+    return hmac.compare_digest(reload_token.encode('utf-8'), configured_token.encode('utf-8'))
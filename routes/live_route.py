@@ -0,0 +1,148 @@
+import json
+import time
+from typing import Iterator, Optional
+
+from flask import Blueprint, request, make_response, jsonify, Response, stream_with_context
+
+from routes import analyzer_route as ar
+from services import constants_service as ct
+from services import extractor_service as ex
+from services import live_service as ls
+
+# Create the live analysis route
+app_live = Blueprint('live', __name__)
+
+
+@app_live.route('', methods=['POST'])
+def create_session() -> Response:
+    """
+    Return a 201 Created Flask Response containing the id of a new live session, whose text is updated
+    with POST requests and whose sentiment is pushed on its event stream.
+    Return a 503 Service Unavailable if the max number of live sessions is reached.
+    :return: the live session id
+    """
+    session_id = ls.create_session()
+    if session_id is None:
+        response = make_response(jsonify({ct.get_response_message_key(): ct.get_too_many_live_sessions_message()}))
+        response.status_code = 503
+        return response
+    response = make_response(jsonify({ct.get_response_session_id_key(): session_id}))
+    response.status_code = 201
+    return response
+
+
+@app_live.route('/<session_id>', methods=['POST'])
+def update_session(session_id: str) -> Response:
+    """
+    Return a 202 Accepted Flask Response after replacing the text of the provided live session
+    with the request JSON "input" component. The text is scored once it stops changing.
+    Return a 404 Not Found if the session does not exist and a 400 Bad Request if the request is invalid.
+    :param session_id: the id of a live session
+    :return: an empty JSON object
+    """
+    session = ls.get_session(session_id)
+    if session is None:
+        return get_404_response()
+    request_json = request.get_json(silent=True)
+    response_400_data = get_live_response_400_data_by_reason(request_json)
+    if response_400_data is not None:
+        return ar.get_400_response(response_400_data)
+    session.update(request_json[ct.get_analyzer_endpoint_key()])
+    response = make_response(jsonify({}))
+    response.status_code = 202
+    return response
+
+
+@app_live.route(f'/<session_id>/{ct.get_live_events_endpoint_url_suffix()}', methods=['GET'])
+def stream_session_events(session_id: str) -> Response:
+    """
+    Return a 200 OK Flask Response streaming, as Server-Sent Events, the sentiment and polarity scores
+    of the provided live session text and of each of its sentences every time the text stops changing.
+    Return a 404 Not Found if the session does not exist.
+    :param session_id: the id of a live session
+    :return: the stream of live analysis events
+    """
+    if ls.get_session(session_id) is None:
+        return get_404_response()
+    response = Response(stream_with_context(generate_live_events(session_id)),
+                        mimetype=ct.get_event_stream_content_type())
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+
+def generate_live_events(session_id: str) -> Iterator[str]:
+    """
+    Lazily yield one event per debounced text of the provided live session, and a comment line
+    when the text did not change for a while so that proxies keep the connection open.
+    Stops once the session expired, its text not being updated for too long, or once the stream
+    lasted for the configured max duration, the client reconnecting to a live session.
+    :param session_id: the id of a live session
+    :return: an iterator over the Server-Sent Events messages
+    """
+    session = ls.get_session(session_id)
+    stream_end = time.monotonic() + ct.get_live_stream_max_duration()
+    while session is not None and ls.get_session(session_id) is session:
+        remaining = stream_end - time.monotonic()
+        if remaining <= 0:
+            break
+        text = session.wait_for_text(ct.get_live_debounce_delay(), min(ct.get_live_keep_alive_interval(), remaining))
+        if text is None:
+            yield ': keep-alive\n\n'
+            continue
+        polarities, sentences, rescored_count = session.score(text)
+        yield f'data: {json.dumps(get_live_event_data(polarities, sentences, rescored_count))}\n\n'
+
+
+def get_live_event_data(polarities: dict[str, float], sentences: list[tuple[str, dict[str, float]]],
+                        rescored_count: int) -> dict:
+    """
+    Return the data object of a live analysis event.
+    :param polarities: the polarities of the whole text
+    :param sentences: the (sentence, sentence polarities) tuples of the text
+    :param rescored_count: number of sentences scored for this event
+    :return: the dictionary of the text sentiment and scores, the sentence results and the number of scored sentences
+    """
+    return {
+        ct.get_response_sentiment_key(): ex.get_label(polarities['compound']),
+        ct.get_response_scores_key(): polarities,
+        ct.get_response_sentences_key(): [{
+            ct.get_response_sentence_key(): sentence,
+            ct.get_response_sentiment_key(): ex.get_label(sentence_polarities['compound']),
+            ct.get_response_scores_key(): sentence_polarities
+        } for sentence, sentence_polarities in sentences],
+        ct.get_response_rescored_key(): rescored_count
+    }
+
+
+def get_live_response_400_data_by_reason(request_json: dict) -> Optional[dict[str, str]]:
+    """
+    Return the live update 400 Bad Request response data object with a different message
+    for each issue, or None if the request is valid.
+    :param request_json: The input request JSON
+    :return: the dictionary containing the relevant error message, or None
+    """
+    input_key = ct.get_analyzer_endpoint_key()
+    if not isinstance(request_json, dict):
+        error_message = ct.get_none_json_request_body_message()
+    elif input_key not in request_json:
+        error_message = ct.get_missing_input_key_message()
+    elif request_json[input_key] is None:
+        error_message = ct.get_none_input_key_message()
+    elif not isinstance(request_json[input_key], str):
+        error_message = ct.get_not_text_input_message()
+    elif len(request_json[input_key]) > ct.get_max_document_length():
+        error_message = ct.get_too_big_document_length_message()
+    else:
+        return None
+    return {ct.get_response_message_key(): error_message}
+
+
+def get_404_response() -> Response:
+    """
+    Return a 404 Not Found response with the unknown live session message
+    :return: the built Flask Response object with status code 404
+    """
+    response = make_response(jsonify({ct.get_response_message_key(): ct.get_unknown_live_session_message()}))
+    response.status_code = 404
+    return response
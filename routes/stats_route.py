@@ -0,0 +1,30 @@
+from flask import Blueprint, make_response, jsonify, Response
+from services import analyzer_service as an
+from services import cache_service as cs
+from services import constants_service as ct
+from services import deadline_service as dl
+from services import engine_service as es
+from services import pool_service as ps
+
+# Create the statistics route
+app_stats = Blueprint('stats', __name__)
+
+
+@app_stats.route('', methods=['GET'])
+def stats() -> Response:
+    """
+    Return a 200 OK Flask Response containing the sentiment analysis statistics of the process,
+    such as the result cache hit, miss and eviction counters, the token memo size,
+    the number of precomputed single token answers, the process pool restarts, the lexicon version,
+    the number of texts the cascade engine escalated to VADER and the number of degraded analyzer responses.
+    :return: the statistics of each subsystem
+    """
+    return make_response(jsonify({
+        ct.get_result_cache_stats_key(): cs.get_result_cache().get_stats(),
+        ct.get_token_memo_stats_key(): an.get_analyzer().get_memo_stats(),
+        ct.get_answer_table_stats_key(): an.get_analyzer().get_answer_stats(),
+        ct.get_pool_stats_key(): ps.get_stats(),
+        ct.get_lexicon_stats_key(): an.get_lexicon_stats(),
+        ct.get_cascade_stats_key(): es.get_engine(es.CascadeEngine.name).get_stats(),
+        ct.get_deadline_stats_key(): dl.get_stats()
+    }))
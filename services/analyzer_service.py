@@ -0,0 +1,155 @@
+import threading
+from collections.abc import Mapping
+from typing import Optional
+
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from services import constants_service as ct
+from services import mapped_lexicon_service as ml
+from services import overlay_service as ov
+from services import scorer_service as sc
+from services import snapshot_service as ss
+
+# Process-wide analyzer shared by every request
+__analyzer: Optional[SentimentIntensityAnalyzer] = None
+
+# Guards the build and the swap of the shared analyzer
+__lock = threading.Lock()
+
+# (lexicon version, tokens whose valence changed in that version) tuples, one per reload changing the overlays
+__lexicon_changes: list[tuple[int, frozenset[str]]] = []
+
+# Number of started reloads, and number of the last successful one when it started
+__reload_count = 0
+__last_reload_number = 0
+
+# Serializes the reloads so that concurrent ones share a single rebuild
+__reload_lock = threading.Lock()
+
+
+def get_analyzer() -> SentimentIntensityAnalyzer:
+    """
+    Return the process-wide sentiment analyzer, building it on first use.
+    The lexicon and emoji files are parsed only once per process.
+    :return: the shared SentimentIntensityAnalyzer instance
+    """
+    analyzer = __analyzer
+    if analyzer is None:
+        analyzer = warm_up()
+    return analyzer
+
+
+def warm_up(overlays: Optional[dict[str, float]] = None) -> SentimentIntensityAnalyzer:
+    """
+    Build the shared sentiment analyzer if it does not exist yet.
+    Meant to be called once when the application starts so that the first request
+    does not pay for the lexicon parsing.
+    :param overlays: lexicon overlays to use instead of the configured overlay files,
+    given to the worker processes so that they score with the lexicon of the application process
+    :return: the shared SentimentIntensityAnalyzer instance
+    """
+    global __analyzer
+    with __lock:
+        if __analyzer is None or (overlays is not None and __analyzer.overlays != overlays):
+            __analyzer = __build_analyzer(ov.load_overlays() if overlays is None else overlays)
+        return __analyzer
+
+
+def reload() -> SentimentIntensityAnalyzer:
+    """
+    Build a new sentiment analyzer with the current content of the lexicon overlay files
+    and atomically swap it with the shared one. Requests already holding the previous analyzer finish with it.
+    When the overlays changed, the new analyzer gets the next lexicon version.
+    Reloads are coalesced : a caller waiting for a reload to finish returns the analyzer of a reload started
+    after its call, which read the overlay files it asked for, instead of rebuilding it again.
+    Raises an OSError or a ValueError, the shared analyzer being kept, if an overlay file can not be read.
+    :return: the new shared SentimentIntensityAnalyzer instance
+    """
+    global __analyzer, __reload_count, __last_reload_number
+    call_reload_count = __reload_count
+    with __reload_lock:
+        if __last_reload_number > call_reload_count:
+            return get_analyzer()
+        __reload_count += 1
+        reload_number = __reload_count
+        analyzer = __build_analyzer(ov.load_overlays())
+        with __lock:
+            previous_analyzer = __analyzer
+            if previous_analyzer is not None:
+                changed_tokens = ov.get_changed_tokens(previous_analyzer.overlays, analyzer.overlays)
+                analyzer.lexicon_version = previous_analyzer.lexicon_version + bool(changed_tokens)
+                if changed_tokens:
+                    __lexicon_changes.append((analyzer.lexicon_version, changed_tokens))
+            __analyzer = analyzer
+        __last_reload_number = reload_number
+    return analyzer
+
+
+def get_lexicon_stats() -> dict[str, int]:
+    """
+    Return the version of the lexicon of the shared analyzer and its number of overlaid tokens.
+    :return: the dictionary of lexicon statistics
+    """
+    analyzer = get_analyzer()
+    return {ct.get_response_lexicon_version_key(): analyzer.lexicon_version,
+            ct.get_response_overlay_tokens_key(): len(analyzer.overlays)}
+
+
+def is_unchanged_since(text: str, lexicon_version: int) -> bool:
+    """
+    Return whether the polarities of the provided text scored with the provided lexicon version
+    are still the ones of the current lexicon : none of the tokens whose valence changed since then,
+    emoji descriptions included, is a token of the text.
+    :param text: input text
+    :param lexicon_version: version of the lexicon the text was scored with
+    :return: True if the text polarities did not change, else False
+    """
+    changed_tokens = set()
+    for version, tokens in __lexicon_changes:
+        if version > lexicon_version:
+            changed_tokens.update(tokens)
+    if not changed_tokens:
+        return True
+    analyzer = get_analyzer()
+    return changed_tokens.isdisjoint(analyzer.tokenize(analyzer.emoji_replacer.replace(text)).lowers)
+
+
+def __build_analyzer(overlays: dict[str, float]) -> SentimentIntensityAnalyzer:
+    """
+    Return a newly built sentiment analyzer with its lexicon loaded,
+    from the binary lexicon snapshot when it is usable, else from the VADER text files.
+    With the "mapped" lexicon backend, valences are read from the shared memory-mapped lexicon
+    and the lexicon dictionary is only loaded to write the mapped lexicon file when it is missing or stale.
+    The provided overlays are applied on top of the lexicon, and the returned analyzer
+    memoizes the per-token work of its own lexicon.
+    :param overlays: token to valence overrides of the lexicon
+    :return: a new MemoizedAnalyzer instance
+    """
+    use_mapped_lexicon = ct.get_lexicon_backend() == 'mapped'
+    mapped_lexicon = ml.open_mapped_lexicon() if use_mapped_lexicon else None
+    analyzer = ss.load_analyzer(lexicon=mapped_lexicon)
+    if analyzer is None:
+        analyzer = SentimentIntensityAnalyzer()
+        if mapped_lexicon is not None:
+            analyzer.lexicon = mapped_lexicon
+    if use_mapped_lexicon and mapped_lexicon is None:
+        analyzer.lexicon = __build_mapped_lexicon(analyzer.lexicon)
+    memoized_analyzer = sc.MemoizedAnalyzer(ov.apply_overlays(analyzer.lexicon, overlays), analyzer.emojis,
+                                            ct.get_token_memo_size(), ct.get_answer_table_size())
+    memoized_analyzer.overlays = overlays
+    return memoized_analyzer
+
+
+def __build_mapped_lexicon(lexicon: dict[str, float]) -> Mapping:
+    """
+    Write the memory-mapped lexicon file from the provided lexicon and return the mapped lexicon.
+    The provided lexicon is returned if the file can not be written.
+    :param lexicon: the word to valence dictionary loaded by the analyzer
+    :return: the MappedLexicon, or the provided lexicon as a fallback
+    """
+    try:
+        ml.build_mapped_lexicon(lexicon)
+    except OSError:
+        return lexicon
+    mapped_lexicon = ml.open_mapped_lexicon()
+    return lexicon if mapped_lexicon is None else mapped_lexicon
@@ -0,0 +1,328 @@
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+import vaderSentiment.vaderSentiment as vader
+
+from services import analyzer_service as an
+from services import constants_service as ct
+from services import text_service as tx
+
+# Multi-word VADER phrases, matched token by token
+PHRASES = {phrase: value for phrase, value in vader.SPECIAL_CASES.items() if ' ' in phrase}
+BOOSTER_PHRASES = {phrase: value for phrase, value in vader.BOOSTER_DICT.items() if ' ' in phrase}
+
+# Words the VADER rules compare tokens against, each one identified by a non zero code
+RULE_WORDS = ['no', 'or', 'nor', 'kind', 'of', 'least', 'at', 'very', 'never', 'so', 'this', 'without', 'doubt',
+              'but']
+RULE_WORDS += sorted({word for phrase in [*PHRASES, *BOOSTER_PHRASES] for word in phrase.split()} - set(RULE_WORDS))
+RULE_CODES = {word: code for code, word in enumerate(RULE_WORDS, start=1)}
+
+# Single word negations of the VADER "negated" rule
+NEGATIONS = frozenset(vader.NEGATE)
+
+
+def get_sentiments(user_inputs: Sequence[str]) -> list[str]:
+    """
+    Return the extracted sentiment of every provided input text, scored as a batch.
+    :param user_inputs: provided input texts
+    :return: the extracted sentiments (between "positive", "neutral" and "negative"), in input order
+    """
+    compounds = get_polarities(user_inputs)['compound']
+    return get_labels(compounds).tolist()
+
+
+def get_labels(compounds: np.ndarray) -> np.ndarray:
+    """
+    Return the sentiment labels of the provided compounds, with the extractor threshold.
+    :param compounds: float sentiment scores adjusted between -1 and 1
+    :return: the array of extracted sentiments (between "positive", "neutral" and "negative")
+    """
+    threshold = ct.get_threshold()
+    return np.where(compounds >= threshold, ct.get_positivity_label(),
+                    np.where(compounds <= -threshold, ct.get_negativity_label(), ct.get_neutrality_label()))
+
+
+def get_polarities(user_inputs: Sequence[str]) -> dict[str, np.ndarray]:
+    """
+    Return the VADER polarities of every provided input text.
+    Texts are tokenized once per chunk and the VADER rules are applied with array operations
+    over all the tokens of the chunk, giving exactly the scores of the scalar analyzer.
+    :param user_inputs: provided input texts
+    :return: a dictionary of "neg", "neu", "pos" and "compound" float arrays, in input order
+    """
+    analyzer = an.get_analyzer()
+    user_inputs = list(user_inputs)
+    chunk_size = ct.get_batch_chunk_size()
+    chunks = [__score_chunk(analyzer.lexicon, analyzer.emoji_replacer, user_inputs[start:start + chunk_size])
+              for start in range(0, len(user_inputs), chunk_size)]
+    keys = ['neg', 'neu', 'pos', 'compound']
+    if not chunks:
+        return {key: np.zeros(0) for key in keys}
+    return {key: np.concatenate([chunk[key] for chunk in chunks]) for key in keys}
+
+
+def __score_chunk(lexicon: Mapping, emoji_replacer: tx.EmojiReplacer, texts: Sequence[str]) -> dict[str, np.ndarray]:
+    """
+    Return the VADER polarities of a chunk of texts.
+    :param lexicon: word to valence mapping of the analyzer
+    :param emoji_replacer: emoji replacer of the analyzer
+    :param texts: input texts of the chunk
+    :return: a dictionary of "neg", "neu", "pos" and "compound" float arrays
+    """
+    processed_texts = [emoji_replacer.replace(text) for text in texts]
+    words_by_text = [tx.get_words_and_emoticons(text) for text in processed_texts]
+    amplifiers = np.array([tx.get_punctuation_emphasis(text) for text in processed_texts], dtype=np.float64)
+    lengths = np.array([len(words) for words in words_by_text], dtype=np.int64)
+    words = [word for text_words in words_by_text for word in text_words]
+    tokens = __TokenArrays(lexicon, words, lengths)
+    sentiments = __get_token_sentiments(tokens)
+    sentiments = __apply_but_rule(tokens, sentiments, words)
+    return __score_valences(tokens, sentiments, amplifiers)
+
+
+class __TokenArrays:
+    """
+    Flat per-token arrays of a chunk of texts, with the position of each token in its text.
+    """
+
+    def __init__(self, lexicon: Mapping, words: list[str], lengths: np.ndarray):
+        """
+        Tokenize nothing more : map every lowercased token to a vocabulary id once,
+        then look up the lexicon, booster, negation and rule word properties per vocabulary entry.
+        :param lexicon: word to valence mapping of the analyzer
+        :param words: tokens of all the texts, concatenated
+        :param lengths: number of tokens of each text
+        """
+        token_count = len(words)
+        self.lengths = lengths
+        self.document = np.repeat(np.arange(len(lengths)), lengths)
+        self.position = np.arange(token_count) - (np.cumsum(lengths) - lengths)[self.document]
+        self.size = lengths[self.document]
+        lowered = list(map(str.lower, words))
+        vocabulary = {word: index for index, word in enumerate(dict.fromkeys(lowered))}
+        ids = np.fromiter(map(vocabulary.__getitem__, lowered), np.int64, token_count)
+        valences = [lexicon.get(word) for word in vocabulary]
+        self.in_lexicon = np.array([valence is not None for valence in valences], dtype=bool)[ids]
+        self.valence = np.array([valence or 0.0 for valence in valences], dtype=np.float64)[ids]
+        self.is_booster = np.array([word in vader.BOOSTER_DICT for word in vocabulary], dtype=bool)[ids]
+        self.booster = np.array([vader.BOOSTER_DICT.get(word, 0.0) for word in vocabulary], dtype=np.float64)[ids]
+        self.negated = np.array([word in NEGATIONS or "n't" in word for word in vocabulary], dtype=bool)[ids]
+        self.code = np.array([RULE_CODES.get(word, 0) for word in vocabulary], dtype=np.int64)[ids]
+        self.is_upper = np.fromiter(map(str.isupper, words), bool, token_count)
+        upper_counts = np.bincount(self.document, weights=self.is_upper, minlength=len(lengths))
+        self.cap_differential = ((upper_counts > 0) & (upper_counts < lengths))[self.document]
+        self._shifted_indexes = {}
+
+    def shift(self, values: np.ndarray, offset: int, fill) -> np.ndarray:
+        """
+        Return the values of the token at the provided offset from each token of the same text,
+        or the fill value when that token is out of its text.
+        :param values: per-token values
+        :param offset: relative token offset, negative for preceding tokens
+        :param fill: value for out of text positions
+        :return: the shifted per-token values
+        """
+        if offset not in self._shifted_indexes:
+            target = self.position + offset
+            indexes = np.nonzero((target >= 0) & (target < self.size))[0]
+            self._shifted_indexes[offset] = (indexes, indexes + offset)
+        indexes, shifted_indexes = self._shifted_indexes[offset]
+        shifted = np.full_like(values, fill)
+        shifted[indexes] = values[shifted_indexes]
+        return shifted
+
+    def is_word(self, offset: int, *rule_words: str) -> np.ndarray:
+        """
+        Return whether the token at the provided offset from each token is one of the provided rule words.
+        :param offset: relative token offset, negative for preceding tokens
+        :param rule_words: lowercased words among the RULE_WORDS
+        :return: the per-token boolean array
+        """
+        codes = self.shift(self.code, offset, 0)
+        return np.isin(codes, [RULE_CODES[word] for word in rule_words])
+
+
+def __get_token_sentiments(tokens: __TokenArrays) -> np.ndarray:
+    """
+    Return the valence of every token after the VADER negation, booster, capitalization,
+    idiom and "least" rules, computed with array operations over all the tokens.
+    :param tokens: per-token arrays of the chunk
+    :return: the per-token sentiment valences
+    """
+    skipped = tokens.is_booster | (tokens.is_word(0, 'kind') & tokens.is_word(1, 'of'))
+    next_in_lexicon = tokens.shift(tokens.in_lexicon, 1, False)
+    valence = np.where(tokens.is_word(0, 'no') & next_in_lexicon, 0.0, tokens.valence)
+    negated_by_no = tokens.is_word(-1, 'no') | tokens.is_word(-2, 'no') \
+        | (tokens.is_word(-3, 'no') & tokens.is_word(-1, 'or', 'nor'))
+    valence = np.where(negated_by_no, tokens.valence * vader.N_SCALAR, valence)
+    capitalized = tokens.is_upper & tokens.cap_differential
+    valence = np.where(capitalized, np.where(valence > 0, valence + vader.C_INCR, valence - vader.C_INCR), valence)
+    for start_i in range(3):
+        offset = -(start_i + 1)
+        applies = (tokens.position > start_i) & ~tokens.shift(tokens.in_lexicon, offset, True)
+        valence = np.where(applies, valence + __get_booster_scalars(tokens, valence, start_i), valence)
+        valence = np.where(applies, __apply_negation_rule(tokens, valence, start_i), valence)
+        if start_i == 2:
+            valence = np.where(applies, __apply_idioms_rule(tokens, valence), valence)
+    least = tokens.is_word(-1, 'least') & ~tokens.shift(tokens.in_lexicon, -1, True)
+    negated_by_least = least & (((tokens.position > 1) & ~tokens.is_word(-2, 'at', 'very')) | (tokens.position == 1))
+    valence = np.where(negated_by_least, valence * vader.N_SCALAR, valence)
+    return np.where(tokens.in_lexicon & ~skipped, valence, 0.0)
+
+
+def __get_booster_scalars(tokens: __TokenArrays, valence: np.ndarray, start_i: int) -> np.ndarray:
+    """
+    Return the VADER booster / dampener scalar of the token preceding each token by start_i + 1 positions.
+    :param tokens: per-token arrays of the chunk
+    :param valence: current per-token valences
+    :param start_i: distance of the modifier token minus one
+    :return: the per-token scalars to add to the valences
+    """
+    offset = -(start_i + 1)
+    is_booster = tokens.shift(tokens.is_booster, offset, False)
+    scalar = tokens.shift(tokens.booster, offset, 0.0)
+    scalar = np.where(valence < 0, -scalar, scalar)
+    capitalized = tokens.shift(tokens.is_upper, offset, False) & tokens.cap_differential
+    scalar = np.where(capitalized, np.where(valence > 0, scalar + vader.C_INCR, scalar - vader.C_INCR), scalar)
+    scalar = np.where(is_booster, scalar, 0.0)
+    if start_i == 1:
+        scalar = scalar * 0.95
+    elif start_i == 2:
+        scalar = scalar * 0.9
+    return scalar
+
+
+def __apply_negation_rule(tokens: __TokenArrays, valence: np.ndarray, start_i: int) -> np.ndarray:
+    """
+    Return the valences after the VADER negation check of the token preceding each token by start_i + 1 positions.
+    :param tokens: per-token arrays of the chunk
+    :param valence: current per-token valences
+    :param start_i: distance of the negation token minus one
+    :return: the per-token valences
+    """
+    negated = tokens.shift(tokens.negated, -(start_i + 1), False)
+    if start_i == 0:
+        return np.where(negated, valence * vader.N_SCALAR, valence)
+    if start_i == 1:
+        never_so = tokens.is_word(-2, 'never') & tokens.is_word(-1, 'so', 'this')
+        without_doubt = tokens.is_word(-2, 'without') & tokens.is_word(-1, 'doubt')
+    else:
+        never_so = (tokens.is_word(-3, 'never') & tokens.is_word(-2, 'so', 'this')) | tokens.is_word(-1, 'so', 'this')
+        without_doubt = tokens.is_word(-3, 'without') & (tokens.is_word(-2, 'doubt') | tokens.is_word(-1, 'doubt'))
+    negated = negated & ~never_so & ~without_doubt
+    return np.where(never_so, valence * 1.25, np.where(negated, valence * vader.N_SCALAR, valence))
+
+
+def __apply_idioms_rule(tokens: __TokenArrays, valence: np.ndarray) -> np.ndarray:
+    """
+    Return the valences after the VADER special idioms and booster phrases check.
+    :param tokens: per-token arrays of the chunk
+    :param valence: current per-token valences
+    :return: the per-token valences
+    """
+    idioms = __get_phrase_values(tokens, PHRASES, np.nan)
+    booster_phrases = __get_phrase_values(tokens, BOOSTER_PHRASES, 0.0)
+    preceding_idiom = np.full_like(valence, np.nan)
+    for length, offset in reversed([(2, -1), (3, -2), (2, -2), (3, -3), (2, -3)]):
+        candidate = tokens.shift(idioms[length], offset, np.nan)
+        preceding_idiom = np.where(np.isnan(candidate), preceding_idiom, candidate)
+    valence = np.where(np.isnan(preceding_idiom), valence, preceding_idiom)
+    for length in [2, 3]:
+        valence = np.where(np.isnan(idioms[length]), valence, idioms[length])
+    for length, offset in [(3, -3), (2, -3), (2, -2)]:
+        valence = valence + tokens.shift(booster_phrases[length], offset, 0.0)
+    return valence
+
+
+def __get_phrase_values(tokens: __TokenArrays, phrases: dict[str, float], fill: float) -> dict[int, np.ndarray]:
+    """
+    Return, for each phrase length, the value of the phrase starting at each token.
+    :param tokens: per-token arrays of the chunk
+    :param phrases: phrase to value mapping, phrases having two or three words
+    :param fill: value of the tokens starting no phrase
+    :return: a dictionary of per-token phrase values by phrase length
+    """
+    codes = [tokens.code, tokens.shift(tokens.code, 1, 0), tokens.shift(tokens.code, 2, 0)]
+    values = {}
+    for length in [2, 3]:
+        table = np.full((len(RULE_CODES) + 1,) * length, fill)
+        for phrase, value in phrases.items():
+            words = phrase.split()
+            if len(words) == length:
+                table[tuple(RULE_CODES[word] for word in words)] = value
+        values[length] = table[tuple(codes[:length])]
+    return values
+
+
+def __apply_but_rule(tokens: __TokenArrays, sentiments: np.ndarray, words: list[str]) -> np.ndarray:
+    """
+    Return the sentiments after the VADER contrastive "but" rule : halved before the first "but"
+    of the text and increased by half after it.
+    VADER updates the sentiment found by value rather than by position, so texts in which
+    that lookup could hit another token are rescored with the original VADER rule.
+    :param tokens: per-token arrays of the chunk
+    :param sentiments: per-token sentiment valences
+    :param words: tokens of all the texts, concatenated
+    :return: the per-token sentiment valences
+    """
+    is_but = tokens.code == RULE_CODES['but']
+    if not is_but.any():
+        return sentiments
+    first_but = np.full(len(tokens.lengths), np.iinfo(np.int64).max)
+    np.minimum.at(first_but, tokens.document[is_but], tokens.position[is_but])
+    but_position = first_but[tokens.document]
+    factor = np.where(tokens.position < but_position, 0.5, np.where(tokens.position > but_position, 1.5, 1.0))
+    factor = np.where(but_position == np.iinfo(np.int64).max, 1.0, factor)
+    contrasted = sentiments * factor
+    candidates = (sentiments != 0) & (factor != 1.0)
+    candidate_documents = np.concatenate([tokens.document[candidates], tokens.document[candidates]])
+    candidate_values = np.concatenate([sentiments[candidates], contrasted[candidates]])
+    order = np.lexsort((candidate_values, candidate_documents))
+    duplicates = (np.diff(candidate_documents[order]) == 0) & (np.diff(candidate_values[order]) == 0)
+    starts = np.cumsum(tokens.lengths) - tokens.lengths
+    for document in np.unique(candidate_documents[order][1:][duplicates]):
+        start, end = starts[document], starts[document] + tokens.lengths[document]
+        text_sentiments = sentiments[start:end].tolist()
+        contrasted[start:end] = vader.SentimentIntensityAnalyzer._but_check(words[start:end], text_sentiments)
+    return contrasted
+
+
+def __score_valences(tokens: __TokenArrays, sentiments: np.ndarray, amplifiers: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Return the VADER polarities of each text from the sentiments of its tokens.
+    Sums are accumulated token position by token position, in the same order as the scalar analyzer.
+    :param tokens: per-token arrays of the chunk
+    :param sentiments: per-token sentiment valences
+    :param amplifiers: punctuation emphasis amplifier of each text
+    :return: a dictionary of "neg", "neu", "pos" and "compound" float arrays
+    """
+    document_count = len(tokens.lengths)
+    matrix = np.zeros((document_count, int(tokens.lengths.max(initial=0))))
+    matrix[tokens.document, tokens.position] = sentiments
+    sentiment_sum = np.zeros(document_count)
+    positive_sum = np.zeros(document_count)
+    negative_sum = np.zeros(document_count)
+    for column in matrix.T:
+        sentiment_sum += column
+        positive_sum += np.where(column > 0, column + 1, 0.0)
+        negative_sum += np.where(column < 0, column - 1, 0.0)
+    neutral_count = np.bincount(tokens.document[sentiments == 0], minlength=document_count)
+    sentiment_sum = np.where(sentiment_sum > 0, sentiment_sum + amplifiers,
+                             np.where(sentiment_sum < 0, sentiment_sum - amplifiers, sentiment_sum))
+    compound = np.clip(sentiment_sum / np.sqrt(sentiment_sum * sentiment_sum + 15), -1.0, 1.0)
+    mostly_positive = positive_sum > np.abs(negative_sum)
+    mostly_negative = positive_sum < np.abs(negative_sum)
+    positive_sum = np.where(mostly_positive, positive_sum + amplifiers, positive_sum)
+    negative_sum = np.where(mostly_negative, negative_sum - amplifiers, negative_sum)
+    total = positive_sum + np.abs(negative_sum) + neutral_count
+    has_tokens = tokens.lengths > 0
+    safe_total = np.where(has_tokens, total, 1.0)
+    polarities = {
+        'neg': np.where(has_tokens, np.abs(negative_sum / safe_total), 0.0),
+        'neu': np.where(has_tokens, np.abs(neutral_count / safe_total), 0.0),
+        'pos': np.where(has_tokens, np.abs(positive_sum / safe_total), 0.0),
+        'compound': np.where(has_tokens, compound, 0.0)
+    }
+    digits = {'neg': 3, 'neu': 3, 'pos': 3, 'compound': 4}
+    return {key: np.array([round(value, digits[key]) for value in values.tolist()], dtype=np.float64)
+            for key, values in polarities.items()}
@@ -0,0 +1,304 @@
+import argparse
+import csv
+import io
+import json
+import mmap
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from services import analyzer_service as an
+from services import batch_service as bs
+from services import constants_service as ct
+from services import extractor_service as ex
+
+# Supported file formats, by file extension
+FORMATS = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl', '.parquet': 'parquet'}
+
+
+def score_file(input_path: str, output_path: str, column: str, file_format: Optional[str] = None,
+               worker_count: Optional[int] = None, chunk_size: Optional[int] = None) -> int:
+    """
+    Score the provided text column of a CSV, JSON Lines or Parquet file and write every row
+    followed by its sentiment and its "neg", "neu", "pos" and "compound" polarities to a file of the same format.
+    CSV and JSON Lines files are memory-mapped and split in byte ranges ending on a record boundary,
+    each one read, scored and written to a part file by a worker process, and Parquet files are split
+    in row groups. At most two ranges per worker are in flight, so memory stays bounded whatever the file size.
+    Rows without a text value get empty scores.
+    :param input_path: path of the file to score
+    :param output_path: path of the scored file to write
+    :param column: name of the text column, or key of the text value of JSON Lines records
+    :param file_format: "csv", "jsonl" or "parquet", defaults to the one of the input file extension
+    :param worker_count: number of worker processes, 1 scoring in the current process, defaults to the configured one
+    :param chunk_size: number of bytes of the CSV and JSON Lines ranges, defaults to the configured one
+    :return: the number of scored rows
+    """
+    file_format = file_format or get_file_format(input_path)
+    worker_count = ct.get_pool_workers() if worker_count is None else worker_count
+    chunk_size = ct.get_bulk_chunk_size() if chunk_size is None else chunk_size
+    if file_format == 'parquet':
+        return __score_parquet(input_path, output_path, column, worker_count)
+    is_csv = file_format == 'csv'
+    with open(input_path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        try:
+            header_end = get_record_end(buffer, 0, 0, is_csv) if is_csv else 0
+            header = buffer[:header_end].decode('utf-8-sig')
+            ranges = get_byte_ranges(buffer, header_end, chunk_size, is_csv)
+        finally:
+            if size:
+                buffer.close()
+    column_index = None
+    if is_csv:
+        header_row = next(csv.reader(io.StringIO(header, newline='')), [])
+        if column not in header_row:
+            raise ValueError(f'No "{column}" column in {input_path}')
+        column_index = header_row.index(column)
+    output_directory = os.path.dirname(os.path.abspath(output_path))
+    with tempfile.TemporaryDirectory(dir=output_directory) as part_directory:
+        part_paths = [os.path.join(part_directory, f'{index:08d}.part') for index in range(len(ranges))]
+        tasks = [(file_format, input_path, start, end, column if column_index is None else column_index, part_path)
+                 for (start, end), part_path in zip(ranges, part_paths)]
+        row_count = 0
+        with open(output_path, 'wb', buffering=ct.get_bulk_write_buffer_size()) as output:
+            if is_csv:
+                header_output = io.StringIO(newline='')
+                csv.writer(header_output).writerow(header_row + __get_score_columns())
+                output.write(header_output.getvalue().encode('utf-8'))
+            for part_path, part_row_count in zip(part_paths, __map_in_order(__score_range, tasks, worker_count)):
+                row_count += part_row_count
+                with open(part_path, 'rb') as part:
+                    shutil.copyfileobj(part, output, ct.get_bulk_write_buffer_size())
+                os.remove(part_path)
+    return row_count
+
+
+def get_file_format(path: str) -> str:
+    """
+    Return the format of the provided file from its extension.
+    :param path: path of a CSV, JSON Lines or Parquet file
+    :return: "csv", "jsonl" or "parquet"
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f'Unknown file format of {path} (expected one of {", ".join(FORMATS)})')
+    return FORMATS[extension]
+
+
+def get_byte_ranges(buffer, start: int, chunk_size: int, is_csv: bool) -> list[tuple[int, int]]:
+    """
+    Return the provided buffer, from the provided record start, split in consecutive byte ranges
+    of about the provided size, each one ending right after a record.
+    :param buffer: memory-mapped file or bytes
+    :param start: offset of the first record
+    :param chunk_size: approximate number of bytes per range
+    :param is_csv: whether records are CSV rows, whose quoted values may contain line breaks
+    :return: the list of (start, end) offsets
+    """
+    ranges = []
+    size = len(buffer)
+    while start < size:
+        end = get_record_end(buffer, start, min(size, start + max(1, chunk_size)), is_csv)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def get_record_end(buffer, start: int, position: int, is_csv: bool) -> int:
+    """
+    Return the offset following the first line break at or after the provided position that ends a record.
+    A CSV line break ends a record when the number of quotes since the record start is even,
+    as escaped quotes are doubled.
+    :param buffer: memory-mapped file or bytes
+    :param start: offset of a record start
+    :param position: offset from which to look for a line break
+    :param is_csv: whether records are CSV rows, whose quoted values may contain line breaks
+    :return: the offset of the next record start, or the buffer size
+    """
+    quote_count = buffer[start:position].count(b'"') if is_csv else 0
+    while True:
+        line_break = buffer.find(b'\n', position)
+        if line_break < 0:
+            return len(buffer)
+        if is_csv:
+            quote_count += buffer[position:line_break].count(b'"')
+        if quote_count % 2 == 0:
+            return line_break + 1
+        position = line_break + 1
+
+
+def score_texts(texts: list) -> list[Optional[tuple]]:
+    """
+    Return the sentiment and the polarities of every provided text, scored as a batch.
+    :param texts: text values, None or other values marking rows without text
+    :return: for each value, the tuple of its sentiment and its "neg", "neu", "pos" and "compound" polarities,
+    or None if it is not a text
+    """
+    valid_texts = [text for text in texts if isinstance(text, str)]
+    polarities = bs.get_polarities(valid_texts)
+    labels = bs.get_labels(polarities['compound']).tolist()
+    scores = iter(zip(labels, *(polarities[key].tolist() for key in ex.POLARITY_KEYS)))
+    return [next(scores) if isinstance(text, str) else None for text in texts]
+
+
+def __get_score_columns() -> list[str]:
+    """
+    Return the names of the columns appended to every scored row.
+    :return: the sentiment column followed by the polarity columns
+    """
+    return [ct.get_response_sentiment_key()] + ex.POLARITY_KEYS
+
+
+def __map_in_order(function: Callable, tasks: list[tuple], worker_count: int) -> Iterator:
+    """
+    Call the provided function on every task, in worker processes loading their own lexicon when there are several,
+    and yield the results in task order. At most two tasks per worker are submitted ahead of the yielded result.
+    :param function: module level function to call
+    :param tasks: tuples of arguments of each call
+    :param worker_count: number of worker processes, 1 calling the function in the current process
+    :return: an iterator over the results
+    """
+    if worker_count <= 1:
+        for task in tasks:
+            yield function(*task)
+        return
+    context = multiprocessing.get_context(ct.get_pool_start_method())
+    with ProcessPoolExecutor(max_workers=worker_count, mp_context=context, initializer=an.warm_up) as executor:
+        futures = deque()
+        for task in tasks:
+            futures.append(executor.submit(function, *task))
+            if len(futures) >= 2 * worker_count:
+                yield futures.popleft().result()
+        while futures:
+            yield futures.popleft().result()
+
+
+def __score_range(file_format: str, input_path: str, start: int, end: int, column, part_path: str) -> int:
+    """
+    Read the records of the provided byte range of a CSV or JSON Lines file, score their texts
+    and write them along with their scores to the provided part file.
+    :param file_format: "csv" or "jsonl"
+    :param input_path: path of the file to score
+    :param start: offset of the first record of the range
+    :param end: offset following the last record of the range
+    :param column: index of the CSV text column, or key of the JSON Lines text value
+    :param part_path: path of the part file to write
+    :return: the number of scored rows
+    """
+    with open(input_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        data = buffer[start:end].decode('utf-8')
+    with open(part_path, 'w', encoding='utf-8', newline='', buffering=ct.get_bulk_write_buffer_size()) as part:
+        if file_format == 'csv':
+            rows = [row for row in csv.reader(io.StringIO(data, newline='')) if row]
+            texts = [row[column] if column < len(row) else None for row in rows]
+            writer = csv.writer(part)
+            writer.writerows(row + list(scores or [''] * 5) for row, scores in zip(rows, score_texts(texts)))
+        else:
+            records = [json.loads(line) for line in data.split('\n') if line.strip()]
+            texts = [record.get(column) if isinstance(record, dict) else None for record in records]
+            part.writelines(__get_json_line(record, scores) for record, scores in zip(records, score_texts(texts)))
+    return len(rows) if file_format == 'csv' else len(records)
+
+
+def __get_json_line(record, scores: Optional[tuple]) -> str:
+    """
+    Return the JSON line of the provided record along with its scores.
+    :param record: decoded JSON Lines record, whose scores are added when it is an object
+    :param scores: the sentiment and polarities of the record text, or None if it has no text
+    :return: the line, line break included
+    """
+    if isinstance(record, dict):
+        record.update(zip(__get_score_columns(), scores or [None] * 5))
+    return json.dumps(record, ensure_ascii=False) + '\n'
+
+
+def __score_parquet(input_path: str, output_path: str, column: str, worker_count: int) -> int:
+    """
+    Score the provided text column of a Parquet file row group by row group, each one scored by a worker process,
+    and write every row group followed by its score columns to the output file.
+    :param input_path: path of the Parquet file to score
+    :param output_path: path of the scored Parquet file to write
+    :param column: name of the text column
+    :param worker_count: number of worker processes, 1 scoring in the current process
+    :return: the number of scored rows
+    """
+    pa, pq = __import_pyarrow()
+    input_file = pq.ParquetFile(input_path)
+    if column not in input_file.schema_arrow.names:
+        raise ValueError(f'No "{column}" column in {input_path}')
+    tasks = [(input_path, index, column) for index in range(input_file.num_row_groups)]
+    row_count = 0
+    writer = None
+    try:
+        for index, columns in enumerate(__map_in_order(__score_row_group, tasks, worker_count)):
+            table = input_file.read_row_group(index)
+            types = [pa.string()] + [pa.float64()] * len(ex.POLARITY_KEYS)
+            for name, values, value_type in zip(__get_score_columns(), columns, types):
+                table = table.append_column(name, pa.array(values, type=value_type))
+            if writer is None:
+                writer = pq.ParquetWriter(output_path, table.schema)
+            writer.write_table(table)
+            row_count += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return row_count
+
+
+def __score_row_group(input_path: str, index: int, column: str) -> list[list]:
+    """
+    Score the texts of the provided row group of a Parquet file.
+    :param input_path: path of the Parquet file to score
+    :param index: index of the row group
+    :param column: name of the text column
+    :return: the sentiment column followed by the "neg", "neu", "pos" and "compound" polarity columns
+    """
+    _, pq = __import_pyarrow()
+    texts = pq.ParquetFile(input_path).read_row_group(index, columns=[column]).column(0).to_pylist()
+    all_scores = score_texts(texts)
+    return [[None if scores is None else scores[i] for scores in all_scores] for i in range(5)]
+
+
+def __import_pyarrow() -> tuple:
+    """
+    Return the pyarrow modules reading and writing Parquet files, imported on first use
+    so that scoring CSV and JSON Lines files does not pay for their loading.
+    :return: the pyarrow and pyarrow.parquet modules
+    """
+    import pyarrow
+    import pyarrow.parquet
+    return pyarrow, pyarrow.parquet
+
+
+def main():
+    """
+    Score the text column of a file and print the number of scored rows per second.
+    """
+    parser = argparse.ArgumentParser(description='Score the text column of a CSV, JSON Lines or Parquet file')
+    parser.add_argument('input', help='path of the file to score')
+    parser.add_argument('output', help='path of the scored file to write')
+    parser.add_argument('--column', default='text', help='name of the text column (default: text)')
+    parser.add_argument('--format', choices=sorted(set(FORMATS.values())), help='defaults to the input extension')
+    parser.add_argument('--workers', type=int, help='number of worker processes (default: SENTIMENT_POOL_WORKERS)')
+    parser.add_argument('--chunk-size', type=int, help='bytes per range (default: SENTIMENT_BULK_CHUNK_SIZE)')
+    arguments = parser.parse_args()
+    start = time.perf_counter()
+    try:
+        row_count = score_file(arguments.input, arguments.output, arguments.column, arguments.format,
+                               arguments.workers, arguments.chunk_size)
+    except (OSError, ValueError, RuntimeError) as error:
+        parser.exit(1, f'{parser.prog}: error: {error}\n')
+    elapsed = time.perf_counter() - start
+    print(f'{row_count} rows scored in {elapsed:.2f} s ({row_count / elapsed:.0f} rows/s)', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Optional
+
+from services import constants_service as ct
+
+# Approximate memory used by one cache entry besides its text key : its (lexicon version, polarities) tuple,
+# its tuple of four float polarities and its slot in the ordered dictionary
+ENTRY_SIZE = sys.getsizeof((0, ())) + sys.getsizeof((0.0,) * 4) + 4 * sys.getsizeof(0.0) + 104
+
+# Share of the cache memory budget kept for entries that were hit at least once
+PROTECTED_SHARE = 0.8
+
+
+def get_entry_size(text: str) -> int:
+    """
+    Return the approximate memory used by the cache entry of the provided text, the text itself included.
+    :param text: input text
+    :return: the entry size in bytes
+    """
+    return ENTRY_SIZE + sys.getsizeof(text)
+
+
+class ResultCache:
+    """
+    Bounded cache of polarity tuples keyed by the input text, each tagged with the version
+    of the lexicon it was scored with. Eviction follows a segmented LRU policy : new entries go to a probation
+    segment and move to a protected segment when they are hit again, so one-off inputs never evict frequent ones.
+    The memory budget counts the cached texts, so that long inputs take the room of many short ones.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Create an empty cache holding as many entries as the provided memory budget allows.
+        :param max_bytes: memory budget of the cache in bytes, 0 disables it
+        """
+        self.max_bytes = max_bytes
+        self.protected_max_bytes = int(max_bytes * PROTECTED_SHARE)
+        self._probation = OrderedDict()
+        self._protected = OrderedDict()
+        self._probation_bytes = 0
+        self._protected_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, text: str, lexicon_version: int = 0,
+            is_unchanged_since: Optional[Callable[[str, int], bool]] = None) -> Optional[tuple[float, ...]]:
+        """
+        Return the cached polarities of the provided text, or None if they are not cached.
+        Polarities scored with another lexicon version are returned, and tagged with the provided version,
+        only if is_unchanged_since tells that the lexicon changes since their version do not affect the text :
+        a lexicon reload never returns stale polarities, nor flushes the entries it does not affect.
+        :param text: input text
+        :param lexicon_version: version of the current lexicon
+        :param is_unchanged_since: function telling whether the polarities of a text scored with a lexicon version
+        are still valid, None to consider the entries of other versions stale
+        :return: the cached polarity tuple, or None
+        """
+        with self._lock:
+            entry = self.__find(text)
+            if entry is not None and entry[0] == lexicon_version:
+                self.hits += 1
+                return entry[1]
+        is_valid = entry is not None and is_unchanged_since is not None and is_unchanged_since(text, entry[0])
+        with self._lock:
+            if not is_valid:
+                self.misses += 1
+                self.invalidations += entry is not None
+                return None
+            if text in self._protected and self._protected[text] is entry:
+                self._protected[text] = (lexicon_version, entry[1])
+            self.hits += 1
+            return entry[1]
+
+    def put(self, text: str, polarities: tuple[float, ...], lexicon_version: int = 0):
+        """
+        Cache the polarities of the provided text, evicting the least valuable entries until it fits.
+        A text whose entry alone exceeds the memory budget is not cached.
+        :param text: input text
+        :param polarities: float polarities of the text
+        :param lexicon_version: version of the lexicon the text was scored with
+        """
+        entry_size = get_entry_size(text)
+        if entry_size > self.max_bytes:
+            return
+        entry = (lexicon_version, polarities)
+        with self._lock:
+            if text in self._protected:
+                self._protected[text] = entry
+                return
+            if text not in self._probation:
+                self._probation_bytes += entry_size
+            self._probation[text] = entry
+            self._probation.move_to_end(text)
+            while self._probation_bytes + self._protected_bytes > self.max_bytes:
+                if self._probation:
+                    evicted_text, _ = self._probation.popitem(last=False)
+                    self._probation_bytes -= get_entry_size(evicted_text)
+                else:
+                    evicted_text, _ = self._protected.popitem(last=False)
+                    self._protected_bytes -= get_entry_size(evicted_text)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Remove every cached entry and reset the counters.
+        """
+        with self._lock:
+            self._probation.clear()
+            self._protected.clear()
+            self._probation_bytes = self._protected_bytes = 0
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def get_stats(self) -> dict[str, float]:
+        """
+        Return the cache size, memory used and budget, and hit, miss and eviction counters.
+        :return: the dictionary of cache statistics
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._probation) + len(self._protected),
+                'bytes': self._probation_bytes + self._protected_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+    def __find(self, text: str) -> Optional[tuple[int, tuple[float, ...]]]:
+        """
+        Return the entry of the provided text, moving it to the protected segment as it is hit again.
+        Must be called with the lock held.
+        :param text: input text
+        :return: the (lexicon version, polarity tuple) entry, or None if it is not cached
+        """
+        if text in self._protected:
+            self._protected.move_to_end(text)
+            return self._protected[text]
+        if text in self._probation:
+            entry = self._probation.pop(text)
+            entry_size = get_entry_size(text)
+            self._probation_bytes -= entry_size
+            self._protected[text] = entry
+            self._protected_bytes += entry_size
+            while self._protected_bytes > self.protected_max_bytes:
+                demoted_text, demoted_entry = self._protected.popitem(last=False)
+                demoted_size = get_entry_size(demoted_text)
+                self._protected_bytes -= demoted_size
+                self._probation[demoted_text] = demoted_entry
+                self._probation_bytes += demoted_size
+            return entry
+        return None
+
+
+# Process-wide cache of the extracted polarities
+__result_cache = ResultCache(ct.get_result_cache_size())
+
+
+def get_result_cache() -> ResultCache:
+    """
+    Return the process-wide cache of polarities.
+    :return: the shared ResultCache instance
+    """
+    return __result_cache
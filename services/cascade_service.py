@@ -0,0 +1,106 @@
+import argparse
+from collections.abc import Sequence
+from typing import Optional
+
+import pandas as pd
+
+from services import analyzer_service as an
+from services import constants_service as ct
+from services import scorer_service as sc
+
+
+def is_label_uncertain(estimate: sc.ScoreEstimate, margin: Optional[float] = None) -> bool:
+    """
+    Return whether the VADER compound score of an estimated text could get another label than its estimate :
+    the range of compound scores of the estimate, widened by the margin, crosses the positive
+    or negative compound threshold.
+    :param estimate: the ScoreEstimate of the text
+    :param margin: widening of the compound score range, defaults to the configured cascade margin
+    :return: True if the text has to be scored with VADER, else False
+    """
+    margin = ct.get_cascade_margin() if margin is None else margin
+    return __get_label_side(estimate.lowest_compound - margin) != __get_label_side(estimate.highest_compound + margin)
+
+
+def get_estimate(text: str, margin: Optional[float] = None) -> Optional[dict[str, float]]:
+    """
+    Return the polarities of the provided text estimated from its lexicon tokens when no sign changing rule applies
+    and the label of the estimate is certain, its label being the one of its VADER polarities.
+    :param text: input text
+    :param margin: widening of the compound score range, defaults to the configured cascade margin
+    :return: the dictionary of "neg", "neu", "pos" and "compound" float polarities, or None to score the text
+    """
+    estimate = an.get_analyzer().estimate_scores(text)
+    if estimate is None or is_label_uncertain(estimate, margin):
+        return None
+    return estimate.scores
+
+
+def calibrate_margin(texts: Sequence[str]) -> float:
+    """
+    Return the smallest margin giving no label flip on the provided texts : the largest distance
+    between the VADER compound score of a text and the range of compound scores of its estimate.
+    Within the margin, every threshold between the label of the estimate and the VADER one
+    widens the range across it, so that the text is escalated.
+    :param texts: calibration texts
+    :return: the float margin
+    """
+    analyzer = an.get_analyzer()
+    margin = 0.0
+    for text in texts:
+        estimate = analyzer.estimate_scores(text)
+        if estimate is not None:
+            compound = analyzer.polarity_scores(text)['compound']
+            margin = max(margin, estimate.lowest_compound - compound, compound - estimate.highest_compound)
+    return margin
+
+
+def get_calibration_report(texts: Sequence[str], margin: Optional[float] = None) -> dict[str, float]:
+    """
+    Return the share of the provided texts the cascade engine would score with VADER with the provided margin,
+    and the number of texts whose estimate, kept by the cascade, gets another label than their VADER compound.
+    :param texts: calibration texts
+    :param margin: distance to the thresholds, defaults to the configured cascade margin
+    :return: the dictionary of the "escalated" fraction and the "flips" count
+    """
+    analyzer = an.get_analyzer()
+    escalated_count = flip_count = 0
+    for text in texts:
+        estimated_scores = get_estimate(text, margin)
+        if estimated_scores is None:
+            escalated_count += 1
+        elif __get_label_side(estimated_scores['compound']) != \
+                __get_label_side(analyzer.polarity_scores(text)['compound']):
+            flip_count += 1
+    return {'escalated': escalated_count / len(texts) if texts else 0.0, 'flips': flip_count}
+
+
+def __get_label_side(compound: float) -> int:
+    """
+    Return the side of the thresholds of the provided compound score : 1 for positive, -1 for negative, else 0.
+    :param compound: compound score
+    :return: the int side of the compound
+    """
+    threshold = ct.get_threshold()
+    return 1 if compound >= threshold else -1 if compound <= -threshold else 0
+
+
+def main():
+    """
+    Calibrate the cascade margin on the provided CSV file and print it with its escalation fraction and label flips.
+    """
+    parser = argparse.ArgumentParser(description='Calibrate the cascade engine margin on labelled texts')
+    parser.add_argument('--data', default=ct.get_cascade_calibration_data_path(),
+                        help='CSV file with a "text_snippet" column')
+    arguments = parser.parse_args()
+    texts = pd.read_csv(arguments.data)['text_snippet'].tolist()
+    margin = calibrate_margin(texts)
+    report = get_calibration_report(texts, margin)
+    print(f'margin: {margin:.4f}, escalated: {report["escalated"]:.1%}, flips: {report["flips"]}')
+    configured_report = get_calibration_report(texts)
+    print(f'configured margin: {ct.get_cascade_margin():.4f}, escalated: {configured_report["escalated"]:.1%}, '
+          f'flips: {configured_report["flips"]}')
+
+
+if __name__ == '__main__':
+    main()
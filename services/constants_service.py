@@ -1,3 +1,7 @@
+import os
+from typing import Optional
+
+
 def get_positivity_label() -> str:
     """
     Return the label corresponding to a positive sentiment.
@@ -119,4 +123,987 @@ def get_index_content_type() -> str:
     Return the index endpoint response content type
     :return: the index endpoint response content type
     """
-    return 'text/html; charset=utf-8'
\ No newline at end of file
+    return 'text/html; charset=utf-8'
+
+
+def get_lexicon_snapshot_path() -> str:
+    """
+    Return the path of the precompiled binary lexicon snapshot file,
+    which can be overridden with the SENTIMENT_LEXICON_SNAPSHOT environment variable.
+    :return: the lexicon snapshot file path
+    """
+    project_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    default_snapshot_path = os.path.join(project_directory, 'data', 'vader_lexicon.snapshot')
+    return os.getenv('SENTIMENT_LEXICON_SNAPSHOT', default_snapshot_path)
+
+
+def get_lexicon_snapshot_version() -> int:
+    """
+    Return the format version of the binary lexicon snapshot.
+    Snapshots written with another format version are considered stale.
+    :return: an int containing the value 4
+    """
+    return 4
+
+
+def get_mapped_lexicon_path() -> str:
+    """
+    Return the path of the memory-mapped lexicon file shared by the worker processes,
+    which can be overridden with the SENTIMENT_MAPPED_LEXICON environment variable.
+    :return: the mapped lexicon file path
+    """
+    project_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    default_mapped_lexicon_path = os.path.join(project_directory, 'data', 'vader_lexicon.map')
+    return os.getenv('SENTIMENT_MAPPED_LEXICON', default_mapped_lexicon_path)
+
+
+def get_mapped_lexicon_version() -> int:
+    """
+    Return the format version of the memory-mapped lexicon file.
+    :return: an int containing the value 1
+    """
+    return 1
+
+
+def get_lexicon_backend() -> str:
+    """
+    Return the storage backend of the analyzer lexicon, either "mapped" to read valences
+    from the memory-mapped lexicon file or "dict" to keep a private dictionary per process.
+    It can be overridden with the SENTIMENT_LEXICON_BACKEND environment variable.
+    :return: the lexicon backend name
+    """
+    return os.getenv('SENTIMENT_LEXICON_BACKEND', 'mapped')
+
+
+def get_batch_chunk_size() -> int:
+    """
+    Return the number of texts the batch scoring engine vectorizes at once,
+    bounding the memory used by its per-token arrays.
+    :return: an int containing the value 10000
+    """
+    return 10000
+
+
+def get_analyzer_batch_endpoint_url_suffix() -> str:
+    """
+    Return the batch analyzer endpoint url suffix, appended to the analyzer endpoint url prefix
+    :return: the batch analyzer endpoint url suffix
+    """
+    return 'batch'
+
+
+def get_analyzer_batch_endpoint_key() -> str:
+    """
+    Return the accepted input array key of the batch analyzer endpoint
+    :return: the accepted input array key of the batch analyzer endpoint
+    """
+    return 'inputs'
+
+
+def get_response_sentiment_key() -> str:
+    """
+    Return the response key of an extracted sentiment
+    :return: the response sentiment key
+    """
+    return 'sentiment'
+
+
+def get_max_batch_items() -> int:
+    """
+    Return the max accepted number of inputs in a batch analyzer request,
+    which can be overridden with the SENTIMENT_MAX_BATCH_ITEMS environment variable.
+    :return: an int defaulting to 1000
+    """
+    return int(os.getenv('SENTIMENT_MAX_BATCH_ITEMS', '1000'))
+
+
+def get_max_batch_payload_size() -> int:
+    """
+    Return the max accepted size in bytes of a batch analyzer request body,
+    which can be overridden with the SENTIMENT_MAX_BATCH_PAYLOAD_SIZE environment variable.
+    :return: an int defaulting to 1048576
+    """
+    return int(os.getenv('SENTIMENT_MAX_BATCH_PAYLOAD_SIZE', '1048576'))
+
+
+def get_missing_batch_input_key_message() -> str:
+    """
+    Return the message associated with a missing input array key 400 Bad Request response
+    :return: the above described message
+    """
+    batch_input_key = get_analyzer_batch_endpoint_key()
+    return f'POST request JSON body key "{batch_input_key}" not found'
+
+
+def get_not_array_batch_input_message() -> str:
+    """
+    Return the message associated with an input array value that is not an array 400 Bad Request response
+    :return: the above described message
+    """
+    batch_input_key = get_analyzer_batch_endpoint_key()
+    return f'POST request JSON body "{batch_input_key}" value is not an array'
+
+
+def get_too_many_batch_inputs_message() -> str:
+    """
+    Return the message associated with a too big input array 400 Bad Request response
+    :return: the above described message
+    """
+    max_batch_items = str(get_max_batch_items())
+    return f'Too many inputs (max {max_batch_items} inputs)'
+
+
+def get_too_big_batch_payload_message() -> str:
+    """
+    Return the message associated with a too big batch request body 400 Bad Request response
+    :return: the above described message
+    """
+    max_batch_payload_size = str(get_max_batch_payload_size())
+    return f'Request body too big (max {max_batch_payload_size} bytes)'
+
+
+def get_not_text_input_message() -> str:
+    """
+    Return the message associated with an input of a batch that is not a text
+    :return: the above described message
+    """
+    return 'Input is not a text'
+
+
+def get_none_batch_input_message() -> str:
+    """
+    Return the message associated with a null input of a batch
+    :return: the above described message
+    """
+    return 'Input is null'
+
+
+def get_analyzer_stream_endpoint_url_suffix() -> str:
+    """
+    Return the streaming analyzer endpoint url suffix, appended to the analyzer endpoint url prefix
+    :return: the streaming analyzer endpoint url suffix
+    """
+    return 'stream'
+
+
+def get_ndjson_content_type() -> str:
+    """
+    Return the newline-delimited JSON content type of the streaming analyzer endpoint
+    :return: the newline-delimited JSON content type
+    """
+    return 'application/x-ndjson'
+
+
+def get_stream_chunk_size() -> int:
+    """
+    Return the number of lines the streaming analyzer endpoint scores at once,
+    which can be overridden with the SENTIMENT_STREAM_CHUNK_SIZE environment variable.
+    :return: an int defaulting to 1000
+    """
+    return int(os.getenv('SENTIMENT_STREAM_CHUNK_SIZE', '1000'))
+
+
+def get_invalid_json_line_message() -> str:
+    """
+    Return the message associated with a streamed line that is not a valid JSON object
+    :return: the above described message
+    """
+    return 'Line is not a valid JSON object'
+
+
+def get_result_cache_size() -> int:
+    """
+    Return the memory budget in bytes of the extracted compound scores cache,
+    which can be overridden with the SENTIMENT_RESULT_CACHE_SIZE environment variable (0 disables it).
+    :return: an int defaulting to 16777216
+    """
+    return int(os.getenv('SENTIMENT_RESULT_CACHE_SIZE', '16777216'))
+
+
+def get_stats_endpoint_url_prefix() -> str:
+    """
+    Return the statistics endpoint url prefix
+    :return: the statistics endpoint url prefix
+    """
+    return 'stats'
+
+
+def get_result_cache_stats_key() -> str:
+    """
+    Return the statistics endpoint response key of the result cache statistics
+    :return: the result cache statistics key
+    """
+    return 'result_cache'
+
+
+def get_token_memo_size() -> int:
+    """
+    Return the maximum number of distinct tokens whose scoring facts are memoized by the analyzer,
+    which can be overridden with the SENTIMENT_TOKEN_MEMO_SIZE environment variable (0 disables it).
+    :return: an int defaulting to 100000
+    """
+    return int(os.getenv('SENTIMENT_TOKEN_MEMO_SIZE', '100000'))
+
+
+def get_token_memo_stats_key() -> str:
+    """
+    Return the statistics endpoint response key of the token memo statistics
+    :return: the token memo statistics key
+    """
+    return 'token_memo'
+
+
+def get_positivity_label_key() -> str:
+    """
+    Return the key of the positive label name in the analyzer endpoint "labels" object
+    :return: the positive label key
+    """
+    return 'positive'
+
+
+def get_neutrality_label_key() -> str:
+    """
+    Return the key of the neutral label name in the analyzer endpoint "labels" object
+    :return: the neutral label key
+    """
+    return 'neutral'
+
+
+def get_negativity_label_key() -> str:
+    """
+    Return the key of the negative label name in the analyzer endpoint "labels" object
+    :return: the negative label key
+    """
+    return 'negative'
+
+
+def get_analyzer_endpoint_scores_key() -> str:
+    """
+    Return the analyzer endpoint key of the flag asking for the polarity scores in the response
+    :return: the accepted scores flag key of the analyzer endpoint
+    """
+    return 'scores'
+
+
+def get_analyzer_endpoint_threshold_key() -> str:
+    """
+    Return the analyzer endpoint key of the per-request threshold
+    :return: the accepted threshold key of the analyzer endpoint
+    """
+    return 'threshold'
+
+
+def get_analyzer_endpoint_labels_key() -> str:
+    """
+    Return the analyzer endpoint key of the per-request label names
+    :return: the accepted labels key of the analyzer endpoint
+    """
+    return 'labels'
+
+
+def get_response_scores_key() -> str:
+    """
+    Return the response polarity scores key
+    :return: the response scores key
+    """
+    return 'scores'
+
+
+def get_not_boolean_scores_flag_message() -> str:
+    """
+    Return the message explaining that the "scores" value of the POST request JSON body is not a boolean.
+    :return: the above described message
+    """
+    scores_key = get_analyzer_endpoint_scores_key()
+    return f'POST request JSON body "{scores_key}" value is not a boolean'
+
+
+def get_invalid_threshold_message() -> str:
+    """
+    Return the message explaining that the "threshold" value of the POST request JSON body
+    is not a number greater than 0 and lower than or equal to 1.
+    :return: the above described message
+    """
+    threshold_key = get_analyzer_endpoint_threshold_key()
+    return f'POST request JSON body "{threshold_key}" value is not a number greater than 0 and at most 1'
+
+
+def get_invalid_labels_message() -> str:
+    """
+    Return the message explaining that the "labels" value of the POST request JSON body
+    is not an object mapping "positive", "neutral" or "negative" to texts.
+    :return: the above described message
+    """
+    labels_key = get_analyzer_endpoint_labels_key()
+    label_keys = [get_positivity_label_key(), get_neutrality_label_key(), get_negativity_label_key()]
+    return f'POST request JSON body "{labels_key}" value is not an object of {", ".join(label_keys)} texts'
+
+
+def get_analyzer_document_endpoint_url_suffix() -> str:
+    """
+    Return the document analyzer endpoint url suffix
+    :return: the document analyzer endpoint url suffix
+    """
+    return 'document'
+
+
+def get_max_document_length() -> int:
+    """
+    Return the max accepted length of a document sent to the document analyzer endpoint,
+    which can be overridden with the SENTIMENT_MAX_DOCUMENT_LENGTH environment variable.
+    :return: an int defaulting to 100000
+    """
+    return int(os.getenv('SENTIMENT_MAX_DOCUMENT_LENGTH', '100000'))
+
+
+def get_too_big_document_length_message() -> str:
+    """
+    Return the message associated with a too big document length 400 Bad Request response
+    :return: the above described message
+    """
+    max_document_length = str(get_max_document_length())
+    return f'Document too big (max {max_document_length} characters)'
+
+
+def get_response_sentences_key() -> str:
+    """
+    Return the response key of the document sentence results
+    :return: the response sentences key
+    """
+    return 'sentences'
+
+
+def get_response_sentence_key() -> str:
+    """
+    Return the response key of the text of a document sentence
+    :return: the response sentence key
+    """
+    return 'sentence'
+
+
+def get_pool_workers() -> int:
+    """
+    Return the number of worker processes scoring texts in parallel,
+    which can be overridden with the SENTIMENT_POOL_WORKERS environment variable (1 disables the pool).
+    :return: an int defaulting to the number of CPUs
+    """
+    return int(os.getenv('SENTIMENT_POOL_WORKERS', str(os.cpu_count() or 1)))
+
+
+def get_pool_min_texts() -> int:
+    """
+    Return the min number of texts to score for the work to be split across the worker processes,
+    which can be overridden with the SENTIMENT_POOL_MIN_TEXTS environment variable.
+    :return: an int defaulting to 64
+    """
+    return int(os.getenv('SENTIMENT_POOL_MIN_TEXTS', '64'))
+
+
+def get_pool_start_method() -> str:
+    """
+    Return the multiprocessing start method of the worker processes,
+    which can be overridden with the SENTIMENT_POOL_START_METHOD environment variable.
+    :return: the start method name defaulting to "spawn"
+    """
+    return os.getenv('SENTIMENT_POOL_START_METHOD', 'spawn')
+
+
+def get_pool_chunk_length() -> int:
+    """
+    Return the number of characters of the chunks of texts sent to the worker processes,
+    which can be overridden with the SENTIMENT_POOL_CHUNK_LENGTH environment variable.
+    :return: an int defaulting to 16384
+    """
+    return int(os.getenv('SENTIMENT_POOL_CHUNK_LENGTH', '16384'))
+
+
+def get_pool_max_restarts() -> int:
+    """
+    Return the max number of times the process pool is restarted while scoring the same texts
+    after one of its workers crashed, which can be overridden with the SENTIMENT_POOL_MAX_RESTARTS environment variable.
+    :return: an int defaulting to 2
+    """
+    return int(os.getenv('SENTIMENT_POOL_MAX_RESTARTS', '2'))
+
+
+def get_pool_stats_key() -> str:
+    """
+    Return the statistics endpoint response key of the process pool statistics
+    :return: the process pool statistics key
+    """
+    return 'pool'
+
+
+def get_jobs_endpoint_url_prefix() -> str:
+    """
+    Return the jobs endpoint url prefix
+    :return: the jobs endpoint url prefix
+    """
+    return 'jobs'
+
+
+def get_jobs_results_endpoint_url_suffix() -> str:
+    """
+    Return the job results endpoint url suffix
+    :return: the job results endpoint url suffix
+    """
+    return 'results'
+
+
+def get_job_database_path() -> str:
+    """
+    Return the path of the SQLite database storing the jobs, their inputs and their results,
+    which can be overridden with the SENTIMENT_JOB_DATABASE environment variable.
+    :return: the job database file path
+    """
+    project_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    default_job_database_path = os.path.join(project_directory, 'data', 'jobs.sqlite3')
+    return os.getenv('SENTIMENT_JOB_DATABASE', default_job_database_path)
+
+
+def get_job_workers() -> int:
+    """
+    Return the number of job worker threads started by the application or by the job service,
+    which can be overridden with the SENTIMENT_JOB_WORKERS environment variable (0 lets other processes run the jobs).
+    :return: an int defaulting to 1
+    """
+    return int(os.getenv('SENTIMENT_JOB_WORKERS', '1'))
+
+
+def get_job_chunk_size() -> int:
+    """
+    Return the number of job inputs scored and checkpointed at once,
+    which can be overridden with the SENTIMENT_JOB_CHUNK_SIZE environment variable.
+    :return: an int defaulting to 1000
+    """
+    return int(os.getenv('SENTIMENT_JOB_CHUNK_SIZE', '1000'))
+
+
+def get_job_lease_duration() -> float:
+    """
+    Return the number of seconds after which a running job whose worker stopped checkpointing
+    is resumed by another worker, which can be overridden with the SENTIMENT_JOB_LEASE_DURATION environment variable.
+    :return: a float defaulting to 60
+    """
+    return float(os.getenv('SENTIMENT_JOB_LEASE_DURATION', '60'))
+
+
+def get_job_poll_interval() -> float:
+    """
+    Return the number of seconds an idle job worker waits before looking for new jobs,
+    which can be overridden with the SENTIMENT_JOB_POLL_INTERVAL environment variable.
+    :return: a float defaulting to 1
+    """
+    return float(os.getenv('SENTIMENT_JOB_POLL_INTERVAL', '1'))
+
+
+def get_max_job_items() -> int:
+    """
+    Return the max number of inputs of a job,
+    which can be overridden with the SENTIMENT_MAX_JOB_ITEMS environment variable.
+    :return: an int defaulting to 1000000
+    """
+    return int(os.getenv('SENTIMENT_MAX_JOB_ITEMS', '1000000'))
+
+
+def get_max_job_payload_size() -> int:
+    """
+    Return the max accepted job request body size in bytes,
+    which can be overridden with the SENTIMENT_MAX_JOB_PAYLOAD_SIZE environment variable.
+    :return: an int defaulting to 268435456
+    """
+    return int(os.getenv('SENTIMENT_MAX_JOB_PAYLOAD_SIZE', '268435456'))
+
+
+def get_max_job_results_page_size() -> int:
+    """
+    Return the max number of job results returned per page
+    :return: an int containing the value 1000
+    """
+    return 1000
+
+
+def get_results_offset_parameter() -> str:
+    """
+    Return the job results endpoint query parameter of the position of the first result of the page
+    :return: the offset query parameter name
+    """
+    return 'offset'
+
+
+def get_results_limit_parameter() -> str:
+    """
+    Return the job results endpoint query parameter of the max number of results of the page
+    :return: the limit query parameter name
+    """
+    return 'limit'
+
+
+def get_response_job_id_key() -> str:
+    """
+    Return the response job id key
+    :return: the response job id key
+    """
+    return 'job_id'
+
+
+def get_response_results_key() -> str:
+    """
+    Return the response job results key
+    :return: the response results key
+    """
+    return 'results'
+
+
+def get_response_next_offset_key() -> str:
+    """
+    Return the response key of the offset of the next page of job results
+    :return: the response next offset key
+    """
+    return 'next_offset'
+
+
+def get_too_many_job_inputs_message() -> str:
+    """
+    Return the message associated with a too big job input array 400 Bad Request response
+    :return: the above described message
+    """
+    max_job_items = str(get_max_job_items())
+    return f'Too many inputs (max {max_job_items} inputs)'
+
+
+def get_too_big_job_payload_message() -> str:
+    """
+    Return the message associated with a too big job request body 400 Bad Request response
+    :return: the above described message
+    """
+    max_job_payload_size = str(get_max_job_payload_size())
+    return f'Request body too big (max {max_job_payload_size} bytes)'
+
+
+def get_unknown_job_message() -> str:
+    """
+    Return the message associated with an unknown job 404 Not Found response
+    :return: the above described message
+    """
+    return 'Job not found'
+
+
+def get_invalid_results_page_message() -> str:
+    """
+    Return the message associated with an invalid job results page 400 Bad Request response
+    :return: the above described message
+    """
+    offset_parameter = get_results_offset_parameter()
+    limit_parameter = get_results_limit_parameter()
+    max_page_size = str(get_max_job_results_page_size())
+    return f'"{offset_parameter}" must be a positive integer and "{limit_parameter}" an integer from 1 to {max_page_size}'
+
+
+def get_bulk_chunk_size() -> int:
+    """
+    Return the number of bytes of the file ranges scored by each worker process of the bulk scoring command,
+    which can be overridden with the SENTIMENT_BULK_CHUNK_SIZE environment variable.
+    :return: an int defaulting to 8388608
+    """
+    return int(os.getenv('SENTIMENT_BULK_CHUNK_SIZE', '8388608'))
+
+
+def get_bulk_write_buffer_size() -> int:
+    """
+    Return the number of bytes buffered before each write of the bulk scoring command output files
+    :return: an int equal to 1048576
+    """
+    return 1048576
+
+
+def get_live_endpoint_url_prefix() -> str:
+    """
+    Return the live analysis endpoint url prefix
+    :return: the live analysis endpoint url prefix
+    """
+    return 'live'
+
+
+def get_live_events_endpoint_url_suffix() -> str:
+    """
+    Return the live analysis event stream endpoint url suffix, appended to the live session url
+    :return: the live analysis event stream endpoint url suffix
+    """
+    return 'events'
+
+
+def get_event_stream_content_type() -> str:
+    """
+    Return the Server-Sent Events content type of the live analysis event stream endpoint
+    :return: the Server-Sent Events content type
+    """
+    return 'text/event-stream'
+
+
+def get_live_debounce_delay() -> float:
+    """
+    Return the number of seconds a live session text must stay unchanged before it is scored,
+    which can be overridden with the SENTIMENT_LIVE_DEBOUNCE_DELAY environment variable.
+    :return: a float defaulting to 0.3
+    """
+    return float(os.getenv('SENTIMENT_LIVE_DEBOUNCE_DELAY', '0.3'))
+
+
+def get_live_keep_alive_interval() -> float:
+    """
+    Return the max number of seconds between two messages of a live analysis event stream
+    :return: a float equal to 15.0
+    """
+    return 15.0
+
+
+def get_live_session_timeout() -> float:
+    """
+    Return the number of seconds after which a live session whose text was not updated expires,
+    which can be overridden with the SENTIMENT_LIVE_SESSION_TIMEOUT environment variable.
+    :return: a float defaulting to 300.0
+    """
+    return float(os.getenv('SENTIMENT_LIVE_SESSION_TIMEOUT', '300'))
+
+
+def get_live_stream_max_duration() -> float:
+    """
+    Return the max number of seconds a live analysis event stream stays open before the client has to reconnect,
+    which can be overridden with the SENTIMENT_LIVE_STREAM_MAX_DURATION environment variable.
+    :return: a float defaulting to 600.0
+    """
+    return float(os.getenv('SENTIMENT_LIVE_STREAM_MAX_DURATION', '600'))
+
+
+def get_live_update_interval() -> float:
+    """
+    Return the min number of seconds between two text updates the web page sends to its live session
+    while the user types, the last text being always sent,
+    which can be overridden with the SENTIMENT_LIVE_UPDATE_INTERVAL environment variable.
+    :return: a float defaulting to 0.3
+    """
+    return float(os.getenv('SENTIMENT_LIVE_UPDATE_INTERVAL', '0.3'))
+
+
+def get_max_live_sessions() -> int:
+    """
+    Return the max number of live sessions of a process,
+    which can be overridden with the SENTIMENT_MAX_LIVE_SESSIONS environment variable.
+    :return: an int defaulting to 1000
+    """
+    return int(os.getenv('SENTIMENT_MAX_LIVE_SESSIONS', '1000'))
+
+
+def get_response_session_id_key() -> str:
+    """
+    Return the response live session id key
+    :return: the response live session id key
+    """
+    return 'session_id'
+
+
+def get_response_rescored_key() -> str:
+    """
+    Return the response key of the number of sentences scored again by a live analysis update
+    :return: the response rescored key
+    """
+    return 'rescored'
+
+
+def get_unknown_live_session_message() -> str:
+    """
+    Return the message associated with an unknown live session 404 Not Found response
+    :return: the above described message
+    """
+    return 'Live session not found'
+
+
+def get_too_many_live_sessions_message() -> str:
+    """
+    Return the message associated with a too many live sessions 503 Service Unavailable response
+    :return: the above described message
+    """
+    max_live_sessions = str(get_max_live_sessions())
+    return f'Too many live sessions (max {max_live_sessions} sessions), please retry later'
+
+
+def get_batch_min_texts() -> int:
+    """
+    Return the min number of texts scored at once by the batch engine instead of one by one,
+    which can be overridden with the SENTIMENT_BATCH_MIN_TEXTS environment variable.
+    :return: an int defaulting to 64
+    """
+    return int(os.getenv('SENTIMENT_BATCH_MIN_TEXTS', '64'))
+
+
+def get_engine() -> str:
+    """
+    Return the name of the scoring engine used when a request does not select one,
+    which can be overridden with the SENTIMENT_ENGINE environment variable.
+    :return: a string defaulting to "vader"
+    """
+    return os.getenv('SENTIMENT_ENGINE', 'vader')
+
+
+def get_analyzer_endpoint_engine_key() -> str:
+    """
+    Return the analyzer endpoint optional scoring engine name key
+    :return: the analyzer endpoint engine key
+    """
+    return 'engine'
+
+
+def get_unknown_engine_message() -> str:
+    """
+    Return the message associated with an unknown scoring engine 400 Bad Request response
+    :return: the above described message
+    """
+    engine_key = get_analyzer_endpoint_engine_key()
+    return f'"{engine_key}" must be the name of a scoring engine'
+
+
+def get_linear_model_path() -> str:
+    """
+    Return the path of the artifact of the hashed features linear engine,
+    which can be overridden with the SENTIMENT_LINEAR_MODEL environment variable.
+    :return: the linear model artifact path
+    """
+    project_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    default_model_path = os.path.join(project_directory, 'data', 'linear_model.npz')
+    return os.getenv('SENTIMENT_LINEAR_MODEL', default_model_path)
+
+
+def get_linear_model_version() -> int:
+    """
+    Return the format version of the linear engine artifact.
+    Artifacts written with another format version are not used.
+    :return: an int containing the value 2
+    """
+    return 2
+
+
+def get_linear_training_data_path() -> str:
+    """
+    Return the path of the labelled CSV file the linear engine is trained on, which is set
+    with the SENTIMENT_LINEAR_TRAINING_DATA environment variable. The accuracy test dataset is never used,
+    so that the engine is evaluated on texts it was not trained on.
+    :return: the training data file path, empty by default
+    """
+    return os.getenv('SENTIMENT_LINEAR_TRAINING_DATA', '')
+
+
+def get_linear_holdout_fraction() -> float:
+    """
+    Return the fraction of the training texts the linear engine is evaluated on before being trained on all of them
+    :return: a float equal to 0.2
+    """
+    return 0.2
+
+
+def get_linear_feature_count() -> int:
+    """
+    Return the number of hashed features of the linear engine,
+    which can be overridden with the SENTIMENT_LINEAR_FEATURES environment variable.
+    :return: an int defaulting to 262144
+    """
+    return int(os.getenv('SENTIMENT_LINEAR_FEATURES', '262144'))
+
+
+def get_lexicon_overlay_paths() -> list[str]:
+    """
+    Return the paths of the lexicon overlay files applied on top of the VADER lexicon, later files overriding
+    earlier ones, which can be set with the SENTIMENT_LEXICON_OVERLAYS environment variable
+    as a list of paths separated by the platform path separator.
+    :return: the list of overlay file paths, empty by default
+    """
+    return [path for path in os.getenv('SENTIMENT_LEXICON_OVERLAYS', '').split(os.pathsep) if path]
+
+
+def get_lexicon_endpoint_url_prefix() -> str:
+    """
+    Return the lexicon endpoint url prefix
+    :return: the lexicon endpoint url prefix
+    """
+    return 'lexicon'
+
+
+def get_lexicon_reload_endpoint_url_suffix() -> str:
+    """
+    Return the lexicon reload endpoint url suffix
+    :return: the lexicon reload endpoint url suffix
+    """
+    return 'reload'
+
+
+def get_response_lexicon_version_key() -> str:
+    """
+    Return the lexicon endpoint response key of the lexicon version
+    :return: the lexicon version key
+    """
+    return 'version'
+
+
+def get_response_overlay_tokens_key() -> str:
+    """
+    Return the lexicon endpoint response key of the number of overlaid tokens
+    :return: the overlay tokens key
+    """
+    return 'overlay_tokens'
+
+
+def get_lexicon_stats_key() -> str:
+    """
+    Return the statistics endpoint response key of the lexicon statistics
+    :return: the lexicon statistics key
+    """
+    return 'lexicon'
+
+
+def get_invalid_lexicon_overlays_message() -> str:
+    """
+    Return the message associated with a lexicon reload 400 Bad Request or 500 Internal Server Error response
+    :return: the above described message
+    """
+    return 'Lexicon overlays could not be loaded, the previous lexicon is kept'
+
+
+def get_lexicon_reload_token() -> str:
+    """
+    Return the token the lexicon reload requests have to provide in their reload token header,
+    which can be set with the SENTIMENT_LEXICON_RELOAD_TOKEN environment variable.
+    :return: the lexicon reload token, empty by default which disables the lexicon reload endpoint
+    """
+    return os.getenv('SENTIMENT_LEXICON_RELOAD_TOKEN', '')
+
+
+def get_lexicon_reload_token_header() -> str:
+    """
+    Return the name of the request header holding the lexicon reload token
+    :return: the lexicon reload token header name
+    """
+    return 'X-Reload-Token'
+
+
+def get_forbidden_lexicon_reload_message() -> str:
+    """
+    Return the message associated with a lexicon reload 403 Forbidden response
+    :return: the above described message
+    """
+    return 'Lexicon reload requires the configured reload token'
+
+
+def get_answer_table_size() -> int:
+    """
+    Return the maximum number of single token answers kept by the analyzer, computed on first use,
+    which can be overridden with the SENTIMENT_ANSWER_TABLE_SIZE environment variable (0 disables the table).
+    :return: an int defaulting to 4096
+    """
+    return int(os.getenv('SENTIMENT_ANSWER_TABLE_SIZE', '4096'))
+
+
+def get_answer_table_stats_key() -> str:
+    """
+    Return the statistics endpoint response key of the number of single token answers
+    :return: the answer table statistics key
+    """
+    return 'answer_table'
+
+
+def get_cascade_margin() -> float:
+    """
+    Return the widening of the compound score range of an estimate within which the cascade engine scores a text
+    with VADER when a compound threshold is crossed, calibrated on the accuracy test dataset
+    with "python -m services.cascade_service" and rounded up, which can be overridden
+    with the SENTIMENT_CASCADE_MARGIN environment variable.
+    :return: a float defaulting to 0.01
+    """
+    return float(os.getenv('SENTIMENT_CASCADE_MARGIN', '0.01'))
+
+
+def get_cascade_calibration_data_path() -> str:
+    """
+    Return the path of the labelled CSV file the cascade engine margin is calibrated on,
+    which can be overridden with the SENTIMENT_CASCADE_CALIBRATION_DATA environment variable.
+    :return: the calibration data file path
+    """
+    project_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    default_calibration_data_path = os.path.join(project_directory, 'tests', 'unit', 'data', 'accuracy_test_data.csv')
+    return os.getenv('SENTIMENT_CASCADE_CALIBRATION_DATA', default_calibration_data_path)
+
+
+def get_cascade_stats_key() -> str:
+    """
+    Return the statistics endpoint response key of the cascade engine statistics
+    :return: the cascade statistics key
+    """
+    return 'cascade'
+
+
+def get_deadline_milliseconds() -> float:
+    """
+    Return the default time budget of an analyzer request in milliseconds, counted from its arrival,
+    beyond which its polarities are approximated instead of scored, 0 meaning no budget,
+    which can be overridden with the SENTIMENT_DEADLINE_MS environment variable.
+    :return: a float defaulting to 0
+    """
+    return float(os.getenv('SENTIMENT_DEADLINE_MS', '0'))
+
+
+def get_deadline_header() -> str:
+    """
+    Return the request header replacing the default time budget of an analyzer request, in milliseconds
+    :return: the deadline header name
+    """
+    return 'X-Deadline-Ms'
+
+
+def get_invalid_deadline_message() -> str:
+    """
+    Return the message explaining that the deadline header of the request is not a positive number.
+    :return: the above described message
+    """
+    return f'"{get_deadline_header()}" request header value is not a positive number of milliseconds'
+
+
+def get_deadline_cost_per_character() -> Optional[float]:
+    """
+    Return the predicted duration in microseconds of the full scoring of one input character,
+    which can be set with the SENTIMENT_DEADLINE_COST_PER_CHARACTER_US environment variable,
+    for instance to the full scoring cost printed by "python -m benchmarks.bench_deadline".
+    :return: the float cost, or None by default to measure it when the application starts
+    """
+    cost = os.getenv('SENTIMENT_DEADLINE_COST_PER_CHARACTER_US')
+    return None if cost is None else float(cost)
+
+
+def get_deadline_calibration_size() -> int:
+    """
+    Return the number of generated texts whose full scoring is timed to measure the cost per character
+    :return: an int equal to 200
+    """
+    return 200
+
+
+def get_degraded_header() -> str:
+    """
+    Return the response header marking the polarities of a response as approximated to meet its deadline
+    :return: the degraded header name
+    """
+    return 'X-Degraded'
+
+
+def get_response_degraded_key() -> str:
+    """
+    Return the response key marking the polarities of a response as approximated to meet its deadline
+    :return: the response degraded key
+    """
+    return 'degraded'
+
+
+def get_deadline_stats_key() -> str:
+    """
+    Return the statistics endpoint response key of the number of requests with a deadline and of degraded responses
+    :return: the deadline statistics key
+    """
+    return 'deadline'
@@ -0,0 +1,163 @@
+import math
+import random
+import threading
+import time
+from collections.abc import Sequence
+from typing import Optional
+
+from services import analyzer_service as an
+from services import constants_service as ct
+from services import extractor_service as ex
+
+# Number of requests that had a time budget, and number of them whose polarities were approximated
+__budgeted_count = 0
+__degraded_count = 0
+
+# Measured duration in seconds of the full scoring of one input character, None until it is measured
+__cost_per_character: Optional[float] = None
+
+# Guards the counters
+__lock = threading.Lock()
+
+# Makes concurrent requests wait for a single measure of the scoring cost per character
+__calibration_lock = threading.Lock()
+
+# Words surrounding the lexicon tokens of the generated calibration texts, some of them triggering VADER rules
+FILLER_WORDS = ['the', 'food', 'was', 'and', 'i', 'it', 'service', 'is', 'this', 'place', 'not', 'but', 'very',
+                'so', 'really', 'kind', 'of', 'we', 'had', 'a', 'at', 'least', 'never', 'too', 'much']
+
+
+def get_budget(header_value: Optional[str] = None) -> Optional[float]:
+    """
+    Return the time budget of a request in seconds, from its deadline header value in milliseconds
+    or else from the configured default one.
+    Raises a ValueError if the header value is not a positive number.
+    :param header_value: value of the deadline header of the request, None if it is missing
+    :return: the float budget, or None when the request has no budget
+    """
+    if header_value is None:
+        milliseconds = ct.get_deadline_milliseconds()
+        return milliseconds / 1000 if milliseconds > 0 else None
+    milliseconds = float(header_value)
+    if not math.isfinite(milliseconds) or milliseconds <= 0:
+        raise ValueError(f'Invalid deadline "{header_value}"')
+    return milliseconds / 1000
+
+
+def calibrate(texts: Optional[Sequence[str]] = None) -> float:
+    """
+    Measure the duration of the full scoring of one input character on this machine and use it to predict
+    the scoring duration of the requests. The provided texts, or texts generated from the lexicon,
+    denser in lexicon tokens and rule words than usual texts, are scored three times
+    and the median pass is kept, so that one pass slowed down by another thread does not count.
+    :param texts: texts to score, defaults to generated ones
+    :return: the float duration in seconds per character
+    """
+    global __cost_per_character
+    analyzer = an.get_analyzer()
+    texts = get_calibration_texts(ct.get_deadline_calibration_size()) if texts is None else texts
+    character_count = max(1, sum(len(text) for text in texts))
+    durations = []
+    for _ in range(3):
+        start = time.perf_counter()
+        for text in texts:
+            analyzer.polarity_scores(text)
+        durations.append(time.perf_counter() - start)
+    __cost_per_character = sorted(durations)[1] / character_count
+    return __cost_per_character
+
+
+def get_calibration_texts(size: int) -> list[str]:
+    """
+    Return the provided number of reproducible texts mixing lexicon tokens, in their usual casings,
+    and filler words, with trailing punctuation.
+    :param size: number of texts
+    :return: the list of generated texts
+    """
+    generator = random.Random(0)
+    lexicon_tokens = sorted(an.get_analyzer().lexicon)
+    texts = []
+    for _ in range(size):
+        words = [generator.choice(lexicon_tokens) if generator.random() < 0.3 else generator.choice(FILLER_WORDS)
+                 for _ in range(generator.randint(5, 30))]
+        words[0] = words[0].capitalize()
+        texts.append(' '.join(words) + generator.choice(['.', '!', '?', '!!', '']))
+    return texts
+
+
+def get_cost_per_character() -> float:
+    """
+    Return the predicted duration of the full scoring of one input character : the configured one if any,
+    else the one measured on this machine, measuring it once per process when the first request with a budget
+    arrives, so that the application does not pay for it when no request has a deadline.
+    :return: the float duration in seconds per character
+    """
+    configured_cost = ct.get_deadline_cost_per_character()
+    if configured_cost is not None:
+        return configured_cost / 1e6
+    cost = __cost_per_character
+    if cost is None:
+        with __calibration_lock:
+            cost = __cost_per_character
+            if cost is None:
+                cost = calibrate()
+    return cost
+
+
+def predict_cost(character_count: int) -> float:
+    """
+    Return the predicted duration of the full scoring of an input of the provided length.
+    :param character_count: number of characters of the input
+    :return: the float duration in seconds
+    """
+    return character_count * get_cost_per_character()
+
+
+def check_deadline(character_count: int, start: float, budget: Optional[float]) -> bool:
+    """
+    Return whether the full scoring of an input of the provided length would end after the deadline of its request :
+    the time elapsed since the request arrived plus the predicted scoring duration exceed the budget.
+    The elapsed time is read after the prediction, which measures the scoring cost on the first request with a budget.
+    Requests with a budget and degraded ones are counted.
+    :param character_count: number of characters of the input
+    :param start: time.perf_counter() value when the request arrived
+    :param budget: time budget of the request in seconds, None if it has no budget
+    :return: True if the polarities of the input have to be approximated, else False
+    """
+    global __budgeted_count, __degraded_count
+    if budget is None:
+        return False
+    predicted_cost = predict_cost(character_count)
+    is_degraded = time.perf_counter() - start + predicted_cost > budget
+    with __lock:
+        __budgeted_count += 1
+        __degraded_count += is_degraded
+    return is_degraded
+
+
+def get_polarities(user_input: str, engine_name: Optional[str], start: float,
+                   budget: Optional[float]) -> tuple[dict[str, float], bool]:
+    """
+    Return the polarities of the input text scored by the provided engine, or approximated from the valences
+    of its lexicon tokens when its full scoring would end after the deadline of the request.
+    :param user_input: provided input text
+    :param engine_name: name of the scoring engine, defaults to the configured one
+    :param start: time.perf_counter() value when the request arrived
+    :param budget: time budget of the request in seconds, None if it has no budget
+    :return: the (dictionary of float polarities, whether they are approximated) tuple
+    """
+    if check_deadline(len(user_input), start, budget):
+        return an.get_analyzer().approximate_scores(user_input), True
+    return ex.get_polarities(user_input, engine_name), False
+
+
+def get_stats() -> dict[str, float]:
+    """
+    Return the number of requests with a time budget, the number of them whose polarities were approximated
+    to meet their deadline and their fraction.
+    :return: the dictionary of deadline statistics
+    """
+    with __lock:
+        budgeted_count, degraded_count = __budgeted_count, __degraded_count
+    return {'budgeted': budgeted_count, 'degraded': degraded_count,
+            'degraded_fraction': degraded_count / budgeted_count if budgeted_count else 0.0}
@@ -0,0 +1,43 @@
+from typing import Optional
+
+from services import analyzer_service as an
+from services import extractor_service as ex
+from services import text_service as tx
+
+
+def get_document_polarities(document: str, engine_name: Optional[str] = None, is_approximated: bool = False
+                            ) -> tuple[dict[str, float], list[tuple[str, dict[str, float]]]]:
+    """
+    Return the polarities of every sentence of the provided document and their length-weighted average,
+    each sentence weighing its number of characters.
+    Sentences are scored together by the provided engine, in parallel across the worker processes
+    of the process pool with the VADER engine, or approximated from the valences of their lexicon tokens.
+    :param document: input document
+    :param engine_name: name of the scoring engine, defaults to the configured one
+    :param is_approximated: whether to approximate the polarities of the sentences instead of scoring them
+    :return: the (document polarities, list of (sentence, sentence polarities)) tuple
+    """
+    sentences = [document[start:end] for start, end in tx.split_sentences(document)]
+    if is_approximated:
+        analyzer = an.get_analyzer()
+        sentence_polarities = [analyzer.approximate_scores(sentence) for sentence in sentences]
+    else:
+        sentence_polarities = ex.get_all_polarities(sentences, engine_name)
+    return get_weighted_polarities(sentences, sentence_polarities), list(zip(sentences, sentence_polarities))
+
+
+def get_weighted_polarities(sentences: list[str], sentence_polarities: list[dict[str, float]]) -> dict[str, float]:
+    """
+    Return the average of the provided sentence polarities weighted by the sentence lengths,
+    rounded as the VADER polarities are.
+    :param sentences: the sentences of a document
+    :param sentence_polarities: the polarities of each sentence
+    :return: the dictionary of "neg", "neu", "pos" and "compound" document polarities
+    """
+    total_length = sum(len(sentence) for sentence in sentences)
+    weighted_polarities = {}
+    for key in ex.POLARITY_KEYS:
+        weighted_sum = sum(len(sentence) * polarities[key]
+                           for sentence, polarities in zip(sentences, sentence_polarities))
+        weighted_polarities[key] = weighted_sum / total_length if total_length else 0.0
+    return {key: round(value, 4 if key == 'compound' else 3) for key, value in weighted_polarities.items()}
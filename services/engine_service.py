@@ -0,0 +1,274 @@
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Optional
+
+from services import analyzer_service as an
+from services import cache_service as cs
+from services import cascade_service as cas
+from services import constants_service as ct
+from services import linear_service as ls
+from services import pool_service as ps
+
+# Keys of the polarities returned by the engines, in the order of the cached polarity tuples,
+# which end with the compound score
+POLARITY_KEYS = ['neg', 'neu', 'pos', 'compound']
+
+
+class Engine(ABC):
+    """
+    Sentiment scoring engine : gives the "neg", "neu" and "pos" polarities of texts, between 0 and 1,
+    and their "compound" score between -1 and 1, from which sentiments are extracted.
+    Engines are shared by every request and must be thread safe.
+    """
+
+    # Name of the engine in the registry, in the configuration and in the requests
+    name = ''
+
+    @abstractmethod
+    def warm_up(self):
+        """
+        Load what the engine needs to score texts, so that the first request does not pay for it.
+        Calling it again does nothing.
+        """
+
+    @abstractmethod
+    def score(self, text: str) -> dict[str, float]:
+        """
+        Return the polarities of the provided text.
+        :param text: input text
+        :return: the dictionary of "neg", "neu", "pos" and "compound" float polarities
+        """
+
+    def score_many(self, texts: Sequence[str]) -> list[dict[str, float]]:
+        """
+        Return the polarities of each provided text, in input order.
+        Engines override it when scoring texts together is faster than one by one.
+        :param texts: input texts
+        :return: the list of "neg", "neu", "pos" and "compound" polarity dictionaries
+        """
+        return [self.score(text) for text in texts]
+
+
+class VaderEngine(Engine):
+    """
+    VADER engine : single token texts are answered from the answer table of the analyzer,
+    proven neutral texts are answered without being scored, polarities of repeated texts
+    come from the result cache and lists of texts are scored in parallel by the process pool.
+    """
+
+    name = 'vader'
+
+    def warm_up(self):
+        """
+        Load the VADER lexicon of the shared analyzer.
+        """
+        an.warm_up()
+
+    def score(self, text: str) -> dict[str, float]:
+        """
+        Return the VADER polarities of the provided text, from the answer table when it is a single token,
+        or from the result cache when the text was already scored and the lexicon changes since then do not affect it.
+        :param text: input text
+        :return: the dictionary of "neg", "neu", "pos" and "compound" float polarities
+        """
+        analyzer = an.get_analyzer()
+        answer = analyzer.get_answer(text)
+        if answer is not None:
+            return dict(zip(POLARITY_KEYS, answer))
+        if analyzer.is_neutral(text):
+            return analyzer.get_neutral_scores(text)
+        result_cache = cs.get_result_cache()
+        polarities = result_cache.get(text, analyzer.lexicon_version, an.is_unchanged_since)
+        if polarities is None:
+            scores = analyzer.polarity_scores(text)
+            polarities = tuple(scores[key] for key in POLARITY_KEYS)
+            result_cache.put(text, polarities, analyzer.lexicon_version)
+        return dict(zip(POLARITY_KEYS, polarities))
+
+    def score_many(self, texts: Sequence[str]) -> list[dict[str, float]]:
+        """
+        Return the VADER polarities of each provided text, in input order.
+        Texts that are neither single tokens, provably neutral nor in the result cache are scored by the process pool.
+        :param texts: input texts
+        :return: the list of "neg", "neu", "pos" and "compound" polarity dictionaries
+        """
+        analyzer = an.get_analyzer()
+        result_cache = cs.get_result_cache()
+        all_polarities = []
+        missing_indexes = []
+        for index, text in enumerate(texts):
+            answer = analyzer.get_answer(text)
+            if answer is not None:
+                all_polarities.append(dict(zip(POLARITY_KEYS, answer)))
+                continue
+            if analyzer.is_neutral(text):
+                all_polarities.append(analyzer.get_neutral_scores(text))
+                continue
+            polarities = result_cache.get(text, analyzer.lexicon_version, an.is_unchanged_since)
+            if polarities is None:
+                missing_indexes.append(index)
+            all_polarities.append(None if polarities is None else dict(zip(POLARITY_KEYS, polarities)))
+        missing_texts = [texts[index] for index in missing_indexes]
+        for index, text, scores in zip(missing_indexes, missing_texts, ps.score_texts(missing_texts)):
+            all_polarities[index] = scores
+            result_cache.put(text, tuple(scores[key] for key in POLARITY_KEYS), analyzer.lexicon_version)
+        return all_polarities
+
+
+class CascadeEngine(VaderEngine):
+    """
+    Cascade engine : the polarities of a text are first estimated from the valences of its lexicon tokens,
+    and the text is only scored by the VADER engine when a rule that can change the sign of a valence applies
+    or when the estimated compound is within the calibrated margin of the compound thresholds,
+    where the estimate could get another label. The number of texts scored by VADER is counted.
+    Labels extracted with other thresholds than the extractor one are not covered by the calibration.
+    """
+
+    name = 'cascade'
+
+    def __init__(self):
+        """
+        Create the engine and its counters.
+        """
+        self._text_count = 0
+        self._escalated_count = 0
+        self._lock = threading.Lock()
+
+    def score(self, text: str) -> dict[str, float]:
+        """
+        Return the estimated polarities of the provided text, or its VADER polarities when it is escalated.
+        :param text: input text
+        :return: the dictionary of "neg", "neu", "pos" and "compound" float polarities
+        """
+        polarities = cas.get_estimate(text)
+        is_escalated = polarities is None
+        if is_escalated:
+            polarities = super().score(text)
+        self.__count(1, int(is_escalated))
+        return polarities
+
+    def score_many(self, texts: Sequence[str]) -> list[dict[str, float]]:
+        """
+        Return the polarities of each provided text, in input order, the escalated texts being scored together
+        by the VADER engine.
+        :param texts: input texts
+        :return: the list of "neg", "neu", "pos" and "compound" polarity dictionaries
+        """
+        all_polarities = [cas.get_estimate(text) for text in texts]
+        escalated_indexes = [index for index, polarities in enumerate(all_polarities) if polarities is None]
+        escalated_texts = [texts[index] for index in escalated_indexes]
+        for index, polarities in zip(escalated_indexes, super().score_many(escalated_texts)):
+            all_polarities[index] = polarities
+        self.__count(len(texts), len(escalated_indexes))
+        return all_polarities
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Return the number of texts scored by the engine, the number of them escalated to VADER and their fraction.
+        :return: the dictionary of cascade statistics
+        """
+        with self._lock:
+            text_count, escalated_count = self._text_count, self._escalated_count
+        return {'texts': text_count, 'escalated': escalated_count,
+                'escalated_fraction': escalated_count / text_count if text_count else 0.0}
+
+    def __count(self, text_count: int, escalated_count: int):
+        """
+        Add the provided numbers of scored and escalated texts to the counters.
+        :param text_count: number of scored texts
+        :param escalated_count: number of them scored by VADER
+        """
+        with self._lock:
+            self._text_count += text_count
+            self._escalated_count += escalated_count
+
+
+class LinearEngine(Engine):
+    """
+    Hashed features linear engine : a logistic regression over hashed word n-grams, loaded from its artifact,
+    which scores a list of texts with one sparse matrix multiply. Its polarities are class probabilities,
+    the compound score being the positive probability minus the negative one.
+    It is only registered when its artifact beats the majority label on held-out texts.
+    """
+
+    name = 'linear'
+
+    def __init__(self):
+        """
+        Create the engine, its model being loaded on warm-up.
+        """
+        self._model: Optional[ls.LinearModel] = None
+        self._lock = threading.Lock()
+
+    def warm_up(self):
+        """
+        Load the model from its artifact.
+        Raises a RuntimeError if the artifact is missing or stale.
+        """
+        with self._lock:
+            if self._model is None:
+                model = ls.load_model()
+                if model is None:
+                    raise RuntimeError(f'No usable linear engine artifact at {ct.get_linear_model_path()}')
+                self._model = model
+
+    def score(self, text: str) -> dict[str, float]:
+        """
+        Return the polarities of the provided text.
+        :param text: input text
+        :return: the dictionary of "neg", "neu", "pos" and "compound" float polarities
+        """
+        return self.score_many([text])[0]
+
+    def score_many(self, texts: Sequence[str]) -> list[dict[str, float]]:
+        """
+        Return the polarities of each provided text, in input order, computed all at once.
+        :param texts: input texts
+        :return: the list of "neg", "neu", "pos" and "compound" polarity dictionaries
+        """
+        if self._model is None:
+            self.warm_up()
+        return self._model.score_many(texts)
+
+
+# Registered engines, by name
+__engines: dict[str, Engine] = {}
+
+# Guards the registration of the engines
+__lock = threading.Lock()
+
+
+def register_engine(engine: Engine):
+    """
+    Make the provided engine selectable by its name, replacing the engine registered with the same name.
+    :param engine: the engine to register
+    """
+    with __lock:
+        __engines[engine.name] = engine
+
+
+def get_engine(name: Optional[str] = None) -> Engine:
+    """
+    Return the registered engine of the provided name.
+    :param name: name of a registered engine, defaults to the configured one
+    :return: the shared Engine instance
+    """
+    name = ct.get_engine() if name is None else name
+    if name not in __engines:
+        raise ValueError(f'Unknown scoring engine "{name}" (expected one of {", ".join(get_engine_names())})')
+    return __engines[name]
+
+
+def get_engine_names() -> list[str]:
+    """
+    Return the names of the registered engines.
+    :return: the sorted list of engine names
+    """
+    return sorted(__engines)
+
+
+register_engine(VaderEngine())
+if ls.beats_baseline():
+    register_engine(LinearEngine())
+register_engine(CascadeEngine())
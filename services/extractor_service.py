@@ -1,16 +1,70 @@
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+from collections.abc import Sequence
+from typing import Optional
+
 from services import constants_service as ct
+from services import engine_service as es
+
+# Keys of the polarities returned by the engines, in the order of the cached polarity tuples,
+# which end with the compound score
+POLARITY_KEYS = es.POLARITY_KEYS
 
 
-def get_sentiment(user_input: str) -> str:
+def get_sentiment(user_input: str, engine_name: Optional[str] = None) -> str:
     """
     Return a string containing the extracted sentiment from the input text.
     :param user_input: provided input text
+    :param engine_name: name of the scoring engine, defaults to the configured one
     :return: the extracted sentiment (between "positive", "neutral" and "negative")
     """
-    analyzer = SentimentIntensityAnalyzer()
-    polarities = analyzer.polarity_scores(user_input)
-    return __extract(polarities['compound'])
+    return __extract(get_polarities(user_input, engine_name)['compound'])
+
+
+def get_polarities(user_input: str, engine_name: Optional[str] = None) -> dict[str, float]:
+    """
+    Return the "neg", "neu", "pos" and "compound" polarities of the input text, scored by the provided engine.
+    :param user_input: provided input text
+    :param engine_name: name of the scoring engine, defaults to the configured one
+    :return: the dictionary of float polarities
+    """
+    return es.get_engine(engine_name).score(user_input)
+
+
+def get_all_polarities(user_inputs: Sequence[str], engine_name: Optional[str] = None) -> list[dict[str, float]]:
+    """
+    Return the polarities of each input text, in input order, scored together by the provided engine.
+    :param user_inputs: provided input texts
+    :param engine_name: name of the scoring engine, defaults to the configured one
+    :return: the list of "neg", "neu", "pos" and "compound" polarity dictionaries
+    """
+    return es.get_engine(engine_name).score_many(user_inputs)
+
+
+def get_sentiments(user_inputs: Sequence[str], engine_name: Optional[str] = None) -> list[str]:
+    """
+    Return the extracted sentiment of each input text, in input order, scored together by the provided engine.
+    :param user_inputs: provided input texts
+    :param engine_name: name of the scoring engine, defaults to the configured one
+    :return: the extracted sentiments (between "positive", "neutral" and "negative")
+    """
+    return [__extract(polarities['compound']) for polarities in get_all_polarities(user_inputs, engine_name)]
+
+
+def get_label(compound: float, threshold: Optional[float] = None, labels: Optional[dict[str, str]] = None) -> str:
+    """
+    Return the sentiment label of the provided float compound, with the provided threshold and label names.
+    :param compound: float sentiment score adjusted between -1 and 1
+    :param threshold: minimum absolute compound of a polar sentiment, defaults to the extractor threshold
+    :param labels: names to use instead of the default ones, by "positive", "neutral" and "negative" key
+    :return: the extracted sentiment (between "positive", "neutral" and "negative")
+    """
+    threshold = ct.get_threshold() if threshold is None else threshold
+    labels = labels or {}
+    if compound >= threshold:
+        return labels.get(ct.get_positivity_label_key(), ct.get_positivity_label())
+    elif compound <= -threshold:
+        return labels.get(ct.get_negativity_label_key(), ct.get_negativity_label())
+    else:
+        return labels.get(ct.get_neutrality_label_key(), ct.get_neutrality_label())
 
 
 def __extract(compound: float) -> str:
@@ -19,9 +73,4 @@ def __extract(compound: float) -> str:
     :param compound: float sentiment score adjusted between -1 and 1
     :return: the extracted sentiment (between "positive", "neutral" and "negative")
     """
-    if compound >= ct.get_threshold():
-        return ct.get_positivity_label()
-    elif compound <= -ct.get_threshold():
-        return ct.get_negativity_label()
-    else:
-        return ct.get_neutrality_label()
\ No newline at end of file
+    return get_label(compound)
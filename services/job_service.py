@@ -0,0 +1,290 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from services import constants_service as ct
+from services import extractor_service as ex
+
+# Tables of the job store : one row per job, per job input and per job result
+JOB_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    done INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_until REAL NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at);
+CREATE TABLE IF NOT EXISTS job_inputs (
+    job_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    input TEXT,
+    error TEXT,
+    PRIMARY KEY (job_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS job_results (
+    job_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    result TEXT NOT NULL,
+    PRIMARY KEY (job_id, position)
+) WITHOUT ROWID;
+'''
+
+# Job statuses
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+# Errors of the scoring of a job chunk meaning that its inputs can not be scored, which fail the job :
+# other errors, such as a locked job store or a process pool restarting a crashed worker, are transient
+# and put the job back in the queue
+INPUT_ERRORS = (ValueError, TypeError)
+
+# Job worker threads of the current process
+__workers: list[threading.Thread] = []
+
+# Tells the job worker threads of the current process to stop
+__stop_event = threading.Event()
+
+# Paths of the job stores whose tables were created by the current process
+__initialized_paths: set[str] = set()
+
+# Guards the creation of the job store tables
+__lock = threading.Lock()
+
+
+def submit_job(user_inputs: list, error_messages: list[Optional[str]]) -> str:
+    """
+    Durably store a new job scoring the provided inputs and queue it.
+    :param user_inputs: the inputs of the job
+    :param error_messages: for each input, the reason why it is invalid, or None if it is valid
+    :return: the id of the job
+    """
+    job_id = uuid.uuid4().hex
+    now = time.time()
+    with __connect() as connection:
+        connection.execute('INSERT INTO jobs (id, status, total, created_at, updated_at) VALUES (?, ?, ?, ?, ?)',
+                           (job_id, QUEUED, len(user_inputs), now, now))
+        connection.executemany('INSERT INTO job_inputs (job_id, position, input, error) VALUES (?, ?, ?, ?)',
+                               ((job_id, position, None if error is not None else user_input, error)
+                                for position, (user_input, error) in enumerate(zip(user_inputs, error_messages))))
+    return job_id
+
+
+def get_job(job_id: str) -> Optional[dict]:
+    """
+    Return the status and progress of the provided job.
+    :param job_id: the id of a job
+    :return: the dictionary of "status", "total", "done" and "error" job fields, or None if the job does not exist
+    """
+    with __connect() as connection:
+        row = connection.execute('SELECT status, total, done, error FROM jobs WHERE id = ?', (job_id,)).fetchone()
+    if row is None:
+        return None
+    return dict(zip(['status', 'total', 'done', 'error'], row))
+
+
+def get_job_results(job_id: str, offset: int, limit: int) -> list[dict[str, str]]:
+    """
+    Return a page of the results already computed for the provided job, in input order.
+    :param job_id: the id of a job
+    :param offset: position of the first result of the page
+    :param limit: max number of results of the page
+    :return: the list of sentiment or error message dictionaries
+    """
+    with __connect() as connection:
+        rows = connection.execute('SELECT result FROM job_results WHERE job_id = ? AND position >= ? '
+                                  'ORDER BY position LIMIT ?', (job_id, offset, limit)).fetchall()
+    return [json.loads(result) for result, in rows]
+
+
+def process_next_job(worker_id: str) -> bool:
+    """
+    Claim the oldest queued job, or a running job whose worker stopped renewing its lease,
+    and score its remaining inputs chunk by chunk. Each chunk of results is stored along with the job progress
+    in a single transaction, so an interrupted job resumes from its last stored chunk.
+    A job whose inputs can not be scored is marked failed. After a transient error, the job is put back
+    in the queue with its progress, or resumed by another worker once its lease expires
+    if the job store can not be updated.
+    :param worker_id: unique id of the calling worker
+    :return: True if a job was processed, False if there was none to process or it was put back in the queue
+    """
+    job_id = __claim_job(worker_id)
+    if job_id is None:
+        return False
+    try:
+        while __process_next_chunk(job_id, worker_id):
+            pass
+    except INPUT_ERRORS as error:
+        with __connect() as connection:
+            connection.execute('UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE id = ? AND worker = ?',
+                               (FAILED, str(error), time.time(), job_id, worker_id))
+    except Exception:
+        __release_job(job_id, worker_id)
+        return False
+    return True
+
+
+def start_workers(worker_count: Optional[int] = None):
+    """
+    Start the provided number of job worker threads in the current process,
+    each one processing jobs until stop_workers is called.
+    :param worker_count: number of worker threads, defaults to the configured one
+    """
+    worker_count = ct.get_job_workers() if worker_count is None else worker_count
+    __stop_event.clear()
+    for _ in range(worker_count):
+        worker = threading.Thread(target=__run_worker, args=(uuid.uuid4().hex,), daemon=True)
+        worker.start()
+        __workers.append(worker)
+
+
+def stop_workers():
+    """
+    Stop the job worker threads of the current process once they finish their current chunk.
+    """
+    __stop_event.set()
+    while __workers:
+        __workers.pop().join()
+
+
+def __run_worker(worker_id: str):
+    """
+    Process jobs until the workers are stopped, waiting for new jobs when there are none.
+    :param worker_id: unique id of the worker
+    """
+    while not __stop_event.is_set():
+        if not process_next_job(worker_id):
+            __stop_event.wait(ct.get_job_poll_interval())
+
+
+def __claim_job(worker_id: str) -> Optional[str]:
+    """
+    Atomically take the lease of the oldest job to process.
+    :param worker_id: unique id of the calling worker
+    :return: the id of the claimed job, or None if there is no job to process
+    """
+    now = time.time()
+    lease_until = now + ct.get_job_lease_duration()
+    with __connect() as connection:
+        connection.execute('UPDATE jobs SET status = ?, worker = ?, lease_until = ?, updated_at = ? '
+                           'WHERE id = (SELECT id FROM jobs WHERE status = ? OR (status = ? AND lease_until < ?) '
+                           'ORDER BY created_at LIMIT 1)',
+                           (RUNNING, worker_id, lease_until, now, QUEUED, RUNNING, now))
+        row = connection.execute('SELECT id FROM jobs WHERE status = ? AND worker = ? AND lease_until = ?',
+                                 (RUNNING, worker_id, lease_until)).fetchone()
+    return None if row is None else row[0]
+
+
+def __release_job(job_id: str, worker_id: str):
+    """
+    Put the provided job back in the queue, keeping its progress, unless another worker took it over.
+    The job lease is left to expire if the job store can not be updated.
+    :param job_id: the id of the claimed job
+    :param worker_id: unique id of the worker owning the job lease
+    """
+    try:
+        with __connect() as connection:
+            connection.execute('UPDATE jobs SET status = ?, worker = NULL, lease_until = 0, updated_at = ? '
+                               'WHERE id = ? AND worker = ? AND status = ?',
+                               (QUEUED, time.time(), job_id, worker_id, RUNNING))
+    except sqlite3.Error:
+        pass
+
+
+def __process_next_chunk(job_id: str, worker_id: str) -> bool:
+    """
+    Score the next chunk of inputs of the provided job and store its results, its progress and a renewed lease,
+    unless another worker took the job over in the meantime.
+    :param job_id: the id of the claimed job
+    :param worker_id: unique id of the worker owning the job lease
+    :return: True if inputs remain to be scored, False if the job is done or lost
+    """
+    with __connect() as connection:
+        total, done = connection.execute('SELECT total, done FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        rows = connection.execute('SELECT position, input, error FROM job_inputs WHERE job_id = ? AND position >= ? '
+                                  'ORDER BY position LIMIT ?', (job_id, done, ct.get_job_chunk_size())).fetchall()
+    valid_inputs = [user_input for _, user_input, error in rows if error is None]
+    all_polarities = iter(ex.get_all_polarities(valid_inputs))
+    results = [(job_id, position, json.dumps(__get_result(error, all_polarities))) for position, _, error in rows]
+    now = time.time()
+    done += len(rows)
+    with __connect() as connection:
+        updated = connection.execute('UPDATE jobs SET status = ?, done = ?, lease_until = ?, updated_at = ? '
+                                     'WHERE id = ? AND worker = ? AND status = ?',
+                                     (DONE if done >= total else RUNNING, done, now + ct.get_job_lease_duration(),
+                                      now, job_id, worker_id, RUNNING)).rowcount
+        if updated:
+            connection.executemany('INSERT OR REPLACE INTO job_results (job_id, position, result) VALUES (?, ?, ?)',
+                                   results)
+    return bool(updated) and done < total
+
+
+def __get_result(error: Optional[str], all_polarities: Iterator[dict[str, float]]) -> dict[str, str]:
+    """
+    Return the result of a job input : its error message if it is invalid,
+    else its sentiment extracted from the next polarities of the valid inputs.
+    :param error: the reason why the input is invalid, or None if it is valid
+    :param all_polarities: iterator over the polarities of the valid inputs of the chunk
+    :return: the sentiment or error message dictionary
+    """
+    if error is not None:
+        return {ct.get_response_message_key(): error}
+    return {ct.get_response_sentiment_key(): ex.get_label(next(all_polarities)['compound'])}
+
+
+@contextmanager
+def __connect() -> Iterator[sqlite3.Connection]:
+    """
+    Open a connection to the job store, creating its tables on the first connection of the process,
+    commit its transaction if no error occurred and close it.
+    :return: an iterator over the SQLite connection
+    """
+    database_path = ct.get_job_database_path()
+    if database_path not in __initialized_paths:
+        __initialize(database_path)
+    connection = sqlite3.connect(database_path, timeout=30)
+    try:
+        with connection:
+            yield connection
+    finally:
+        connection.close()
+
+
+def __initialize(database_path: str):
+    """
+    Create the directory and the tables of the provided job store if needed, in write-ahead logging mode,
+    which is persistent, once per process.
+    :param database_path: path of the job store
+    """
+    with __lock:
+        if database_path in __initialized_paths:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(database_path)), exist_ok=True)
+        connection = sqlite3.connect(database_path, timeout=30)
+        try:
+            connection.execute('PRAGMA journal_mode = WAL')
+            connection.executescript(JOB_SCHEMA)
+        finally:
+            connection.close()
+        __initialized_paths.add(database_path)
+
+
+if __name__ == '__main__':
+    start_workers()
+    print(f'{len(__workers)} job workers processing jobs from {ct.get_job_database_path()}')
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        stop_workers()
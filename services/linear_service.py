@@ -0,0 +1,238 @@
+import argparse
+import json
+import os
+from collections.abc import Sequence
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from services import constants_service as ct
+
+# Pattern of the hashed tokens : words, and runs of punctuation such as "!!" or ":)"
+TOKEN_PATTERN = r'(?u)\b\w+\b|[^\w\s]+'
+
+# Word n-gram lengths of the hashed features
+NGRAM_RANGE = (1, 2)
+
+# Inverse regularization strength of the logistic regression
+REGULARIZATION = 10.0
+
+
+class LinearModel:
+    """
+    Logistic regression over hashed word n-gram features : the polarities of a batch of texts are computed
+    with one sparse matrix multiply of their hashed features by the weights of the negative, neutral
+    and positive classes, followed by a softmax. The hashing vectorizer is stateless,
+    so the model is fully described by its non zero weights. Models trained from a file also hold
+    their held-out accuracy and the one of always predicting the majority label.
+    """
+
+    def __init__(self, feature_count: int, weights: np.ndarray, intercepts: np.ndarray):
+        """
+        Create a model from its weights.
+        :param feature_count: number of hashed features
+        :param weights: (feature count, 3) array of the negative, neutral and positive class weights
+        :param intercepts: array of the 3 class intercepts
+        """
+        self.feature_count = feature_count
+        self.weights = weights.astype(np.float32)
+        self.intercepts = intercepts.astype(np.float32)
+        self.accuracy: Optional[float] = None
+        self.baseline: Optional[float] = None
+        self._vectorizer = get_vectorizer(feature_count)
+
+    def score_many(self, texts: Sequence[str]) -> list[dict[str, float]]:
+        """
+        Return the polarities of each provided text, in input order : the "neg", "neu" and "pos" class probabilities
+        and the "compound" difference between the positive and negative ones, rounded like VADER scores.
+        :param texts: input texts
+        :return: the list of "neg", "neu", "pos" and "compound" polarity dictionaries
+        """
+        if not texts:
+            return []
+        logits = self._vectorizer.transform(texts) @ self.weights + self.intercepts
+        probabilities = np.exp(logits - logits.max(axis=1, keepdims=True))
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        compounds = probabilities[:, 2] - probabilities[:, 0]
+        return [{'neg': round(float(neg), 3), 'neu': round(float(neu), 3), 'pos': round(float(pos), 3),
+                 'compound': round(float(compound), 4)}
+                for (neg, neu, pos), compound in zip(probabilities.tolist(), compounds.tolist())]
+
+
+def get_vectorizer(feature_count: int):
+    """
+    Return the hashing vectorizer turning texts into l2 normalized counts of hashed word n-grams.
+    scikit-learn is imported on first use, so that the application does not pay for it
+    when the linear engine is not used.
+    :param feature_count: number of hashed features
+    :return: the HashingVectorizer instance
+    """
+    from sklearn.feature_extraction.text import HashingVectorizer
+    return HashingVectorizer(n_features=feature_count, ngram_range=NGRAM_RANGE, token_pattern=TOKEN_PATTERN,
+                             alternate_sign=False)
+
+
+def train_model(texts: Sequence[str], ratings: Sequence[float], feature_count: Optional[int] = None) -> LinearModel:
+    """
+    Return a model trained on the provided texts, labelled negative, neutral or positive
+    from their rating and the extractor threshold.
+    :param texts: training texts
+    :param ratings: sentiment rating of each text, between -1 and 1
+    :param feature_count: number of hashed features, defaults to the configured one
+    :return: the trained LinearModel
+    """
+    from sklearn.linear_model import LogisticRegression
+    feature_count = feature_count or ct.get_linear_feature_count()
+    ratings = np.asarray(ratings, dtype=np.float64)
+    classes = __get_classes(ratings)
+    features = get_vectorizer(feature_count).transform(texts)
+    classifier = LogisticRegression(C=REGULARIZATION, max_iter=1000)
+    classifier.fit(features, classes)
+    if len(classifier.classes_) == 2:
+        coefficients = np.vstack([-classifier.coef_, classifier.coef_]) / 2
+        class_intercepts = np.concatenate([-classifier.intercept_, classifier.intercept_]) / 2
+    else:
+        coefficients, class_intercepts = classifier.coef_, classifier.intercept_
+    # Classes missing from the training texts keep a null probability
+    weights = np.zeros((feature_count, 3))
+    intercepts = np.full(3, -np.inf)
+    weights[:, classifier.classes_] = coefficients.T
+    intercepts[classifier.classes_] = class_intercepts
+    return LinearModel(feature_count, weights, intercepts)
+
+
+def train_model_from_file(training_data_path: Optional[str] = None) -> LinearModel:
+    """
+    Return a model trained on a CSV file with a "text_snippet" text column and a "mean_sentiment_rating" column,
+    along with its held-out accuracy and the one of the majority label : the model is first trained
+    on a stratified part of the texts and evaluated on the others, then trained on all of them.
+    Raises a ValueError if no training data is configured.
+    :param training_data_path: path of the training CSV file, defaults to the configured one
+    :return: the trained LinearModel, with its accuracy and baseline
+    """
+    from sklearn.model_selection import train_test_split
+    training_data_path = training_data_path or ct.get_linear_training_data_path()
+    if not training_data_path:
+        raise ValueError('No linear engine training data, set SENTIMENT_LINEAR_TRAINING_DATA')
+    training_data = pd.read_csv(training_data_path)
+    texts = training_data['text_snippet'].tolist()
+    ratings = training_data['mean_sentiment_rating'].tolist()
+    classes = __get_classes(ratings)
+    train_texts, test_texts, train_ratings, test_ratings = train_test_split(
+        texts, ratings, test_size=ct.get_linear_holdout_fraction(), random_state=0, stratify=classes)
+    test_classes = __get_classes(test_ratings)
+    held_out_polarities = train_model(train_texts, train_ratings).score_many(test_texts)
+    predicted_classes = __get_classes([polarities['compound'] for polarities in held_out_polarities])
+    majority_class = np.bincount(__get_classes(train_ratings), minlength=3).argmax()
+    model = train_model(texts, ratings)
+    model.accuracy = float(np.mean(predicted_classes == test_classes))
+    model.baseline = float(np.mean(test_classes == majority_class))
+    return model
+
+
+def save_model(model: LinearModel, model_path: Optional[str] = None) -> str:
+    """
+    Write the provided model to a compressed artifact holding only its non zero weight rows.
+    :param model: the model to save
+    :param model_path: path of the artifact to write, defaults to the configured one
+    :return: the path of the written artifact
+    """
+    model_path = model_path or ct.get_linear_model_path()
+    features = np.flatnonzero(model.weights.any(axis=1)).astype(np.int32)
+    parameters = {'version': ct.get_linear_model_version(), 'feature_count': model.feature_count,
+                  'token_pattern': TOKEN_PATTERN, 'ngram_range': list(NGRAM_RANGE),
+                  'accuracy': model.accuracy, 'baseline': model.baseline}
+    os.makedirs(os.path.dirname(os.path.abspath(model_path)), exist_ok=True)
+    temporary_path = f'{model_path}.tmp'
+    with open(temporary_path, 'wb') as model_file:
+        np.savez_compressed(model_file, parameters=np.array(json.dumps(parameters)), features=features,
+                            weights=model.weights[features], intercepts=model.intercepts)
+    os.replace(temporary_path, model_path)
+    return model_path
+
+
+def load_model(model_path: Optional[str] = None) -> Optional[LinearModel]:
+    """
+    Return the model of the provided artifact, or None if it is missing, unreadable
+    or written for other features.
+    :param model_path: path of the artifact to read, defaults to the configured one
+    :return: the LinearModel, or None if it can not be used
+    """
+    model_path = model_path or ct.get_linear_model_path()
+    try:
+        with np.load(model_path, allow_pickle=False) as artifact:
+            parameters = __get_parameters(artifact)
+            if parameters is None:
+                return None
+            weights = np.zeros((parameters['feature_count'], 3), dtype=np.float32)
+            weights[artifact['features']] = artifact['weights']
+            model = LinearModel(parameters['feature_count'], weights, artifact['intercepts'])
+    except (OSError, KeyError, ValueError):
+        return None
+    model.accuracy, model.baseline = parameters.get('accuracy'), parameters.get('baseline')
+    return model
+
+
+def beats_baseline(model_path: Optional[str] = None) -> bool:
+    """
+    Return whether the model of the provided artifact was evaluated on held-out texts with a higher accuracy
+    than always predicting the majority label, without loading its weights.
+    The linear engine is only selectable when it does.
+    :param model_path: path of the artifact to read, defaults to the configured one
+    :return: True if the model beats the majority label, else False
+    """
+    try:
+        with np.load(model_path or ct.get_linear_model_path(), allow_pickle=False) as artifact:
+            parameters = __get_parameters(artifact)
+    except (OSError, KeyError, ValueError):
+        return False
+    return parameters is not None and isinstance(parameters.get('accuracy'), float) \
+        and isinstance(parameters.get('baseline'), float) and parameters['accuracy'] > parameters['baseline']
+
+
+def __get_parameters(artifact) -> Optional[dict]:
+    """
+    Return the parameters of the provided artifact, or None if it was written for other features.
+    :param artifact: the opened NpzFile of a model artifact
+    :return: the dictionary of the artifact parameters, or None
+    """
+    parameters = json.loads(str(artifact['parameters']))
+    expected_parameters = {'version': ct.get_linear_model_version(), 'token_pattern': TOKEN_PATTERN,
+                           'ngram_range': list(NGRAM_RANGE)}
+    if any(parameters.get(key) != value for key, value in expected_parameters.items()):
+        return None
+    return parameters
+
+
+def __get_classes(ratings: Sequence[float]) -> np.ndarray:
+    """
+    Return the negative (0), neutral (1) or positive (2) class of each provided rating or compound score,
+    from the extractor threshold.
+    :param ratings: sentiment ratings between -1 and 1
+    :return: the int array of classes
+    """
+    ratings = np.asarray(ratings, dtype=np.float64)
+    return np.where(ratings >= ct.get_threshold(), 2, np.where(ratings <= -ct.get_threshold(), 0, 1))
+
+
+def main():
+    """
+    Train a model on the provided CSV file, write its artifact and print its held-out accuracy
+    against the majority label one.
+    """
+    parser = argparse.ArgumentParser(description='Train the hashed features linear engine and write its artifact')
+    training_data_path = ct.get_linear_training_data_path()
+    parser.add_argument('--data', default=training_data_path, required=not training_data_path,
+                        help='CSV file with "text_snippet" and "mean_sentiment_rating" columns')
+    parser.add_argument('--output', default=ct.get_linear_model_path())
+    arguments = parser.parse_args()
+    model = train_model_from_file(arguments.data)
+    model_path = save_model(model, arguments.output)
+    print(f'Linear model written to {model_path} ({os.path.getsize(model_path)} bytes)')
+    status = 'selectable' if model.accuracy > model.baseline else 'not selectable, below the majority label'
+    print(f'held-out accuracy {model.accuracy:.3f}, majority label {model.baseline:.3f}, engine {status}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+import threading
+import time
+import uuid
+from typing import Optional
+
+from services import constants_service as ct
+from services import document_service as ds
+from services import extractor_service as ex
+from services import text_service as tx
+
+# Live sessions of the current process, by session id
+__sessions: dict[str, 'LiveSession'] = {}
+
+# Guards the creation, the lookup and the expiry of the live sessions
+__lock = threading.Lock()
+
+
+class LiveSession:
+    """
+    Text being typed by one user, updated on every keystroke and scored incrementally once the user pauses :
+    only the sentences that changed since the previous scoring are scored again.
+    """
+
+    def __init__(self):
+        """
+        Create a session without text.
+        """
+        self.updated_at = time.monotonic()
+        self._condition = threading.Condition()
+        self._text = ''
+        self._version = 0
+        self._scored_version = 0
+        self._sentence_polarities: dict[str, dict[str, float]] = {}
+
+    def update(self, text: str):
+        """
+        Replace the text of the session and wake up the event stream waiting for it.
+        :param text: the whole text typed so far
+        """
+        with self._condition:
+            self._text = text
+            self._version += 1
+            self.updated_at = time.monotonic()
+            self._condition.notify_all()
+
+    def wait_for_text(self, debounce_delay: float, timeout: float) -> Optional[str]:
+        """
+        Wait for the text to change, then for the provided delay to pass without any other change,
+        so that a burst of keystrokes is scored once.
+        :param debounce_delay: seconds without change after which the text is returned
+        :param timeout: max seconds to wait for a change
+        :return: the latest text, or None if it did not change before the timeout
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while self._version == self._scored_version:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+            while True:
+                quiet = time.monotonic() - self.updated_at
+                if quiet >= debounce_delay:
+                    break
+                self._condition.wait(debounce_delay - quiet)
+            self._scored_version = self._version
+            return self._text
+
+    def score(self, text: str) -> tuple[dict[str, float], list[tuple[str, dict[str, float]]], int]:
+        """
+        Return the polarities of the provided text and of each of its sentences, scoring only the sentences
+        that were not part of the previously scored text.
+        :param text: the text to score
+        :return: the (text polarities, list of (sentence, sentence polarities), number of scored sentences) tuple
+        """
+        sentences = [text[start:end] for start, end in tx.split_sentences(text)]
+        previous_polarities = self._sentence_polarities
+        changed_sentences = [sentence for sentence in dict.fromkeys(sentences) if sentence not in previous_polarities]
+        changed_polarities = dict(zip(changed_sentences, ex.get_all_polarities(changed_sentences)))
+        self._sentence_polarities = {sentence: previous_polarities.get(sentence) or changed_polarities[sentence]
+                                     for sentence in sentences}
+        sentence_polarities = [self._sentence_polarities[sentence] for sentence in sentences]
+        return (ds.get_weighted_polarities(sentences, sentence_polarities), list(zip(sentences, sentence_polarities)),
+                len(changed_sentences))
+
+
+def create_session() -> Optional[str]:
+    """
+    Create a live session, after removing the sessions whose text was not updated for longer
+    than the configured timeout, whether their event stream is open or not.
+    :return: the id of the new session, or None if the max number of sessions is reached
+    """
+    with __lock:
+        for session_id, session in list(__sessions.items()):
+            if is_expired(session):
+                del __sessions[session_id]
+        if len(__sessions) >= ct.get_max_live_sessions():
+            return None
+        session_id = uuid.uuid4().hex
+        __sessions[session_id] = LiveSession()
+    return session_id
+
+
+def get_session(session_id: str) -> Optional[LiveSession]:
+    """
+    Return the provided live session, removing it if it expired.
+    :param session_id: the id of a live session
+    :return: the LiveSession, or None if it does not exist or expired
+    """
+    with __lock:
+        session = __sessions.get(session_id)
+        if session is not None and is_expired(session):
+            del __sessions[session_id]
+            return None
+        return session
+
+
+def is_expired(session: LiveSession) -> bool:
+    """
+    Return whether the text of the provided live session was not updated for longer than the configured timeout.
+    Event stream keep-alives do not count as updates, so an open stream does not keep an idle session alive.
+    :param session: a live session
+    :return: True if the session expired, else False
+    """
+    return time.monotonic() - session.updated_at > ct.get_live_session_timeout()
@@ -0,0 +1,150 @@
+import hashlib
+import mmap
+import os
+import struct
+import zlib
+from collections.abc import Mapping
+from typing import Iterator, Optional
+
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from services import constants_service as ct
+from services import snapshot_service as ss
+
+# Leading bytes identifying a memory-mapped lexicon file
+MAPPED_LEXICON_MAGIC = b'VADERLEX'
+
+# Header following the magic bytes : format version, number of words, number of hash buckets,
+# digest of the lexicon sources
+MAPPED_LEXICON_HEADER = struct.Struct('<III32s')
+
+# File offset of the valence array, aligned on 8 bytes
+VALENCES_OFFSET = (len(MAPPED_LEXICON_MAGIC) + MAPPED_LEXICON_HEADER.size + 7) // 8 * 8
+
+
+class MappedLexicon(Mapping):
+    """
+    Read-only word to valence mapping backed by a memory-mapped file.
+    Words are stored as UTF-8 bytes sorted by hash bucket with an offsets array,
+    next to a float64 valence array and a bucket start array, so that every worker process
+    mapping the same file shares its pages instead of holding its own dictionary.
+    """
+
+    def __init__(self, lexicon_path: str):
+        """
+        Map the provided lexicon file in memory.
+        :param lexicon_path: path of a file written by build_mapped_lexicon
+        """
+        self.lexicon_path = lexicon_path
+        with open(lexicon_path, 'rb') as lexicon_file:
+            self._buffer = mmap.mmap(lexicon_file.fileno(), 0, access=mmap.ACCESS_READ)
+        header_start = len(MAPPED_LEXICON_MAGIC)
+        if self._buffer[:header_start] != MAPPED_LEXICON_MAGIC:
+            raise ValueError(f'{lexicon_path} is not a mapped lexicon file')
+        version, self._count, self._bucket_count, sources_digest = \
+            MAPPED_LEXICON_HEADER.unpack_from(self._buffer, header_start)
+        if version != ct.get_mapped_lexicon_version() or sources_digest != get_sources_digest():
+            raise ValueError(f'{lexicon_path} is a stale mapped lexicon file')
+        offsets_start = VALENCES_OFFSET + 8 * self._count
+        buckets_start = offsets_start + 4 * (self._count + 1)
+        buckets_end = buckets_start + 4 * (self._bucket_count + 1)
+        view = memoryview(self._buffer)
+        self._valences = view[VALENCES_OFFSET:offsets_start].cast('d')
+        self._offsets = view[offsets_start:buckets_start].cast('I')
+        self._buckets = view[buckets_start:buckets_end].cast('I')
+
+    def __getitem__(self, word: str) -> float:
+        index = self._find(word)
+        if index < 0:
+            raise KeyError(word)
+        return self._valences[index]
+
+    def __contains__(self, word: object) -> bool:
+        return self._find(word) >= 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        offsets = self._offsets
+        for index in range(self._count):
+            yield self._buffer[offsets[index]:offsets[index + 1]].decode('utf-8')
+
+    def __reduce__(self):
+        return MappedLexicon, (self.lexicon_path,)
+
+    def _find(self, word: object) -> int:
+        """
+        Return the index of the provided word by scanning the words of its hash bucket, or -1.
+        :param word: word to look for
+        :return: the index of the word, or -1 if it is not in the lexicon
+        """
+        if not isinstance(word, str):
+            return -1
+        target = word.encode('utf-8')
+        bucket = zlib.crc32(target) % self._bucket_count
+        buffer, offsets = self._buffer, self._offsets
+        for index in range(self._buckets[bucket], self._buckets[bucket + 1]):
+            if buffer[offsets[index]:offsets[index + 1]] == target:
+                return index
+        return -1
+
+
+def build_mapped_lexicon(lexicon: Mapping, lexicon_path: Optional[str] = None) -> str:
+    """
+    Write the provided word to valence mapping as a memory-mappable lexicon file.
+    :param lexicon: word to valence mapping to write
+    :param lexicon_path: path of the file to write, defaults to the configured one
+    :return: the path of the written file
+    """
+    lexicon_path = lexicon_path or ct.get_mapped_lexicon_path()
+    bucket_count = max(len(lexicon), 1)
+    encoded_words = sorted((zlib.crc32(word.encode('utf-8')) % bucket_count, word.encode('utf-8'), valence)
+                           for word, valence in lexicon.items())
+    keys_start = VALENCES_OFFSET + 8 * len(encoded_words) + 4 * (len(encoded_words) + 1) + 4 * (bucket_count + 1)
+    offsets = [keys_start]
+    buckets = [0] * (bucket_count + 1)
+    for bucket, encoded_word, _ in encoded_words:
+        offsets.append(offsets[-1] + len(encoded_word))
+        buckets[bucket + 1] += 1
+    for bucket in range(bucket_count):
+        buckets[bucket + 1] += buckets[bucket]
+    os.makedirs(os.path.dirname(os.path.abspath(lexicon_path)), exist_ok=True)
+    temporary_path = f'{lexicon_path}.{os.getpid()}.tmp'
+    with open(temporary_path, 'wb') as lexicon_file:
+        lexicon_file.write(MAPPED_LEXICON_MAGIC)
+        lexicon_file.write(MAPPED_LEXICON_HEADER.pack(ct.get_mapped_lexicon_version(), len(encoded_words), bucket_count,
+                                                     get_sources_digest()))
+        lexicon_file.write(b'\0' * (VALENCES_OFFSET - lexicon_file.tell()))
+        lexicon_file.write(struct.pack(f'={len(encoded_words)}d', *(valence for _, _, valence in encoded_words)))
+        lexicon_file.write(struct.pack(f'={len(offsets)}I', *offsets))
+        lexicon_file.write(struct.pack(f'={len(buckets)}I', *buckets))
+        lexicon_file.write(b''.join(encoded_word for _, encoded_word, _ in encoded_words))
+    os.replace(temporary_path, lexicon_path)
+    return lexicon_path
+
+
+def open_mapped_lexicon(lexicon_path: Optional[str] = None) -> Optional[MappedLexicon]:
+    """
+    Return the memory-mapped lexicon stored in the provided file,
+    or None if the file is missing or invalid.
+    :param lexicon_path: path of the file to map, defaults to the configured one
+    :return: the MappedLexicon, or None if it can not be used
+    """
+    try:
+        return MappedLexicon(lexicon_path or ct.get_mapped_lexicon_path())
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+def get_sources_digest() -> bytes:
+    """
+    Return the digest of the lexicon sources fingerprint, stored in mapped lexicon files
+    so that files built from other lexicon sources are detected as stale.
+    :return: the 32 bytes SHA-256 digest of the lexicon sources fingerprint
+    """
+    return hashlib.sha256(ss.get_source_fingerprint().encode('utf-8')).digest()
+
+
+if __name__ == '__main__':
+    print(f'Mapped lexicon written to {build_mapped_lexicon(SentimentIntensityAnalyzer().lexicon)}')
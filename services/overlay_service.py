@@ -0,0 +1,55 @@
+from collections import ChainMap
+from collections.abc import Mapping
+from typing import Optional
+
+from services import constants_service as ct
+
+
+def load_overlays(overlay_paths: Optional[list[str]] = None) -> dict[str, float]:
+    """
+    Return the valences of the lexicon overlay files, in the format of the VADER lexicon file :
+    one token and its valence per line, separated by a tab, other columns being ignored.
+    Blank lines and lines starting with "#" are skipped, tokens are lower cased
+    and a token of a file overrides the same token of the previous files.
+    :param overlay_paths: paths of the overlay files, defaults to the configured ones
+    :return: the token to valence dictionary of the overlays
+    """
+    overlay_paths = ct.get_lexicon_overlay_paths() if overlay_paths is None else overlay_paths
+    overlays = {}
+    for overlay_path in overlay_paths:
+        with open(overlay_path, encoding='utf-8') as overlay_file:
+            for line_number, line in enumerate(overlay_file, 1):
+                if not line.strip() or line.startswith('#'):
+                    continue
+                columns = line.rstrip('\n').split('\t')
+                try:
+                    overlays[columns[0].strip().lower()] = float(columns[1])
+                except (IndexError, ValueError):
+                    raise ValueError(f'{overlay_path}:{line_number}: expected a token and its valence separated by a tab')
+    return overlays
+
+
+def apply_overlays(lexicon: Mapping[str, float], overlays: Mapping[str, float]) -> Mapping[str, float]:
+    """
+    Return the provided lexicon with the valences of the overlays added or replacing its own.
+    A dictionary lexicon is copied, a memory-mapped one is left shared and looked up after the overlays.
+    :param lexicon: base word to valence mapping
+    :param overlays: token to valence overrides
+    :return: the overlaid lexicon, or the provided lexicon if there are no overlays
+    """
+    if not overlays:
+        return lexicon
+    if isinstance(lexicon, dict):
+        return {**lexicon, **overlays}
+    return ChainMap(dict(overlays), lexicon)
+
+
+def get_changed_tokens(previous_overlays: Mapping[str, float], overlays: Mapping[str, float]) -> frozenset[str]:
+    """
+    Return the tokens whose valence differs between the provided overlays : added, removed or modified tokens.
+    :param previous_overlays: overlays of the previous lexicon
+    :param overlays: overlays of the new lexicon
+    :return: the set of changed tokens
+    """
+    tokens = previous_overlays.keys() | overlays.keys()
+    return frozenset(token for token in tokens if previous_overlays.get(token) != overlays.get(token))
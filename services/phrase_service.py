@@ -0,0 +1,83 @@
+from collections import deque
+from collections.abc import Iterable, Sequence
+
+import vaderSentiment.vaderSentiment as vader
+
+
+class PhraseMatcher:
+    """
+    Aho-Corasick automaton over words : finds every occurrence of a set of multi-word phrases
+    in a sequence of words in a single linear pass, whatever the number of phrases.
+    """
+
+    def __init__(self, phrases: Iterable[str]):
+        """
+        Compile the provided phrases, made of words separated by single spaces, into the automaton.
+        :param phrases: phrases to find, single words being ignored
+        """
+        self._transitions: list[dict[str, int]] = [{}]
+        self._outputs: list[list[tuple[int, str]]] = [[]]
+        for phrase in phrases:
+            words = phrase.split(' ')
+            if len(words) > 1:
+                self.__add(words, phrase)
+        self._failures = self.__get_failures()
+
+    def find(self, words: Sequence[str]) -> dict[tuple[int, int], str]:
+        """
+        Return every phrase occurring in the provided words, by the position of its last word and its length.
+        :param words: words of a text
+        :return: the dictionary of phrases keyed by (end position, number of words) tuples
+        """
+        transitions = self._transitions
+        failures = self._failures
+        outputs = self._outputs
+        matches = {}
+        state = 0
+        for position, word in enumerate(words):
+            while state and word not in transitions[state]:
+                state = failures[state]
+            state = transitions[state].get(word, 0)
+            for length, phrase in outputs[state]:
+                matches[position, length] = phrase
+        return matches
+
+    def __add(self, words: list[str], phrase: str):
+        """
+        Add the path of the provided phrase words to the automaton trie.
+        :param words: words of the phrase
+        :param phrase: the phrase
+        """
+        state = 0
+        for word in words:
+            next_state = self._transitions[state].get(word)
+            if next_state is None:
+                next_state = len(self._transitions)
+                self._transitions[state][word] = next_state
+                self._transitions.append({})
+                self._outputs.append([])
+            state = next_state
+        self._outputs[state].append((len(words), phrase))
+
+    def __get_failures(self) -> list[int]:
+        """
+        Return the failure state of each trie state, the state of its longest proper suffix in the trie,
+        and add to the outputs of each state the outputs of its failure state, in breadth-first order.
+        :return: the list of failure states, by state
+        """
+        failures = [0] * len(self._transitions)
+        queue = deque(self._transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, next_state in self._transitions[state].items():
+                failure = failures[state]
+                while failure and word not in self._transitions[failure]:
+                    failure = failures[failure]
+                failures[next_state] = self._transitions[failure].get(word, 0)
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[failures[next_state]]
+                queue.append(next_state)
+        return failures
+
+
+# Matcher of the VADER special case phrases and booster phrases, compiled once per process
+VADER_PHRASE_MATCHER = PhraseMatcher(list(vader.SPECIAL_CASES) + list(vader.BOOSTER_DICT))
@@ -0,0 +1,180 @@
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain
+from typing import Optional
+
+from services import analyzer_service as an
+from services import batch_service as bs
+from services import constants_service as ct
+
+# Process pool scoring texts in parallel, created on first use
+__executor: Optional[ProcessPoolExecutor] = None
+
+# Version of the lexicon loaded by the workers of the process pool
+__lexicon_version = 0
+
+# Guards the creation, the restart and the shutdown of the process pool
+__lock = threading.Lock()
+
+# Number of times the process pool was restarted after one of its workers crashed
+__restart_count = 0
+
+
+def score_texts(texts: list[str]) -> list[dict[str, float]]:
+    """
+    Return the VADER polarities of the provided texts, in input order.
+    Texts are split in chunks scored in parallel by the worker processes when they are numerous enough,
+    else they are scored in the current process. When a worker crashes, the pool is restarted
+    and the chunks that did not complete are scored again.
+    :param texts: input texts
+    :return: the list of "neg", "neu", "pos" and "compound" polarity dictionaries
+    """
+    worker_count = ct.get_pool_workers()
+    if worker_count <= 1 or len(texts) < ct.get_pool_min_texts():
+        return __score_texts(texts)
+    chunks = get_chunks(texts, worker_count)
+    results: list[Optional[list[dict[str, float]]]] = [None] * len(chunks)
+    pending_indexes = list(range(len(chunks)))
+    restart_count = 0
+    while pending_indexes:
+        executor = get_executor()
+        futures = [(index, __submit(executor, chunks[index])) for index in pending_indexes]
+        pending_indexes = []
+        for index, future in futures:
+            try:
+                results[index] = future.result()
+            except BrokenProcessPool:
+                pending_indexes.append(index)
+        if pending_indexes:
+            if restart_count >= ct.get_pool_max_restarts():
+                raise BrokenProcessPool('Scoring worker processes kept crashing')
+            __restart(executor)
+            restart_count += 1
+    return list(chain.from_iterable(results))
+
+
+def get_chunks(texts: list[str], worker_count: int) -> list[list[str]]:
+    """
+    Return the provided texts split in consecutive chunks of about the configured number of characters,
+    so that sending a chunk to a worker costs little compared to scoring it,
+    and of at most an equal share of the characters per worker, so that every worker gets a chunk.
+    :param texts: input texts
+    :param worker_count: number of worker processes
+    :return: the list of chunks, in input order
+    """
+    total_length = sum(len(text) for text in texts)
+    chunk_length = max(1, min(ct.get_pool_chunk_length(), -(-total_length // worker_count)))
+    chunks = []
+    chunk = []
+    length = 0
+    for text in texts:
+        chunk.append(text)
+        length += len(text)
+        if length >= chunk_length:
+            chunks.append(chunk)
+            chunk = []
+            length = 0
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def get_executor() -> ProcessPoolExecutor:
+    """
+    Return the process pool, creating it on first use and replacing it when the lexicon was reloaded.
+    Its workers load the sentiment analyzer lexicon, with the lexicon overlays of the current process,
+    when they start. Chunks already submitted to a replaced pool finish on its workers.
+    :return: the shared ProcessPoolExecutor instance
+    """
+    global __executor, __lexicon_version
+    analyzer = an.get_analyzer()
+    with __lock:
+        replaced_executor = None
+        if __executor is not None and __lexicon_version != analyzer.lexicon_version:
+            replaced_executor, __executor = __executor, None
+        if __executor is None:
+            context = multiprocessing.get_context(ct.get_pool_start_method())
+            __executor = ProcessPoolExecutor(max_workers=ct.get_pool_workers(), mp_context=context,
+                                             initializer=an.warm_up, initargs=(analyzer.overlays,))
+            __lexicon_version = analyzer.lexicon_version
+        executor = __executor
+    if replaced_executor is not None:
+        replaced_executor.shutdown(wait=False)
+    return executor
+
+
+def warm_up():
+    """
+    Start every worker process of the pool and wait for them to load the sentiment analyzer lexicon,
+    so that the first parallel scoring does not pay for it. Does nothing when the pool is disabled.
+    """
+    worker_count = ct.get_pool_workers()
+    if worker_count > 1:
+        executor = get_executor()
+        for future in [executor.submit(__score_texts, []) for _ in range(worker_count)]:
+            future.result()
+
+
+def shutdown():
+    """
+    Stop the workers of the process pool, if it was started. The next parallel scoring starts a new pool.
+    """
+    global __executor
+    with __lock:
+        executor, __executor = __executor, None
+    if executor is not None:
+        executor.shutdown()
+
+
+def get_stats() -> dict[str, int]:
+    """
+    Return the number of worker processes, whether the pool is started and its number of restarts.
+    :return: the dictionary of process pool statistics
+    """
+    return {'workers': ct.get_pool_workers(), 'started': __executor is not None, 'restarts': __restart_count}
+
+
+def __submit(executor: ProcessPoolExecutor, chunk: list[str]) -> Future:
+    """
+    Submit the scoring of the provided chunk to the process pool.
+    :param executor: the process pool
+    :param chunk: texts to score
+    :return: the future of the chunk polarities, failed with BrokenProcessPool if the pool is broken
+    """
+    try:
+        return executor.submit(__score_texts, chunk)
+    except BrokenProcessPool as error:
+        future = Future()
+        future.set_exception(error)
+        return future
+
+
+def __restart(broken_executor: ProcessPoolExecutor):
+    """
+    Replace the provided broken process pool with a new one, unless another thread already did.
+    :param broken_executor: the process pool one of whose workers crashed
+    """
+    global __executor, __restart_count
+    with __lock:
+        if __executor is not broken_executor:
+            return
+        __executor = None
+        __restart_count += 1
+    broken_executor.shutdown(wait=False)
+
+
+def __score_texts(texts: list[str]) -> list[dict[str, float]]:
+    """
+    Return the VADER polarities of the provided texts with the analyzer of the current process,
+    with the batch engine when they are numerous enough for its array operations to pay off.
+    :param texts: input texts
+    :return: the list of polarity dictionaries
+    """
+    if len(texts) >= ct.get_batch_min_texts():
+        polarities = bs.get_polarities(texts)
+        keys = list(polarities)
+        return [dict(zip(keys, values)) for values in zip(*(polarities[key].tolist() for key in keys))]
+    analyzer = an.get_analyzer()
+    return [analyzer.polarity_scores(text) for text in texts]
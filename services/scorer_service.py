@@ -0,0 +1,552 @@
+import math
+import string
+import sys
+from bisect import insort
+from collections.abc import Mapping
+from typing import NamedTuple, Optional, Union
+
+import vaderSentiment.vaderSentiment as vader
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from services import phrase_service as ph
+from services import text_service as tx
+
+# Single word negations of the VADER "negated" rule
+NEGATIONS = frozenset(vader.NEGATE)
+
+# Words joining the negated words of the VADER "no ... or / nor" rule
+ALTERNATIVE_WORDS = frozenset(['or', 'nor'])
+
+# Words emphasizing a lexicon token after "never" in the VADER negation rule
+EMPHASIS_WORDS = frozenset(['so', 'this'])
+
+# Distances of the three tokens preceding a lexicon token, minus one
+PRECEDING_DISTANCES = (0, 1, 2)
+
+# Words triggering the VADER rules that can change the sign of a lexicon token valence or cancel it :
+# the "but", "least", "no" and "kind of" rules, negations and phrases being checked separately
+SIGN_RULE_WORDS = frozenset(['but', 'least', 'no', 'kind'])
+
+# Maximum length of the single token inputs answered from the answer table, longer ones being scored
+ANSWER_MAX_LENGTH = 40
+
+# Last words of the VADER special case and booster phrases, a text holding none of them having no phrase
+PHRASE_LAST_WORDS = frozenset(phrase.split(' ')[-1] for phrase in list(vader.SPECIAL_CASES) + list(vader.BOOSTER_DICT)
+                              if ' ' in phrase)
+
+
+class TokenInfo(NamedTuple):
+    """
+    Per-token facts the VADER rules need, computed once per distinct raw token.
+    """
+    word: str
+    lower: str
+    valence: Optional[float]
+    is_upper: bool
+    booster: float
+    is_negation: bool
+    exclamation_count: int
+    question_count: int
+
+
+class TokenizedText(NamedTuple):
+    """
+    Everything the VADER rules need about a text, gathered in a single scan of its tokens.
+    """
+    tokens: list[TokenInfo]
+    lowers: list[str]
+    is_cap_diff: bool
+    exclamation_count: int
+    question_count: int
+
+
+class ScoreEstimate(NamedTuple):
+    """
+    Polarities of a text estimated without the VADER booster and emphasis rules, and the range of compound scores
+    these rules can lead to.
+    """
+    scores: dict[str, float]
+    lowest_compound: float
+    highest_compound: float
+
+
+class MemoizedAnalyzer(SentimentIntensityAnalyzer):
+    """
+    VADER sentiment analyzer whose per-token work (punctuation stripping, lower casing, lexicon valence,
+    caps emphasis, booster and negation membership) is memoized in a bounded table shared across requests.
+    Novel sentences reuse the facts of the tokens already seen and give exactly the scores of the stock analyzer.
+    """
+
+    def __init__(self, lexicon: Mapping[str, float], emojis: Mapping[str, str], memo_size: int,
+                 answer_size: int = 0):
+        """
+        Create an analyzer scoring with the provided lexicon and emoji table.
+        The VADER text files are not parsed. The analyzer service records the lexicon overlays
+        applied to the lexicon and their version.
+        :param lexicon: word to valence mapping
+        :param emojis: emoji to description mapping
+        :param memo_size: maximum number of memoized tokens, 0 disables the memoization
+        :param answer_size: maximum number of single token answers, 0 disables the answer table
+        """
+        self.lexicon = lexicon
+        self.emojis = emojis
+        self.memo_size = memo_size
+        self.answer_size = answer_size
+        self.emoji_replacer = tx.EmojiReplacer(emojis)
+        self.overlays: Mapping[str, float] = {}
+        self.lexicon_version = 0
+        self.answers: dict[Union[str, tuple[float, int, int]], tuple[float, float, float, float]] = {}
+        self._token_memo: dict[str, TokenInfo] = {}
+
+    def get_token_info(self, token: str) -> TokenInfo:
+        """
+        Return the memoized facts of the provided whitespace separated token, computing them on first use.
+        The table is emptied when it is full so that it follows the vocabulary of recent requests.
+        :param token: raw token of the input text, punctuation included
+        :return: the TokenInfo of the token
+        """
+        token_info = self._token_memo.get(token)
+        if token_info is None:
+            token_info = self.__get_token_info(token)
+            if self.memo_size:
+                if len(self._token_memo) >= self.memo_size:
+                    self._token_memo.clear()
+                self._token_memo[token] = token_info
+        return token_info
+
+    def get_answer(self, text: str) -> Optional[tuple[float, float, float, float]]:
+        """
+        Return the polarities of the provided input when it is a single lexicon token or emoji, else None.
+        The polarities of a single token without emoji only depend on its scored valence and its numbers
+        of exclamation points and question marks, so they are computed once per distinct combination,
+        a few hundred for the whole lexicon, and kept in the answer table. Single token inputs holding an emoji,
+        replaced by their descriptions, are kept under their own text. The table is emptied when it is full.
+        :param text: input text
+        :return: the tuple of "neg", "neu", "pos" and "compound" float polarities, or None
+        """
+        if not self.answer_size or not 0 < len(text) <= ANSWER_MAX_LENGTH or text.split() != [text]:
+            return None
+        if self.emoji_replacer.has_emoji(text):
+            key = text
+        else:
+            token_info = self.get_token_info(text)
+            if token_info.valence is None:
+                return None
+            valence = 0.0 if token_info.lower in vader.BOOSTER_DICT else token_info.valence
+            key = (valence, token_info.exclamation_count, token_info.question_count)
+        answer = self.answers.get(key)
+        if answer is None:
+            answer = self.__get_answer(text)
+            if len(self.answers) >= self.answer_size:
+                self.answers.clear()
+            self.answers[key] = answer
+        return answer
+
+    def get_answer_stats(self) -> dict[str, int]:
+        """
+        Return the number of single token answers and the capacity of the table.
+        :return: the dictionary of answer table statistics
+        """
+        return {'entries': len(self.answers), 'capacity': self.answer_size}
+
+    def is_neutral(self, text: str) -> bool:
+        """
+        Return whether the provided text provably has no sentiment-bearing token : it has no emoji
+        and none of its tokens is in the lexicon, so that every VADER rule leaves its compound score at 0.
+        Booster and negation words only scale the valence of lexicon tokens and can not make a text polar.
+        Tokens missing from the memo are looked up without being memoized, so that one-off identifiers
+        and URLs do not evict the vocabulary of real sentences.
+        :param text: input text
+        :return: True if the text compound score is 0, False if the text has to be scored
+        """
+        if self.emoji_replacer.has_emoji(text):
+            return False
+        for token in text.split():
+            token_info = self._token_memo.get(token)
+            if token_info is None:
+                stripped = token.strip(string.punctuation)
+                word = token if len(stripped) <= 2 else stripped
+                if word.lower() in self.lexicon:
+                    return False
+            elif token_info.valence is not None:
+                return False
+        return True
+
+    @staticmethod
+    def get_neutral_scores(text: str) -> dict[str, float]:
+        """
+        Return the VADER polarities of a text proven neutral by is_neutral, without scoring it :
+        every token is neutral, and a text without tokens has null polarities.
+        :param text: input text proven neutral
+        :return: a dictionary of "neg", "neu", "pos" and "compound" float scores
+        """
+        return {'neg': 0.0, 'neu': 1.0 if text.split() else 0.0, 'pos': 0.0, 'compound': 0.0}
+
+    def get_memo_stats(self) -> dict[str, int]:
+        """
+        Return the number of memoized tokens and the capacity of the table.
+        :return: the dictionary of token memo statistics
+        """
+        return {'entries': len(self._token_memo), 'capacity': self.memo_size}
+
+    def tokenize(self, text: str) -> TokenizedText:
+        """
+        Return the token facts of the provided text, whether only some of its tokens are in upper case
+        and its numbers of exclamation points and question marks, in a single scan of its whitespace separated tokens.
+        Punctuation marks are counted per memoized token, as they can only appear inside tokens.
+        :param text: input text without emojis
+        :return: the TokenizedText of the text
+        """
+        tokens = []
+        lowers = []
+        upper_count = exclamation_count = question_count = 0
+        for token in text.split():
+            token_info = self.get_token_info(token)
+            tokens.append(token_info)
+            lowers.append(token_info.lower)
+            upper_count += token_info.is_upper
+            exclamation_count += token_info.exclamation_count
+            question_count += token_info.question_count
+        return TokenizedText(tokens=tokens,
+                             lowers=lowers,
+                             is_cap_diff=0 < len(tokens) - upper_count < len(tokens),
+                             exclamation_count=exclamation_count,
+                             question_count=question_count)
+
+    def polarity_scores(self, text: str) -> dict[str, float]:
+        """
+        Return the VADER polarities of the provided text.
+        :param text: input text
+        :return: a dictionary of "neg", "neu", "pos" and "compound" float scores
+        """
+        tokenized_text = self.tokenize(self.emoji_replacer.replace(text))
+        tokens, lowers = tokenized_text.tokens, tokenized_text.lowers
+        # The idioms rule only applies from the fourth token on
+        phrases = ph.VADER_PHRASE_MATCHER.find(lowers) if len(lowers) > 3 else {}
+        sentiments = []
+        for i, token in enumerate(tokens):
+            if token.booster or (token.lower == 'kind' and i < len(tokens) - 1 and lowers[i + 1] == 'of'):
+                sentiments.append(0)
+            elif token.valence is None:
+                sentiments.append(0)
+            else:
+                sentiments.append(self.__get_valence(tokens, lowers, phrases, i, tokenized_text.is_cap_diff))
+        if 'but' in lowers:
+            self.__apply_but_rule(sentiments, lowers.index('but'))
+        amplifier = tx.get_emphasis_amplifier(tokenized_text.exclamation_count, tokenized_text.question_count)
+        return self.__score_valence(sentiments, amplifier)
+
+    def estimate_scores(self, text: str) -> Optional[ScoreEstimate]:
+        """
+        Return the polarities of the provided text estimated from the valences of its lexicon tokens,
+        with the caps emphasis of each token and the punctuation emphasis of the text, in a single scan
+        of its memoized tokens, and the range of compound scores the rules left out can lead to.
+        The booster rule moves each of the three lexicon tokens following a booster word by at most
+        the booster scalar, the "so" and "this" emphasis scales a lexicon token by 1.25,
+        and the compound score only increases with the sum of the valences.
+        None is returned when a rule that can change the sign of a valence or cancel it applies :
+        a negation, a "but", "least", "no" or "kind" word, or a VADER special case or booster phrase.
+        :param text: input text
+        :return: the ScoreEstimate of the text, or None
+        """
+        token_memo = self._token_memo
+        text = self.emoji_replacer.replace(text)
+        sentiments = []
+        lowers = []
+        lexicon_tokens = []
+        boosters = []
+        upper_count = 0
+        for token in text.split():
+            token_info = token_memo.get(token) or self.get_token_info(token)
+            if token_info.is_negation or token_info.lower in SIGN_RULE_WORDS:
+                return None
+            upper_count += token_info.is_upper
+            if token_info.booster:
+                boosters.append((len(lowers), token_info))
+                sentiments.append(0)
+            elif token_info.valence is None:
+                sentiments.append(0)
+            else:
+                lexicon_tokens.append((len(lowers), token_info))
+                sentiments.append(token_info.valence)
+            lowers.append(token_info.lower)
+        if len(lowers) > 3 and not PHRASE_LAST_WORDS.isdisjoint(lowers) and ph.VADER_PHRASE_MATCHER.find(lowers):
+            return None
+        is_cap_diff = 0 < len(lowers) - upper_count < len(lowers)
+        boosts = [0.0] * len(lowers)
+        for position, token_info in boosters:
+            scalar = abs(token_info.booster) + (vader.C_INCR if token_info.is_upper and is_cap_diff else 0.0)
+            for boosted_position in range(position + 1, min(position + 4, len(lowers))):
+                boosts[boosted_position] += scalar
+        bound = 0.0
+        for position, token_info in lexicon_tokens:
+            if token_info.is_upper and is_cap_diff:
+                valence = sentiments[position]
+                sentiments[position] = valence + vader.C_INCR if valence > 0 else valence - vader.C_INCR
+            bound += boosts[position]
+            # The negation rule also scales by 1.25 the valence of a lexicon token following "so" or "this"
+            if position > 0 and lowers[position - 1] in EMPHASIS_WORDS:
+                bound += 0.25 * (abs(sentiments[position]) + boosts[position])
+        amplifier = tx.get_emphasis_amplifier(text.count('!'), text.count('?'))
+        sentiment_sum = float(sum(sentiments))
+        return ScoreEstimate(scores=self.__score_valence(sentiments, amplifier),
+                             lowest_compound=self.__get_compound(sentiment_sum - bound, amplifier),
+                             highest_compound=self.__get_compound(sentiment_sum + bound, amplifier))
+
+    def approximate_scores(self, text: str) -> dict[str, float]:
+        """
+        Return the polarities of the provided text approximated from the valences of its lexicon tokens,
+        with the caps emphasis of each token and the punctuation emphasis of the text, in a single scan
+        of its memoized tokens. None of the VADER rules looking at the neighbours of a token is applied,
+        so the polarities are the estimated ones of "estimate_scores" whatever the text.
+        :param text: input text
+        :return: the dictionary of "neg", "neu", "pos" and "compound" float polarities
+        """
+        token_memo = self._token_memo
+        text = self.emoji_replacer.replace(text)
+        tokens = [token_memo.get(token) or self.get_token_info(token) for token in text.split()]
+        upper_count = sum(token_info.is_upper for token_info in tokens)
+        is_cap_diff = 0 < len(tokens) - upper_count < len(tokens)
+        sentiments = []
+        for token_info in tokens:
+            valence = token_info.valence
+            if token_info.booster or valence is None:
+                sentiments.append(0)
+            elif token_info.is_upper and is_cap_diff:
+                sentiments.append(valence + vader.C_INCR if valence > 0 else valence - vader.C_INCR)
+            else:
+                sentiments.append(valence)
+        return self.__score_valence(sentiments, tx.get_emphasis_amplifier(text.count('!'), text.count('?')))
+
+    @staticmethod
+    def __apply_but_rule(sentiments: list[float], but_index: int):
+        """
+        Dampen the sentiments of the tokens preceding the first "but" of a text and emphasize the following ones,
+        in place and exactly as the VADER "_but_check" rule does, without its quadratic scans.
+        That rule visits the sentiments in order but updates the first position holding the visited value,
+        so a position whose updated value equals a later sentiment is updated again instead of the later one.
+        Positions are kept by value to find that first position : null sentiments are skipped,
+        as updating them changes nothing.
+        :param sentiments: per-token sentiment valences, updated in place
+        :param but_index: position of the first "but" token
+        """
+        positions: dict[float, list[int]] = {}
+        for k, sentiment in enumerate(sentiments):
+            if sentiment == 0:
+                continue
+            value_positions = positions.setdefault(sentiment, [])
+            value_positions.append(k)
+            si = value_positions[0]
+            if si == but_index:
+                continue
+            updated_sentiment = sentiment * 0.5 if si < but_index else sentiment * 1.5
+            del value_positions[0]
+            if not value_positions:
+                del positions[sentiment]
+            sentiments[si] = updated_sentiment
+            insort(positions.setdefault(updated_sentiment, []), si)
+
+    @staticmethod
+    def __score_valence(sentiments: list[float], amplifier: float) -> dict[str, float]:
+        """
+        Return the VADER polarities of a text from the sentiments of its tokens and its punctuation emphasis,
+        computed in the same order as the VADER "score_valence" method.
+        :param sentiments: per-token sentiment valences
+        :param amplifier: punctuation emphasis amplifier of the text
+        :return: a dictionary of "neg", "neu", "pos" and "compound" float scores
+        """
+        if not sentiments:
+            return {'neg': 0.0, 'neu': 0.0, 'pos': 0.0, 'compound': 0.0}
+        compound = MemoizedAnalyzer.__get_compound(float(sum(sentiments)), amplifier)
+        positive_sum = 0.0
+        negative_sum = 0.0
+        neutral_count = 0
+        for sentiment in sentiments:
+            if sentiment > 0:
+                positive_sum += float(sentiment) + 1
+            elif sentiment < 0:
+                negative_sum += float(sentiment) - 1
+            else:
+                neutral_count += 1
+        if positive_sum > math.fabs(negative_sum):
+            positive_sum += amplifier
+        elif positive_sum < math.fabs(negative_sum):
+            negative_sum -= amplifier
+        total = positive_sum + math.fabs(negative_sum) + neutral_count
+        return {'neg': round(math.fabs(negative_sum / total), 3),
+                'neu': round(math.fabs(neutral_count / total), 3),
+                'pos': round(math.fabs(positive_sum / total), 3),
+                'compound': compound}
+
+    @staticmethod
+    def __get_compound(sentiment_sum: float, amplifier: float) -> float:
+        """
+        Return the VADER compound score of a text from the sum of the sentiments of its tokens
+        and its punctuation emphasis, which only increase with the sum.
+        :param sentiment_sum: sum of the per-token sentiment valences
+        :param amplifier: punctuation emphasis amplifier of the text
+        :return: the float compound score, rounded like VADER scores
+        """
+        if sentiment_sum > 0:
+            sentiment_sum += amplifier
+        elif sentiment_sum < 0:
+            sentiment_sum -= amplifier
+        return round(vader.normalize(sentiment_sum), 4)
+
+    @staticmethod
+    def __get_valence(tokens: list[TokenInfo], lowers: list[str], phrases: dict[tuple[int, int], str], i: int,
+                      is_cap_diff: bool) -> float:
+        """
+        Return the valence of the lexicon token at the provided position, adjusted by the VADER rules
+        looking at its neighbours.
+        :param tokens: token facts of the text
+        :param lowers: lower cased tokens of the text
+        :param phrases: VADER phrases of the text, by (end position, number of words)
+        :param i: position of the token to score
+        :param is_cap_diff: whether only some tokens of the text are in upper case
+        :return: the float valence of the token
+        """
+        token = tokens[i]
+        valence = token.valence
+        if token.lower == 'no' and i != len(tokens) - 1 and tokens[i + 1].valence is not None:
+            valence = 0.0
+        if (i > 0 and lowers[i - 1] == 'no') or (i > 1 and lowers[i - 2] == 'no') \
+                or (i > 2 and lowers[i - 3] == 'no' and lowers[i - 1] in ALTERNATIVE_WORDS):
+            valence = token.valence * vader.N_SCALAR
+        if token.is_upper and is_cap_diff:
+            valence = valence + vader.C_INCR if valence > 0 else valence - vader.C_INCR
+        for start_i in PRECEDING_DISTANCES:
+            if i > start_i and tokens[i - (start_i + 1)].valence is None:
+                valence = valence + MemoizedAnalyzer.__get_booster_scalar(tokens[i - (start_i + 1)], valence,
+                                                                          is_cap_diff, start_i)
+                valence = MemoizedAnalyzer.__apply_negation_rule(valence, tokens, lowers, start_i, i)
+                if start_i == 2 and phrases:
+                    valence = MemoizedAnalyzer.__apply_idioms_rule(valence, phrases, i)
+        if i > 1 and tokens[i - 1].valence is None and lowers[i - 1] == 'least':
+            if lowers[i - 2] != 'at' and lowers[i - 2] != 'very':
+                valence = valence * vader.N_SCALAR
+        elif i > 0 and tokens[i - 1].valence is None and lowers[i - 1] == 'least':
+            valence = valence * vader.N_SCALAR
+        return valence
+
+    @staticmethod
+    def __get_booster_scalar(token: TokenInfo, valence: float, is_cap_diff: bool, start_i: int) -> float:
+        """
+        Return the VADER booster scalar of a token preceding a lexicon token, dampened with its distance.
+        :param token: facts of the preceding token
+        :param valence: current valence of the lexicon token
+        :param is_cap_diff: whether only some tokens of the text are in upper case
+        :param start_i: distance of the preceding token minus one
+        :return: the float scalar added to the valence
+        """
+        scalar = 0.0
+        if token.booster:
+            scalar = token.booster
+            if valence < 0:
+                scalar *= -1
+            if token.is_upper and is_cap_diff:
+                scalar = scalar + vader.C_INCR if valence > 0 else scalar - vader.C_INCR
+        if start_i == 1 and scalar != 0:
+            scalar = scalar * 0.95
+        if start_i == 2 and scalar != 0:
+            scalar = scalar * 0.9
+        return scalar
+
+    @staticmethod
+    def __apply_negation_rule(valence: float, tokens: list[TokenInfo], lowers: list[str], start_i: int,
+                              i: int) -> float:
+        """
+        Return the valence of a lexicon token negated or emphasized by one of its three preceding tokens,
+        as the VADER "_negation_check" rule does.
+        :param valence: current valence of the lexicon token
+        :param tokens: token facts of the text
+        :param lowers: lower cased tokens of the text
+        :param start_i: distance of the preceding token minus one
+        :param i: position of the lexicon token
+        :return: the float valence of the token
+        """
+        if start_i == 0:
+            if tokens[i - 1].is_negation:
+                valence = valence * vader.N_SCALAR
+        if start_i == 1:
+            if lowers[i - 2] == 'never' and lowers[i - 1] in EMPHASIS_WORDS:
+                valence = valence * 1.25
+            elif lowers[i - 2] == 'without' and lowers[i - 1] == 'doubt':
+                pass
+            elif tokens[i - 2].is_negation:
+                valence = valence * vader.N_SCALAR
+        if start_i == 2:
+            if lowers[i - 3] == 'never' and lowers[i - 2] in EMPHASIS_WORDS or lowers[i - 1] in EMPHASIS_WORDS:
+                valence = valence * 1.25
+            elif lowers[i - 3] == 'without' and (lowers[i - 2] == 'doubt' or lowers[i - 1] == 'doubt'):
+                pass
+            elif tokens[i - 3].is_negation:
+                valence = valence * vader.N_SCALAR
+        return valence
+
+    @staticmethod
+    def __apply_idioms_rule(valence: float, phrases: dict[tuple[int, int], str], i: int) -> float:
+        """
+        Return the valence of a lexicon token replaced by the VADER special case phrases around it
+        and boosted by the booster phrases preceding it, as the VADER "_special_idioms_check" rule does,
+        from the phrases found in the text instead of the word windows around the token.
+        :param valence: current valence of the lexicon token
+        :param phrases: VADER phrases of the text, by (end position, number of words)
+        :param i: position of the lexicon token
+        :return: the float valence of the token
+        """
+        # Phrases ending on the token or just before it : "one zero", "two one zero", "two one",
+        # "three two one" and "three two", the first special case winning
+        for end_and_length in [(i, 2), (i, 3), (i - 1, 2), (i - 1, 3), (i - 2, 2)]:
+            phrase = phrases.get(end_and_length)
+            if phrase in vader.SPECIAL_CASES:
+                valence = vader.SPECIAL_CASES[phrase]
+                break
+        # Phrases starting on the token : "zero one", then "zero one two"
+        for end_and_length in [(i + 1, 2), (i + 2, 3)]:
+            phrase = phrases.get(end_and_length)
+            if phrase in vader.SPECIAL_CASES:
+                valence = vader.SPECIAL_CASES[phrase]
+        # Booster phrases preceding the token : "three two one", "three two" and "two one"
+        for end_and_length in [(i - 1, 3), (i - 2, 2), (i - 1, 2)]:
+            phrase = phrases.get(end_and_length)
+            if phrase in vader.BOOSTER_DICT:
+                valence = valence + vader.BOOSTER_DICT[phrase]
+        return valence
+
+    def __get_answer(self, text: str) -> tuple[float, float, float, float]:
+        """
+        Return the "neg", "neu", "pos" and "compound" polarities of the provided text, as a tuple.
+        :param text: input text
+        :return: the tuple of float polarities
+        """
+        scores = self.polarity_scores(text)
+        return scores['neg'], scores['neu'], scores['pos'], scores['compound']
+
+    def __get_token_info(self, token: str) -> TokenInfo:
+        """
+        Return the facts of the provided raw token, computed without the memo.
+        :param token: raw token of the input text, punctuation included
+        :return: the TokenInfo of the token
+        """
+        word = self.__get_word(token)
+        lower = sys.intern(word.lower())
+        return TokenInfo(word=word,
+                         lower=lower,
+                         valence=self.lexicon.get(lower),
+                         is_upper=word.isupper(),
+                         booster=vader.BOOSTER_DICT.get(lower, 0.0),
+                         is_negation=lower in NEGATIONS or "n't" in lower,
+                         exclamation_count=token.count('!'),
+                         question_count=token.count('?'))
+
+    @staticmethod
+    def __get_word(token: str) -> str:
+        """
+        Return the provided raw token stripped from its leading and trailing punctuation,
+        unless less than three characters would be left, as the VADER tokenizer does.
+        :param token: raw token of the input text
+        :return: the word of the token
+        """
+        stripped = token.strip(string.punctuation)
+        return token if len(stripped) <= 2 else stripped
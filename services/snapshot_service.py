@@ -0,0 +1,122 @@
+import hashlib
+import marshal
+import os
+import struct
+import sys
+from collections.abc import Mapping
+from importlib import metadata
+from typing import Optional
+
+import vaderSentiment.vaderSentiment as vader
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from services import constants_service as ct
+
+# Leading bytes identifying a lexicon snapshot file
+SNAPSHOT_MAGIC = b'VADERSNP'
+
+# Sections of a lexicon snapshot, marshalled one after the other in this order,
+# each one preceded by its byte length so that the file is read at once and only the needed sections are decoded
+SNAPSHOT_SECTIONS = ['fingerprint', 'emojis', 'lexicon']
+
+# Fingerprint of the snapshot sources, computed once per process
+__source_fingerprint: Optional[str] = None
+
+
+def build_snapshot(snapshot_path: Optional[str] = None) -> str:
+    """
+    Compile the VADER lexicon and emoji table into a versioned binary snapshot file.
+    :param snapshot_path: path of the snapshot file to write, defaults to the configured one
+    :return: the path of the written snapshot file
+    """
+    snapshot_path = snapshot_path or ct.get_lexicon_snapshot_path()
+    analyzer = SentimentIntensityAnalyzer()
+    snapshot = {
+        'fingerprint': get_source_fingerprint(),
+        'lexicon': analyzer.lexicon,
+        'emojis': analyzer.emojis
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(snapshot_path)), exist_ok=True)
+    temporary_path = f'{snapshot_path}.{os.getpid()}.tmp'
+    with open(temporary_path, 'wb') as snapshot_file:
+        snapshot_file.write(SNAPSHOT_MAGIC)
+        for section in SNAPSHOT_SECTIONS:
+            content = marshal.dumps(snapshot[section])
+            snapshot_file.write(struct.pack('=I', len(content)))
+            snapshot_file.write(content)
+    os.replace(temporary_path, snapshot_path)
+    return snapshot_path
+
+
+def load_snapshot(snapshot_path: Optional[str] = None, with_lexicon: bool = True) -> Optional[dict]:
+    """
+    Return the content of the binary lexicon snapshot,
+    or None if the snapshot is missing, unreadable or stale.
+    :param snapshot_path: path of the snapshot file to read, defaults to the configured one
+    :param with_lexicon: whether to load the lexicon section, which is read last
+    :return: the snapshot dictionary, or None if it can not be used
+    """
+    snapshot_path = snapshot_path or ct.get_lexicon_snapshot_path()
+    sections = SNAPSHOT_SECTIONS if with_lexicon else SNAPSHOT_SECTIONS[:-1]
+    snapshot = {}
+    try:
+        with open(snapshot_path, 'rb') as snapshot_file:
+            content = memoryview(snapshot_file.read())
+        if content[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            return None
+        offset = len(SNAPSHOT_MAGIC)
+        for section in sections:
+            section_length, = struct.unpack_from('=I', content, offset)
+            offset += 4
+            snapshot[section] = marshal.loads(content[offset:offset + section_length])
+            offset += section_length
+            if section == 'fingerprint' and snapshot[section] != get_source_fingerprint():
+                return None
+    except (OSError, EOFError, ValueError, TypeError, struct.error):
+        return None
+    return snapshot
+
+
+def load_analyzer(snapshot_path: Optional[str] = None,
+                  lexicon: Optional[Mapping] = None) -> Optional[SentimentIntensityAnalyzer]:
+    """
+    Return a sentiment analyzer whose lexicon and emoji table come from the binary snapshot,
+    without parsing the VADER text files, or None if the snapshot can not be used.
+    :param snapshot_path: path of the snapshot file to read, defaults to the configured one
+    :param lexicon: word to valence mapping to use instead of the snapshot lexicon section
+    :return: a ready to use SentimentIntensityAnalyzer, or None
+    """
+    snapshot = load_snapshot(snapshot_path, with_lexicon=lexicon is None)
+    if snapshot is None:
+        return None
+    analyzer = SentimentIntensityAnalyzer.__new__(SentimentIntensityAnalyzer)
+    analyzer.lexicon = snapshot['lexicon'] if lexicon is None else lexicon
+    analyzer.emojis = snapshot['emojis']
+    return analyzer
+
+
+def get_source_fingerprint() -> str:
+    """
+    Return a string identifying the snapshot format, the Python marshal format,
+    the vaderSentiment version and the content of its lexicon files.
+    A snapshot whose fingerprint differs from this one is stale.
+    The lexicon files are read and hashed only once per process.
+    :return: the fingerprint of the current snapshot sources
+    """
+    global __source_fingerprint
+    if __source_fingerprint is not None:
+        return __source_fingerprint
+    digest = hashlib.sha256()
+    vader_directory = os.path.dirname(os.path.abspath(vader.__file__))
+    for file_name in ['vader_lexicon.txt', 'emoji_utf8_lexicon.txt']:
+        with open(os.path.join(vader_directory, file_name), 'rb') as source_file:
+            digest.update(source_file.read())
+    snapshot_version = ct.get_lexicon_snapshot_version()
+    python_version = f'{sys.version_info.major}.{sys.version_info.minor}'
+    vader_version = metadata.version('vaderSentiment')
+    __source_fingerprint = f'{snapshot_version}:{python_version}:{marshal.version}:{vader_version}:{digest.hexdigest()}'
+    return __source_fingerprint
+
+
+if __name__ == '__main__':
+    print(f'Lexicon snapshot written to {build_snapshot()}')
@@ -0,0 +1,158 @@
+import re
+import string
+from collections.abc import Mapping
+
+# Sentence boundaries : whitespaces following ".", "!" or "?" and optional closing quotes or brackets,
+# or whitespaces containing a blank line. Every match starts at a fixed position so scanning is linear.
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])([\'")\]}\u2019\u201d]*)\s+|\n[^\S\n]*\n\s*')
+
+# Runs of non ASCII characters, the only ones that can be emojis
+NON_ASCII_RUN = re.compile(r'[^\x00-\x7f]+')
+
+
+class EmojiReplacer:
+    """
+    Replaces the emojis of texts by their textual descriptions, exactly as the VADER analyzer does before scoring.
+    Pure ASCII texts are not scanned at all, and other texts are scanned in a single pass over their runs
+    of non ASCII characters, instead of concatenating the text character by character.
+    """
+
+    def __init__(self, emojis: Mapping[str, str]):
+        """
+        Index the emojis of the provided table.
+        Only single character emojis are replaced, as VADER looks emojis up character by character.
+        :param emojis: emoji to description mapping of the analyzer
+        """
+        self.emojis = emojis
+        self._descriptions = {emoji: description for emoji, description in emojis.items() if len(emoji) == 1}
+        self._characters = frozenset(self._descriptions)
+        self._skips_ascii = not any(character.isascii() for character in self._characters)
+
+    def has_emoji(self, text: str) -> bool:
+        """
+        Return whether the provided text holds an emoji.
+        :param text: input text
+        :return: True if an emoji would be replaced, else False
+        """
+        if self._skips_ascii and text.isascii():
+            return False
+        return not self._characters.isdisjoint(text)
+
+    def replace(self, text: str) -> str:
+        """
+        Return the provided text with its emojis replaced by their textual descriptions,
+        separated from the preceding character by a space unless it is a space or the text start,
+        leading and trailing whitespaces stripped.
+        :param text: input text
+        :return: the text without emojis
+        """
+        if not self._skips_ascii:
+            return self.__replace_characters(text)
+        if text.isascii():
+            return text.strip()
+        descriptions = self._descriptions
+        pieces = []
+        end = 0
+        for run in NON_ASCII_RUN.finditer(text):
+            for position, character in enumerate(run.group(), run.start()):
+                description = descriptions.get(character)
+                if description is not None:
+                    pieces.append(text[end:position])
+                    pieces.append(description if position == 0 or text[position - 1] == ' ' else ' ' + description)
+                    end = position + 1
+        if not pieces:
+            return text.strip()
+        pieces.append(text[end:])
+        return ''.join(pieces).strip()
+
+    def __replace_characters(self, text: str) -> str:
+        """
+        Return the provided text with its emojis replaced character by character, as the VADER analyzer does,
+        for the emoji tables holding ASCII characters.
+        :param text: input text
+        :return: the text without emojis
+        """
+        text_no_emoji = ''
+        prev_space = True
+        for character in text:
+            if character in self._characters:
+                if not prev_space:
+                    text_no_emoji += ' '
+                text_no_emoji += self._descriptions[character]
+                prev_space = False
+            else:
+                text_no_emoji += character
+                prev_space = character == ' '
+        return text_no_emoji.strip()
+
+
+def get_words_and_emoticons(text: str) -> list[str]:
+    """
+    Return the tokens of the provided text as the VADER analyzer splits them :
+    leading and trailing punctuation removed, except for the tokens that would be left
+    with two characters or less, which are likely emoticons.
+    :param text: input text without emojis
+    :return: the list of tokens
+    """
+    tokens = []
+    for token in text.split():
+        stripped = token.strip(string.punctuation)
+        tokens.append(token if len(stripped) <= 2 else stripped)
+    return tokens
+
+
+def get_punctuation_emphasis(text: str) -> float:
+    """
+    Return the VADER emphasis amplifier of the exclamation points and question marks of the provided text.
+    :param text: input text without emojis
+    :return: the float amplifier added to the absolute sentiment sum
+    """
+    return get_emphasis_amplifier(text.count('!'), text.count('?'))
+
+
+def get_emphasis_amplifier(exclamation_count: int, question_count: int) -> float:
+    """
+    Return the VADER emphasis amplifier of the provided numbers of exclamation points and question marks.
+    :param exclamation_count: number of "!" of the text
+    :param question_count: number of "?" of the text
+    :return: the float amplifier added to the absolute sentiment sum
+    """
+    exclamation_count = min(exclamation_count, 4)
+    question_amplifier = 0
+    if question_count > 1:
+        question_amplifier = question_count * 0.18 if question_count <= 3 else 0.96
+    return exclamation_count * 0.292 + question_amplifier
+
+
+def split_sentences(text: str) -> list[tuple[int, int]]:
+    """
+    Return the character spans of the sentences of the provided text, in linear time.
+    A sentence ends at whitespaces preceded by ".", "!" or "?", possibly followed by closing quotes
+    or brackets, or at whitespaces containing a blank line.
+    :param text: input document
+    :return: the list of (start, end) offsets of the non blank sentences, leading and trailing whitespaces excluded
+    """
+    spans = []
+    start = 0
+    for boundary in SENTENCE_BOUNDARY.finditer(text):
+        end = boundary.end(1) if boundary.group(1) is not None else boundary.start()
+        spans.append((start, end))
+        start = boundary.end()
+    spans.append((start, len(text)))
+    return [__strip_span(text, span_start, span_end) for span_start, span_end in spans
+            if not text[span_start:span_end].isspace() and span_start < span_end]
+
+
+def __strip_span(text: str, start: int, end: int) -> tuple[int, int]:
+    """
+    Return the provided span of the text without its leading and trailing whitespaces.
+    :param text: input document
+    :param start: start offset of the span
+    :param end: end offset of the span
+    :return: the (start, end) offsets of the stripped span
+    """
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
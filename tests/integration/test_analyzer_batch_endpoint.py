@@ -0,0 +1,118 @@
+import requests
+import json
+from tests import fake_constants_service as fct
+import os
+
+# Get current Flask app host
+host = os.getenv('SENTIMENT_ANALYSIS_HOST')
+
+# Get current Flask app port
+port = os.getenv('FLASK_RUN_PORT')
+
+
+def __post_batch(body) -> requests.Response:
+    """
+    Send the provided JSON body to the batch analyzer endpoint route.
+    :param body: the JSON serializable request body
+    :return: the endpoint response
+    """
+    url_prefix = fct.get_analyzer_endpoint_url_prefix()
+    url_suffix = fct.get_analyzer_batch_endpoint_url_suffix()
+    url = f'http://{host}:{port}/{url_prefix}/{url_suffix}'
+    content_type = fct.get_application_content_type()
+    headers = {'content-type': content_type}
+    return requests.post(url, data=json.dumps(body), headers=headers)
+
+
+def test_batch_returns_sentiments_in_input_order():
+    """
+    Test if sending a batch of valid inputs to the batch analyzer endpoint route
+    results in a 200 OK response with the extracted sentiment of each input in input order.
+    """
+    sentiment_key = fct.get_response_sentiment_key()
+    expected_body = [{sentiment_key: fct.get_positivity_label()},
+                     {sentiment_key: fct.get_negativity_label()},
+                     {sentiment_key: fct.get_neutrality_label()},
+                     {sentiment_key: fct.get_positivity_label()}]
+    inputs = ['This is a great book', 'This is a terrible book', 'x', 'This is a great book']
+    response = __post_batch({fct.get_analyzer_batch_endpoint_key(): inputs})
+    assert response.status_code == 200
+    assert response.json() == expected_body
+
+
+def test_batch_returns_per_input_errors():
+    """
+    Test if sending a batch with invalid inputs to the batch analyzer endpoint route
+    results in a 200 OK response with an error message for each invalid input only.
+    """
+    message_key = fct.get_response_message_key()
+    expected_body = [{message_key: fct.get_none_batch_input_message()},
+                     {fct.get_response_sentiment_key(): fct.get_positivity_label()},
+                     {message_key: fct.get_too_big_input_length_message()},
+                     {message_key: fct.get_not_text_input_message()}]
+    inputs = [None, 'This is a great book', 'x' * (fct.get_max_input_length() + 1), 42]
+    response = __post_batch({fct.get_analyzer_batch_endpoint_key(): inputs})
+    assert response.status_code == 200
+    assert response.json() == expected_body
+
+
+def test_empty_batch_returns_empty_list():
+    """
+    Test if sending an empty batch to the batch analyzer endpoint route
+    results in a 200 OK response with an empty list.
+    """
+    response = __post_batch({fct.get_analyzer_batch_endpoint_key(): []})
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_missing_batch_input_key_returns_400():
+    """
+    Test if sending a request without "inputs" key to the batch analyzer endpoint route
+    results in the expected 400 Bad Request response message.
+    """
+    expected_body = {fct.get_response_message_key(): fct.get_missing_batch_input_key_message()}
+    response = __post_batch({})
+    assert response.status_code == 400
+    assert response.json() == expected_body
+
+
+def test_too_many_batch_inputs_returns_400():
+    """
+    Test if sending more inputs than accepted to the batch analyzer endpoint route
+    results in the expected 400 Bad Request response message.
+    """
+    expected_body = {fct.get_response_message_key(): fct.get_too_many_batch_inputs_message()}
+    response = __post_batch({fct.get_analyzer_batch_endpoint_key(): ['x'] * (fct.get_max_batch_items() + 1)})
+    assert response.status_code == 400
+    assert response.json() == expected_body
+
+
+def test_too_big_batch_payload_returns_400():
+    """
+    Test if sending a request body bigger than accepted to the batch analyzer endpoint route
+    results in the expected 400 Bad Request response message.
+    """
+    expected_body = {fct.get_response_message_key(): fct.get_too_big_batch_payload_message()}
+    too_big_input = 'x' * fct.get_max_batch_payload_size()
+    response = __post_batch({fct.get_analyzer_batch_endpoint_key(): [too_big_input]})
+    assert response.status_code == 400
+    assert response.json() == expected_body
+
+
+def test_too_big_chunked_batch_payload_returns_400():
+    """
+    Test if sending a chunked request body, without Content-Length header, bigger than accepted
+    to the batch analyzer endpoint route results in the expected 400 Bad Request response message,
+    a chunked request body within the limit being scored.
+    """
+    url_prefix = fct.get_analyzer_endpoint_url_prefix()
+    url_suffix = fct.get_analyzer_batch_endpoint_url_suffix()
+    url = f'http://{host}:{port}/{url_prefix}/{url_suffix}'
+    headers = {'content-type': fct.get_application_content_type()}
+    for user_input, expected_status_code in [('x' * fct.get_max_batch_payload_size(), 400), ('Great!', 200)]:
+        body = json.dumps({fct.get_analyzer_batch_endpoint_key(): [user_input]}).encode('utf-8')
+        chunks = (body[index:index + 65536] for index in range(0, len(body), 65536))
+        response = requests.post(url, data=chunks, headers=headers)
+        assert response.status_code == expected_status_code
+    assert response.json() == [{fct.get_response_sentiment_key(): fct.get_positivity_label()}]
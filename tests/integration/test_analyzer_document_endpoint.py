@@ -0,0 +1,71 @@
+import requests
+import json
+from tests import fake_constants_service as fct
+import os
+
+# Get current Flask app host
+host = os.getenv('SENTIMENT_ANALYSIS_HOST')
+
+# Get current Flask app port
+port = os.getenv('FLASK_RUN_PORT')
+
+
+def __post_document(body) -> requests.Response:
+    """
+    Send the provided JSON body to the document analyzer endpoint route.
+    :param body: the JSON serializable request body
+    :return: the endpoint response
+    """
+    url_prefix = fct.get_analyzer_endpoint_url_prefix()
+    url_suffix = fct.get_analyzer_document_endpoint_url_suffix()
+    url = f'http://{host}:{port}/{url_prefix}/{url_suffix}'
+    content_type = fct.get_application_content_type()
+    headers = {'content-type': content_type}
+    return requests.post(url, data=json.dumps(body), headers=headers)
+
+
+def test_document_returns_sentence_results():
+    """
+    Test if sending a document longer than the max input length to the document analyzer endpoint route
+    results in a 200 OK response with the result of each sentence and the document sentiment.
+    """
+    sentences = ['This is a great book.', 'The ending is terrible!'] * 50
+    response = __post_document({fct.get_analyzer_endpoint_key(): ' '.join(sentences)})
+    body = response.json()
+    sentence_results = body[fct.get_response_sentences_key()]
+    assert response.status_code == 200
+    assert [result[fct.get_response_sentence_key()] for result in sentence_results] == sentences
+    assert sentence_results[0][fct.get_response_sentiment_key()] == fct.get_positivity_label()
+    assert sentence_results[1][fct.get_response_sentiment_key()] == fct.get_negativity_label()
+    assert set(body[fct.get_response_scores_key()]) == {'neg', 'neu', 'pos', 'compound'}
+    assert body[fct.get_response_sentiment_key()] in [fct.get_positivity_label(), fct.get_neutrality_label(),
+                                                     fct.get_negativity_label()]
+
+
+def test_too_big_document_returns_400_too_big_document_message():
+    """
+    Test if sending a document longer than the max document length to the document analyzer endpoint route
+    results in a 400 Bad Request response with the expected message.
+    """
+    response = __post_document({fct.get_analyzer_endpoint_key(): 'x' * (fct.get_max_document_length() + 1)})
+    assert response.status_code == 400
+    assert response.json() == {fct.get_response_message_key(): fct.get_too_big_document_length_message()}
+
+
+def test_missed_deadline_returns_degraded_document():
+    """
+    Test if sending a document with a deadline its scoring can not meet to the document analyzer endpoint route
+    results in a 200 OK response with approximated sentence scores marked as degraded.
+    """
+    url_suffix = fct.get_analyzer_document_endpoint_url_suffix()
+    url = f'http://{host}:{port}/{fct.get_analyzer_endpoint_url_prefix()}/{url_suffix}'
+    headers = {'content-type': fct.get_application_content_type(), fct.get_deadline_header(): '0.000001'}
+    body = json.dumps({fct.get_analyzer_endpoint_key(): 'This is a great book. The ending is terrible!'})
+    response = requests.post(url, data=body, headers=headers)
+    sentence_results = response.json()[fct.get_response_sentences_key()]
+    assert response.status_code == 200
+    assert response.headers[fct.get_degraded_header()] == 'true'
+    assert response.json()[fct.get_response_degraded_key()] is True
+    assert sentence_results[0][fct.get_response_sentiment_key()] == fct.get_positivity_label()
+    assert sentence_results[1][fct.get_response_sentiment_key()] == fct.get_negativity_label()
+
@@ -0,0 +1,117 @@
+import requests
+import json
+from tests import fake_constants_service as fct
+import os
+from typing import Optional
+
+# Get current Flask app host
+host = os.getenv('SENTIMENT_ANALYSIS_HOST')
+
+# Get current Flask app port
+port = os.getenv('FLASK_RUN_PORT')
+
+
+def __post_analyzer(body, deadline: Optional[str] = None) -> requests.Response:
+    """
+    Send the provided JSON body to the analyzer endpoint route.
+    :param body: the JSON serializable request body
+    :param deadline: the deadline header value in milliseconds, if any
+    :return: the endpoint response
+    """
+    url_prefix = fct.get_analyzer_endpoint_url_prefix()
+    url = f'http://{host}:{port}/{url_prefix}'
+    content_type = fct.get_application_content_type()
+    headers = {'content-type': content_type}
+    if deadline is not None:
+        headers[fct.get_deadline_header()] = deadline
+    return requests.post(url, data=json.dumps(body), headers=headers)
+
+
+def test_scores_flag_returns_sentiment_and_polarities():
+    """
+    Test if sending a valid input with a true "scores" component to the analyzer endpoint route
+    results in a 200 OK response with the extracted sentiment and its polarity scores.
+    """
+    response = __post_analyzer({fct.get_analyzer_endpoint_key(): 'This is a great book',
+                                fct.get_analyzer_endpoint_scores_key(): True})
+    body = response.json()
+    assert response.status_code == 200
+    assert body[fct.get_response_sentiment_key()] == fct.get_positivity_label()
+    assert set(body[fct.get_response_scores_key()]) == {'neg', 'neu', 'pos', 'compound'}
+    assert body[fct.get_response_scores_key()]['compound'] > fct.get_threshold()
+
+
+def test_custom_threshold_and_labels_are_applied():
+    """
+    Test if sending a valid input with a high "threshold" and custom "labels" components to the analyzer
+    endpoint route results in a 200 OK response with the custom neutral label.
+    """
+    response = __post_analyzer({fct.get_analyzer_endpoint_key(): 'This is a great book',
+                                fct.get_analyzer_endpoint_threshold_key(): 0.99,
+                                fct.get_analyzer_endpoint_labels_key(): {fct.get_neutrality_label_key(): 'meh'}})
+    assert response.status_code == 200
+    assert response.json() == 'meh'
+
+
+def test_invalid_threshold_returns_400_invalid_threshold_message():
+    """
+    Test if sending an out of range "threshold" component to the analyzer endpoint route
+    results in a 400 Bad Request response with the expected message.
+    """
+    response = __post_analyzer({fct.get_analyzer_endpoint_key(): 'This is a great book',
+                                fct.get_analyzer_endpoint_threshold_key(): 2})
+    assert response.status_code == 400
+    assert response.json() == {fct.get_response_message_key(): fct.get_invalid_threshold_message()}
+
+
+def test_engine_selects_scoring_engine():
+    """
+    Test if sending a valid input with the name of a scoring engine as "engine" component to the analyzer
+    endpoint route results in a 200 OK response with the sentiment extracted by that engine.
+    """
+    response = __post_analyzer({fct.get_analyzer_endpoint_key(): 'This is a great book',
+                                fct.get_analyzer_endpoint_engine_key(): fct.get_engine()})
+    assert response.status_code == 200
+    assert response.json() == fct.get_positivity_label()
+
+
+def test_unknown_engine_returns_400_unknown_engine_message():
+    """
+    Test if sending an unknown "engine" component to the analyzer endpoint route
+    results in a 400 Bad Request response with the expected message.
+    """
+    response = __post_analyzer({fct.get_analyzer_endpoint_key(): 'This is a great book',
+                                fct.get_analyzer_endpoint_engine_key(): 'unknown'})
+    assert response.status_code == 400
+    assert response.json() == {fct.get_response_message_key(): fct.get_unknown_engine_message()}
+
+
+def test_missed_deadline_returns_degraded_scores():
+    """
+    Test if sending an input with a deadline its scoring can not meet to the analyzer endpoint route
+    results in a 200 OK response with approximated scores marked as degraded,
+    and if a deadline it can meet gives the usual response.
+    """
+    body = {fct.get_analyzer_endpoint_key(): 'The food is great and the view is lovely',
+            fct.get_analyzer_endpoint_scores_key(): True}
+    response = __post_analyzer(body, '0.000001')
+    assert response.status_code == 200
+    assert response.headers[fct.get_degraded_header()] == 'true'
+    assert response.json()[fct.get_response_degraded_key()] is True
+    assert response.json()[fct.get_response_sentiment_key()] == fct.get_positivity_label()
+    response = __post_analyzer({fct.get_analyzer_endpoint_key(): 'This is a great book'}, '0.000001')
+    assert response.headers[fct.get_degraded_header()] == 'true'
+    assert response.json() == fct.get_positivity_label()
+    response = __post_analyzer(body, '60000')
+    assert fct.get_degraded_header() not in response.headers
+    assert fct.get_response_degraded_key() not in response.json()
+
+
+def test_invalid_deadline_returns_400_invalid_deadline_message():
+    """
+    Test if sending a deadline header that is not a positive number to the analyzer endpoint route
+    results in a 400 Bad Request response with the expected message.
+    """
+    response = __post_analyzer({fct.get_analyzer_endpoint_key(): 'This is a great book'}, 'soon')
+    assert response.status_code == 400
+    assert response.json() == {fct.get_response_message_key(): fct.get_invalid_deadline_message()}
@@ -0,0 +1,30 @@
+import requests
+import json
+from tests import fake_constants_service as fct
+import os
+
+# Get current Flask app host
+host = os.getenv('SENTIMENT_ANALYSIS_HOST')
+
+# Get current Flask app port
+port = os.getenv('FLASK_RUN_PORT')
+
+
+def test_stream_returns_ndjson_sentiments_in_input_order():
+    """
+    Test if streaming newline-delimited JSON inputs to the streaming analyzer endpoint route
+    results in a 200 OK response streaming the extracted sentiment of each line in input order.
+    """
+    sentences = ['This is a great book', 'This is a terrible book', 'x'] * 1000
+    input_key = fct.get_analyzer_endpoint_key()
+    url_prefix = fct.get_analyzer_endpoint_url_prefix()
+    url_suffix = fct.get_analyzer_stream_endpoint_url_suffix()
+    url = f'http://{host}:{port}/{url_prefix}/{url_suffix}'
+    headers = {'content-type': fct.get_ndjson_content_type()}
+    body = (json.dumps({input_key: sentence}).encode('utf-8') + b'\n' for sentence in sentences)
+    response = requests.post(url, data=body, headers=headers, stream=True)
+    results = [json.loads(line) for line in response.iter_lines() if line]
+    expected_sentiments = [fct.get_positivity_label(), fct.get_negativity_label(), fct.get_neutrality_label()] * 1000
+    assert response.status_code == 200
+    assert response.headers['content-type'] == fct.get_ndjson_content_type()
+    assert [result[fct.get_response_sentiment_key()] for result in results] == expected_sentiments
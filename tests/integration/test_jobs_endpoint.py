@@ -0,0 +1,93 @@
+import requests
+import json
+import time
+from tests import fake_constants_service as fct
+import os
+
+# Get current Flask app host
+host = os.getenv('SENTIMENT_ANALYSIS_HOST')
+
+# Get current Flask app port
+port = os.getenv('FLASK_RUN_PORT')
+
+# Jobs endpoint url
+jobs_url = f'http://{host}:{port}/{fct.get_jobs_endpoint_url_prefix()}'
+
+
+def __wait_for_job(job_id: str) -> dict:
+    """
+    Poll the status of the provided job until it is done or failed, for at most 30 seconds.
+    :param job_id: the id of a job
+    :return: the last job status response body
+    """
+    body = {}
+    for _ in range(300):
+        body = requests.get(f'{jobs_url}/{job_id}').json()
+        if body['status'] in ['done', 'failed']:
+            break
+        time.sleep(0.1)
+    return body
+
+
+def test_submitted_job_results_are_paged_in_input_order():
+    """
+    Test if submitting a job to the jobs endpoint route results in a 202 Accepted response with a job id,
+    and if its results can be paged through in input order once it is done.
+    """
+    headers = {'content-type': fct.get_application_content_type()}
+    inputs = ['This is a great book', 'This is a terrible book', 'x'] * 10
+    body = json.dumps({fct.get_analyzer_batch_endpoint_key(): inputs})
+    response = requests.post(jobs_url, data=body, headers=headers)
+    job_id = response.json()[fct.get_response_job_id_key()]
+    assert response.status_code == 202
+    assert response.headers['Location'].endswith(f'/{fct.get_jobs_endpoint_url_prefix()}/{job_id}')
+    assert __wait_for_job(job_id)['done'] == len(inputs)
+    results = []
+    offset = 0
+    while offset is not None:
+        url = f'{jobs_url}/{job_id}/{fct.get_jobs_results_endpoint_url_suffix()}'
+        page = requests.get(url, params={fct.get_results_offset_parameter(): offset,
+                                         fct.get_results_limit_parameter(): 7}).json()
+        results += page[fct.get_response_results_key()]
+        offset = page[fct.get_response_next_offset_key()]
+    sentiment_key = fct.get_response_sentiment_key()
+    expected_results = [{sentiment_key: fct.get_positivity_label()},
+                        {sentiment_key: fct.get_negativity_label()},
+                        {sentiment_key: fct.get_neutrality_label()}] * 10
+    assert results == expected_results
+
+
+def test_unknown_job_returns_404():
+    """
+    Test if getting the status of a job that does not exist results in a 404 Not Found response.
+    """
+    response = requests.get(f'{jobs_url}/unknown')
+    assert response.status_code == 404
+    assert response.json() == {fct.get_response_message_key(): fct.get_unknown_job_message()}
+
+
+def test_job_without_inputs_array_returns_400():
+    """
+    Test if submitting a job without an inputs array results in a 400 Bad Request response.
+    """
+    headers = {'content-type': fct.get_application_content_type()}
+    body = json.dumps({fct.get_analyzer_batch_endpoint_key(): 'This is a great book'})
+    response = requests.post(jobs_url, data=body, headers=headers)
+    assert response.status_code == 400
+    assert response.json() == {fct.get_response_message_key(): fct.get_not_array_batch_input_message()}
+
+
+def test_invalid_results_page_returns_400():
+    """
+    Test if getting the results of a job with a non integer or out of range "offset" or "limit" query parameter
+    results in a 400 Bad Request response with the invalid page message.
+    """
+    headers = {'content-type': fct.get_application_content_type()}
+    body = json.dumps({fct.get_analyzer_batch_endpoint_key(): ['This is a great book']})
+    job_id = requests.post(jobs_url, data=body, headers=headers).json()[fct.get_response_job_id_key()]
+    url = f'{jobs_url}/{job_id}/{fct.get_jobs_results_endpoint_url_suffix()}'
+    for params in [{fct.get_results_offset_parameter(): 'abc'}, {fct.get_results_limit_parameter(): 'xyz'},
+                   {fct.get_results_offset_parameter(): -1}, {fct.get_results_limit_parameter(): 0}]:
+        response = requests.get(url, params=params)
+        assert response.status_code == 400
+        assert response.json() == {fct.get_response_message_key(): fct.get_invalid_results_page_message()}
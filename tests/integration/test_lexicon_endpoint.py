@@ -0,0 +1,51 @@
+import pytest
+import requests
+from tests import fake_constants_service as fct
+import os
+
+# Get current Flask app host
+host = os.getenv('SENTIMENT_ANALYSIS_HOST')
+
+# Get current Flask app port
+port = os.getenv('FLASK_RUN_PORT')
+
+
+def test_lexicon_returns_version_and_overlay_size():
+    """
+    Test if requesting the lexicon endpoint route results in a 200 OK response
+    with the lexicon version and number of overlaid tokens, also returned by the statistics endpoint route.
+    """
+    url = f'http://{host}:{port}/{fct.get_lexicon_endpoint_url_prefix()}'
+    response = requests.get(url)
+    body = response.json()
+    assert response.status_code == 200
+    assert set(body) == {fct.get_response_lexicon_version_key(), fct.get_response_overlay_tokens_key()}
+    stats_url = f'http://{host}:{port}/{fct.get_stats_endpoint_url_prefix()}'
+    assert requests.get(stats_url).json()[fct.get_lexicon_stats_key()] == body
+
+
+@pytest.mark.skipif(not fct.get_lexicon_reload_token(), reason='the lexicon reload token is not configured')
+def test_reload_keeps_lexicon_version_when_overlays_did_not_change():
+    """
+    Test if reloading the lexicon overlays through the lexicon reload endpoint route results in a 200 OK response
+    with the same lexicon version when the overlay files did not change.
+    """
+    url = f'http://{host}:{port}/{fct.get_lexicon_endpoint_url_prefix()}'
+    version_key = fct.get_response_lexicon_version_key()
+    version = requests.get(url).json()[version_key]
+    headers = {fct.get_lexicon_reload_token_header(): fct.get_lexicon_reload_token()}
+    response = requests.post(f'{url}/{fct.get_lexicon_reload_endpoint_url_suffix()}', headers=headers)
+    assert response.status_code == 200
+    assert response.json()[version_key] == version
+
+
+def test_reload_without_token_returns_403():
+    """
+    Test if reloading the lexicon overlays without the configured reload token results in a 403 Forbidden response
+    with the forbidden lexicon reload message.
+    """
+    url = f'http://{host}:{port}/{fct.get_lexicon_endpoint_url_prefix()}/{fct.get_lexicon_reload_endpoint_url_suffix()}'
+    for headers in [{}, {fct.get_lexicon_reload_token_header(): f'not {fct.get_lexicon_reload_token()}'}]:
+        response = requests.post(url, headers=headers)
+        assert response.status_code == 403
+        assert response.json() == {fct.get_response_message_key(): fct.get_forbidden_lexicon_reload_message()}
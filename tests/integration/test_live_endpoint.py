@@ -0,0 +1,92 @@
+import json
+
+import requests
+from tests import fake_constants_service as fct
+import os
+
+# Get current Flask app host
+host = os.getenv('SENTIMENT_ANALYSIS_HOST')
+
+# Get current Flask app port
+port = os.getenv('FLASK_RUN_PORT')
+
+# Live analysis endpoint url
+live_url = f'http://{host}:{port}/{fct.get_live_endpoint_url_prefix()}'
+
+
+def __create_session() -> str:
+    """
+    Create a live session and return its id.
+    :return: the live session id
+    """
+    response = requests.post(live_url)
+    assert response.status_code == 201
+    return response.json()[fct.get_response_session_id_key()]
+
+
+def __post_update(session_id: str, body: str) -> requests.Response:
+    """
+    Send the provided body to the provided live session.
+    :param session_id: the id of a live session
+    :param body: the request body
+    :return: the response
+    """
+    headers = {'content-type': fct.get_application_content_type()}
+    return requests.post(f'{live_url}/{session_id}', data=body, headers=headers)
+
+
+def __read_event(lines) -> dict:
+    """
+    Return the data of the next event of a live analysis event stream, skipping keep-alive comments.
+    :param lines: iterator over the decoded lines of the event stream
+    :return: the event data
+    """
+    for line in lines:
+        if line.startswith('data: '):
+            return json.loads(line[len('data: '):])
+    return {}
+
+
+def test_typed_text_is_scored_once_it_stops_changing():
+    """
+    Test if a burst of updates of a live session is pushed as a single event with the sentiment of its last text,
+    and if the next update only scores the sentences that changed.
+    """
+    session_id = __create_session()
+    events_url = f'{live_url}/{session_id}/{fct.get_live_events_endpoint_url_suffix()}'
+    with requests.get(events_url, stream=True, timeout=30) as events:
+        assert events.status_code == 200
+        assert events.headers['content-type'].startswith(fct.get_event_stream_content_type())
+        lines = events.iter_lines(decode_unicode=True)
+        text = 'I love this phone.'
+        for length in range(1, len(text) + 1):
+            assert __post_update(session_id, json.dumps({fct.get_analyzer_endpoint_key(): text[:length]})) \
+                       .status_code == 202
+        event = __read_event(lines)
+        assert event[fct.get_response_sentiment_key()] == fct.get_positivity_label()
+        assert event[fct.get_response_rescored_key()] == 1
+        __post_update(session_id, json.dumps({fct.get_analyzer_endpoint_key(): f'{text} The battery is awful!'}))
+        event = __read_event(lines)
+        assert len(event[fct.get_response_sentences_key()]) == 2
+        assert event[fct.get_response_rescored_key()] == 1
+
+
+def test_invalid_live_update_returns_400():
+    """
+    Test if a live update without a text input results in a 400 Bad Request response.
+    """
+    session_id = __create_session()
+    response = __post_update(session_id, json.dumps({fct.get_analyzer_endpoint_key(): 42}))
+    assert response.status_code == 400
+    assert response.json()[fct.get_response_message_key()] == fct.get_not_text_input_message()
+
+
+def test_unknown_live_session_returns_404():
+    """
+    Test if updating or listening to an unknown live session results in a 404 Not Found response.
+    """
+    response = __post_update('unknown', json.dumps({fct.get_analyzer_endpoint_key(): 'text'}))
+    assert response.status_code == 404
+    assert response.json()[fct.get_response_message_key()] == fct.get_unknown_live_session_message()
+    response = requests.get(f'{live_url}/unknown/{fct.get_live_events_endpoint_url_suffix()}')
+    assert response.status_code == 404
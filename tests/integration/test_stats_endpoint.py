@@ -0,0 +1,82 @@
+import requests
+import json
+from tests import fake_constants_service as fct
+import os
+
+# Get current Flask app host
+host = os.getenv('SENTIMENT_ANALYSIS_HOST')
+
+# Get current Flask app port
+port = os.getenv('FLASK_RUN_PORT')
+
+
+def test_stats_counts_result_cache_hits():
+    """
+    Test if sending the same input twice to the analyzer endpoint route
+    increases the result cache hit counter returned by the statistics endpoint route.
+    """
+    analyzer_url = f'http://{host}:{port}/{fct.get_analyzer_endpoint_url_prefix()}'
+    stats_url = f'http://{host}:{port}/{fct.get_stats_endpoint_url_prefix()}'
+    cache_key = fct.get_result_cache_stats_key()
+    headers = {'content-type': fct.get_application_content_type()}
+    body = json.dumps({fct.get_analyzer_endpoint_key(): 'This statistics test input is a great cached input'})
+    requests.post(analyzer_url, data=body, headers=headers)
+    hits_before = requests.get(stats_url).json()[cache_key]['hits']
+    requests.post(analyzer_url, data=body, headers=headers)
+    response = requests.get(stats_url)
+    assert response.status_code == 200
+    assert response.json()[cache_key]['hits'] == hits_before + 1
+
+
+def test_stats_counts_single_token_answers():
+    """
+    Test if the statistics endpoint route returns the number of single token answers and the capacity of the table,
+    a single token input being answered with the same sentiment as when it is scored.
+    """
+    analyzer_url = f'http://{host}:{port}/{fct.get_analyzer_endpoint_url_prefix()}'
+    stats_url = f'http://{host}:{port}/{fct.get_stats_endpoint_url_prefix()}'
+    headers = {'content-type': fct.get_application_content_type()}
+    body = json.dumps({fct.get_analyzer_endpoint_key(): 'Great!'})
+    response = requests.post(analyzer_url, data=body, headers=headers)
+    assert response.json() == fct.get_positivity_label()
+    answer_stats = requests.get(stats_url).json()[fct.get_answer_table_stats_key()]
+    assert answer_stats['entries'] > 0
+    assert answer_stats['capacity'] == fct.get_answer_table_size()
+
+
+def test_stats_counts_cascade_escalations():
+    """
+    Test if scoring an input with the cascade engine increases the number of texts counted by the statistics
+    endpoint route, along with the number of them escalated to VADER.
+    """
+    analyzer_url = f'http://{host}:{port}/{fct.get_analyzer_endpoint_url_prefix()}'
+    stats_url = f'http://{host}:{port}/{fct.get_stats_endpoint_url_prefix()}'
+    cascade_key = fct.get_cascade_stats_key()
+    headers = {'content-type': fct.get_application_content_type()}
+    stats_before = requests.get(stats_url).json()[cascade_key]
+    for user_input in ['The food is great and the view is lovely', 'The food is not great']:
+        body = json.dumps({fct.get_analyzer_endpoint_key(): user_input,
+                           fct.get_analyzer_endpoint_engine_key(): 'cascade'})
+        assert requests.post(analyzer_url, data=body, headers=headers).status_code == 200
+    stats = requests.get(stats_url).json()[cascade_key]
+    assert stats['texts'] == stats_before['texts'] + 2
+    assert stats['escalated'] == stats_before['escalated'] + 1
+    assert 0 < stats['escalated_fraction'] <= 1
+
+
+def test_stats_counts_degraded_responses():
+    """
+    Test if sending an input with a deadline its scoring can not meet to the analyzer endpoint route
+    increases the numbers of requests with a budget and of degraded responses returned by the statistics endpoint route.
+    """
+    analyzer_url = f'http://{host}:{port}/{fct.get_analyzer_endpoint_url_prefix()}'
+    stats_url = f'http://{host}:{port}/{fct.get_stats_endpoint_url_prefix()}'
+    deadline_key = fct.get_deadline_stats_key()
+    headers = {'content-type': fct.get_application_content_type(), fct.get_deadline_header(): '0.000001'}
+    stats_before = requests.get(stats_url).json()[deadline_key]
+    body = json.dumps({fct.get_analyzer_endpoint_key(): 'The food is great and the view is lovely'})
+    assert requests.post(analyzer_url, data=body, headers=headers).status_code == 200
+    stats = requests.get(stats_url).json()[deadline_key]
+    assert stats['budgeted'] == stats_before['budgeted'] + 1
+    assert stats['degraded'] == stats_before['degraded'] + 1
+
@@ -1,3 +1,4 @@
+from services import batch_service as bs
 from services import extractor_service as ex
 from tests import fake_constants_service as fct
 
@@ -18,6 +19,18 @@ def test_min_80_percent_accuracy():
     assert accuracy >= accuracy_threshold
 
 
+def test_min_80_percent_accuracy_with_batch_engine():
+    """
+    Test whether the batch engine accuracy on the test dataset is superior or equal to 80 percent.
+    """
+    accuracy_threshold = 0.8
+    df = pd.read_csv('./tests/unit/data/accuracy_test_data.csv')
+    expected_sentiments = __get_expected_sentiments(df)
+    extracted_sentiments = bs.get_sentiments(df['text_snippet'].tolist())
+    accuracy = accuracy_score(expected_sentiments, extracted_sentiments)
+    assert accuracy >= accuracy_threshold
+
+
 def __get_expected_sentiments(df: pd.DataFrame) -> pd.Series:
     """
     Return a pandas Series containing the expected sentiments from each row of the provided DataFrame.
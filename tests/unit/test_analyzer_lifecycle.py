@@ -0,0 +1,60 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from services import analyzer_service as an
+from services import extractor_service as ex
+
+
+def test_get_analyzer_returns_shared_instance():
+    """
+    Test if successive calls to get the analyzer return the same instance.
+    """
+    first_analyzer = an.get_analyzer()
+    second_analyzer = an.get_analyzer()
+    assert first_analyzer is second_analyzer
+
+
+def test_warm_up_returns_shared_instance():
+    """
+    Test if warming up an already built analyzer returns the shared instance.
+    """
+    analyzer = an.get_analyzer()
+    assert an.warm_up() is analyzer
+
+
+def test_concurrent_get_analyzer_returns_single_instance():
+    """
+    Test if concurrent calls to get the analyzer all return the same instance.
+    """
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        analyzers = list(executor.map(lambda _: an.get_analyzer(), range(32)))
+    assert all(analyzer is analyzers[0] for analyzer in analyzers)
+
+
+def test_get_sentiment_does_not_parse_lexicon(monkeypatch):
+    """
+    Test if extracting sentiments from a warm analyzer never parses the lexicon files again.
+    """
+    an.warm_up()
+    parsing_calls = []
+    original_make_lex_dict = SentimentIntensityAnalyzer.make_lex_dict
+
+    def counting_make_lex_dict(analyzer):
+        parsing_calls.append(analyzer)
+        return original_make_lex_dict(analyzer)
+
+    monkeypatch.setattr(SentimentIntensityAnalyzer, 'make_lex_dict', counting_make_lex_dict)
+    for sentence in ['This is a great book', 'This is a terrible book', 'x']:
+        ex.get_sentiment(sentence)
+    assert len(parsing_calls) == 0
+
+
+def test_reload_swaps_shared_instance():
+    """
+    Test if reloading the analyzer replaces the shared instance with a new one.
+    """
+    previous_analyzer = an.get_analyzer()
+    reloaded_analyzer = an.reload()
+    assert reloaded_analyzer is not previous_analyzer
+    assert an.get_analyzer() is reloaded_analyzer
@@ -0,0 +1,107 @@
+import pytest
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from services import analyzer_service as an
+from services import constants_service as ct
+from services import extractor_service as ex
+from services import pool_service as ps
+from services import scorer_service as sc
+
+# Trailing punctuations of the single token inputs checked against the stock analyzer
+punctuations = ['', '.', '!', '!!', '!!!', '!!!!!', '?', '??', '????', '!?']
+
+
+def get_single_token_texts(analyzer: SentimentIntensityAnalyzer) -> list[str]:
+    """
+    Return every lexicon token in its own, lower, upper and capitalized casings and every emoji,
+    each one followed by every checked trailing punctuation, skipping the ones holding whitespace.
+    """
+    words = {word for token in analyzer.lexicon for word in [token, token.lower(), token.upper(), token.capitalize()]}
+    words.update(emoji for emoji in analyzer.emojis if len(emoji) == 1)
+    return [word + punctuation for word in sorted(words) for punctuation in punctuations
+            if (word + punctuation).split() == [word + punctuation]]
+
+
+@pytest.fixture
+def overlay_path(tmp_path, monkeypatch):
+    """
+    Return the path of a lexicon overlay file applied by the next reload, the overlays being removed after the test.
+    """
+    path = tmp_path / 'overlay.txt'
+    path.write_text('', encoding='utf-8')
+    monkeypatch.setenv('SENTIMENT_LEXICON_OVERLAYS', str(path))
+    yield path
+    monkeypatch.delenv('SENTIMENT_LEXICON_OVERLAYS')
+    an.reload()
+    ps.shutdown()
+
+
+def test_every_answer_matches_the_stock_analyzer():
+    """
+    Test if the answers of every lexicon token in its usual casings and trailing punctuations, and of every emoji,
+    are the polarities of the stock VADER analyzer, and if the lexicon tokens share few enough answers
+    to fit in the default answer table.
+    """
+    shared_analyzer = an.get_analyzer()
+    analyzer = sc.MemoizedAnalyzer(shared_analyzer.lexicon, shared_analyzer.emojis, 100000, 100000)
+    stock_analyzer = SentimentIntensityAnalyzer.__new__(SentimentIntensityAnalyzer)
+    stock_analyzer.lexicon = shared_analyzer.lexicon
+    stock_analyzer.emojis = shared_analyzer.emojis
+    mismatches = []
+    for text in get_single_token_texts(analyzer):
+        answer = analyzer.get_answer(text)
+        scores = stock_analyzer.polarity_scores(text)
+        if answer is not None and answer != (scores['neg'], scores['neu'], scores['pos'], scores['compound']):
+            mismatches.append(text)
+    assert not mismatches
+    assert analyzer.get_answer('great') is not None and analyzer.get_answer('😁!') is not None
+    assert len([key for key in analyzer.answers if isinstance(key, tuple)]) < ct.get_answer_table_size()
+
+
+def test_answers_are_shared_and_bounded():
+    """
+    Test if single tokens with the same valence and punctuation emphasis share their answer, if other inputs
+    are not answered and if the table is emptied when it is full.
+    """
+    shared_analyzer = an.get_analyzer()
+    analyzer = sc.MemoizedAnalyzer(shared_analyzer.lexicon, shared_analyzer.emojis, 100000, 4)
+    assert analyzer.get_answer('great') == analyzer.get_answer('GREAT') == analyzer.get_answer('Great.')
+    assert analyzer.get_answer('great!!')[3] > analyzer.get_answer('great')[3]
+    for text in ['great book', 'xyzzy', '', 'great' + '!' * 40]:
+        assert analyzer.get_answer(text) is None
+    assert analyzer.get_answer_stats() == {'entries': 2, 'capacity': 4}
+    assert analyzer.get_answer('😁') is not None and '😁' in analyzer.answers
+    analyzer.get_answer('horrible')
+    analyzer.get_answer('horrible?')
+    assert analyzer.get_answer_stats() == {'entries': 1, 'capacity': 4}
+    disabled_analyzer = sc.MemoizedAnalyzer(shared_analyzer.lexicon, shared_analyzer.emojis, 100000)
+    assert disabled_analyzer.get_answer('great') is None and not disabled_analyzer.answers
+
+
+def test_single_token_inputs_are_not_scored(monkeypatch):
+    """
+    Test if the sentiment of a single token input is answered from the table, without scoring the text,
+    once an input with the same valence and punctuation emphasis was answered.
+    """
+    primed_sentiments = ex.get_sentiments(['Great!', 'horrible', 'meh', '😁'])
+
+    def polarity_scores(text):
+        raise AssertionError(f'"{text}" was scored')
+
+    monkeypatch.setattr(an.get_analyzer(), 'polarity_scores', polarity_scores)
+    assert ex.get_sentiment('GREAT!') == ct.get_positivity_label()
+    assert ex.get_sentiment('HORRIBLE') == ct.get_negativity_label()
+    assert ex.get_sentiments(['great!', 'Meh', '😁']) == primed_sentiments[:1] + primed_sentiments[2:]
+
+
+def test_reload_answers_with_overlays(overlay_path):
+    """
+    Test if a reloaded lexicon starts with an empty answer table and answers with its overlays.
+    """
+    assert an.get_analyzer().get_answer('Mid!') is None
+    overlay_path.write_text('mid\t-2.5\ngreat\t-1.0\n', encoding='utf-8')
+    analyzer = an.reload()
+    assert not analyzer.answers
+    assert analyzer.get_answer('Mid!')[3] < 0
+    assert analyzer.get_answer('great')[3] < 0
+    assert ex.get_sentiment('mid') == ct.get_negativity_label()
@@ -0,0 +1,65 @@
+from routes import analyzer_route as ar
+from tests import fake_constants_service as fct
+
+
+def test_none_batch_request_json_returns_none_request_json_message():
+    """
+    Test if the message associated with a None batch request body JSON is the expected one.
+    """
+    response_data = ar.get_batch_response_400_data_by_reason(None)
+    assert ar.is_invalid_batch_request_json(None)
+    assert response_data[fct.get_response_message_key()] == fct.get_none_json_request_body_message()
+
+
+def test_missing_batch_input_key_returns_missing_batch_input_key_message():
+    """
+    Test if the message associated with a missing "inputs" key is the expected one.
+    """
+    response_data = ar.get_batch_response_400_data_by_reason({fct.get_analyzer_endpoint_key(): 'x'})
+    assert response_data[fct.get_response_message_key()] == fct.get_missing_batch_input_key_message()
+
+
+def test_not_array_batch_input_returns_not_array_message():
+    """
+    Test if the message associated with an "inputs" value that is not an array is the expected one.
+    """
+    invalid_request_json = {fct.get_analyzer_batch_endpoint_key(): 'x'}
+    response_data = ar.get_batch_response_400_data_by_reason(invalid_request_json)
+    assert response_data[fct.get_response_message_key()] == fct.get_not_array_batch_input_message()
+
+
+def test_too_many_batch_inputs_returns_too_many_inputs_message():
+    """
+    Test if the message associated with too many inputs is the expected one.
+    """
+    invalid_request_json = {fct.get_analyzer_batch_endpoint_key(): ['x'] * (fct.get_max_batch_items() + 1)}
+    response_data = ar.get_batch_response_400_data_by_reason(invalid_request_json)
+    assert response_data[fct.get_response_message_key()] == fct.get_too_many_batch_inputs_message()
+
+
+def test_max_batch_inputs_is_valid():
+    """
+    Test if a batch request with the max accepted number of inputs is valid.
+    """
+    valid_request_json = {fct.get_analyzer_batch_endpoint_key(): ['x'] * fct.get_max_batch_items()}
+    assert not ar.is_invalid_batch_request_json(valid_request_json)
+
+
+def test_too_big_batch_payload_is_invalid():
+    """
+    Test if a batch request body bigger than the max accepted payload size is too big.
+    """
+    assert ar.is_too_big_batch_request(fct.get_max_batch_payload_size() + 1)
+    assert not ar.is_too_big_batch_request(fct.get_max_batch_payload_size())
+    assert not ar.is_too_big_batch_request(None)
+
+
+def test_batch_input_error_messages():
+    """
+    Test if the error message of each invalid input of a batch is the expected one.
+    """
+    assert ar.get_batch_input_error_message(None) == fct.get_none_batch_input_message()
+    assert ar.get_batch_input_error_message(42) == fct.get_not_text_input_message()
+    too_big_input = 'x' * (fct.get_max_input_length() + 1)
+    assert ar.get_batch_input_error_message(too_big_input) == fct.get_too_big_input_length_message()
+    assert ar.get_batch_input_error_message('x' * fct.get_max_input_length()) is None
@@ -0,0 +1,82 @@
+import pandas as pd
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from services import batch_service as bs
+from services import extractor_service as ex
+
+# Sentences exercising each VADER rule applied by the batch engine
+rule_sentences = [
+    'This is a GOOD book',
+    'This is a VERY GOOD book, but the END is BAD!!',
+    'good but good',
+    'good good but great great',
+    'bad bad BAD but good',
+    'no good',
+    'no or bad good',
+    'not bad at all',
+    "isn't good",
+    'nope, not good',
+    'I kind of like it',
+    'it is sort of good',
+    'just enough good',
+    'the bomb',
+    'this is the shit',
+    'it was the kiss of death',
+    'yeah right',
+    'never so good',
+    'without doubt good',
+    'at least good',
+    'least good',
+    'very least good',
+    'Wow!!!!! ???',
+    'Is it good??',
+    '😀😀 great',
+    'I ❤️ it',
+    '',
+    '   ',
+    'x'
+]
+
+
+def __assert_same_polarities(sentences: list[str]):
+    """
+    Assert that the batch engine outputs exactly the polarities of the scalar VADER analyzer.
+    :param sentences: sentences to score with both engines
+    """
+    analyzer = SentimentIntensityAnalyzer()
+    polarities = bs.get_polarities(sentences)
+    for index, sentence in enumerate(sentences):
+        expected_polarities = analyzer.polarity_scores(sentence)
+        actual_polarities = {key: polarities[key][index] for key in expected_polarities}
+        assert actual_polarities == expected_polarities, sentence
+
+
+def test_batch_polarities_match_scalar_analyzer_on_accuracy_data():
+    """
+    Test if the batch engine outputs the same polarities as the scalar analyzer on the accuracy test dataset.
+    """
+    sentences = pd.read_csv('./tests/unit/data/accuracy_test_data.csv')['text_snippet'].tolist()
+    __assert_same_polarities(sentences)
+
+
+def test_batch_polarities_match_scalar_analyzer_on_vader_rules():
+    """
+    Test if the batch engine outputs the same polarities as the scalar analyzer
+    on sentences exercising the negation, booster, capitalization, idiom and "but" rules.
+    """
+    __assert_same_polarities(rule_sentences)
+
+
+def test_batch_sentiments_match_extractor_sentiments():
+    """
+    Test if the batch engine extracts the same sentiment labels as the extractor, in input order.
+    """
+    sentiments = bs.get_sentiments(rule_sentences)
+    assert sentiments == [ex.get_sentiment(sentence) for sentence in rule_sentences]
+
+
+def test_empty_batch_returns_no_sentiment():
+    """
+    Test if scoring an empty batch returns an empty list of sentiments.
+    """
+    assert bs.get_sentiments([]) == []
@@ -0,0 +1,114 @@
+import json
+
+import pandas as pd
+import pytest
+
+from services import analyzer_service as an
+from services import bulk_service as bk
+from services import extractor_service as ex
+
+
+def __get_sentences() -> list[str]:
+    """
+    Return the sentences of the accuracy test dataset.
+    :return: the list of sentences
+    """
+    return pd.read_csv('./tests/unit/data/accuracy_test_data.csv')['text_snippet'].tolist()
+
+
+def __get_expected_row(text: str) -> list:
+    """
+    Return the sentiment and polarities of the provided text as scored by the analyzer.
+    :param text: input text
+    :return: the sentiment followed by the "neg", "neu", "pos" and "compound" polarities
+    """
+    polarities = an.get_analyzer().polarity_scores(text)
+    return [ex.get_label(polarities['compound'])] + [polarities[key] for key in ex.POLARITY_KEYS]
+
+
+def test_byte_ranges_end_on_csv_records():
+    """
+    Test if the byte ranges cover the whole buffer and never split a quoted value holding line breaks.
+    """
+    buffer = b'1,"first\nline, ""quoted""\n"\n2,second\n3,"third\n\n"\n4,fourth'
+    ranges = bk.get_byte_ranges(buffer, 0, 1, True)
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(buffer)
+    assert all(end == next_start for (_, end), (next_start, _) in zip(ranges, ranges[1:]))
+    assert [buffer[start:end] for start, end in ranges] == [b'1,"first\nline, ""quoted""\n"\n', b'2,second\n',
+                                                            b'3,"third\n\n"\n', b'4,fourth']
+
+
+def test_csv_file_scoring(tmp_path):
+    """
+    Test if every CSV row is written in input order followed by the scores of its text,
+    whatever the size of the byte ranges.
+    """
+    sentences = __get_sentences()
+    input_path = tmp_path / 'input.csv'
+    pd.DataFrame({'id': range(len(sentences)), 'text': sentences}).to_csv(input_path, index=False)
+    for chunk_size in [1, 1000, 10 ** 6]:
+        output_path = tmp_path / 'output.csv'
+        assert bk.score_file(str(input_path), str(output_path), 'text', worker_count=1,
+                             chunk_size=chunk_size) == len(sentences)
+        output = pd.read_csv(output_path)
+        assert output.columns.tolist() == ['id', 'text', 'sentiment'] + ex.POLARITY_KEYS
+        assert output['id'].tolist() == list(range(len(sentences)))
+        assert output[['sentiment'] + ex.POLARITY_KEYS].values.tolist() == [__get_expected_row(sentence)
+                                                                           for sentence in sentences]
+
+
+def test_jsonl_file_scoring(tmp_path):
+    """
+    Test if every JSON Lines record gets the scores of its text, and empty scores when it has no text,
+    Unicode line separators being kept inside their record.
+    """
+    records = [{'text': 'I love this product'}, {'id': 2}, {'text': None},
+               {'text': 'This is awful\u2028\U0001F620'}]
+    input_path = tmp_path / 'input.jsonl'
+    input_path.write_text(''.join(json.dumps(record) + '\n' for record in records), encoding='utf-8')
+    output_path = tmp_path / 'output.jsonl'
+    assert bk.score_file(str(input_path), str(output_path), 'text', worker_count=1, chunk_size=1) == len(records)
+    output = [json.loads(line) for line in output_path.read_text(encoding='utf-8').split('\n') if line]
+    assert len(output) == len(records)
+    for record, scored_record in zip(records, output):
+        text = record.get('text')
+        expected = __get_expected_row(text) if text is not None else [None] * 5
+        assert [scored_record[key] for key in ['sentiment'] + ex.POLARITY_KEYS] == expected
+
+
+def test_parallel_file_scoring(tmp_path):
+    """
+    Test if ranges scored by worker processes give the same file as ranges scored in the current process.
+    """
+    sentences = __get_sentences()
+    input_path = tmp_path / 'input.csv'
+    pd.DataFrame({'text': sentences}).to_csv(input_path, index=False)
+    bk.score_file(str(input_path), str(tmp_path / 'inline.csv'), 'text', worker_count=1, chunk_size=2000)
+    bk.score_file(str(input_path), str(tmp_path / 'parallel.csv'), 'text', worker_count=2, chunk_size=2000)
+    assert (tmp_path / 'inline.csv').read_bytes() == (tmp_path / 'parallel.csv').read_bytes()
+
+
+def test_missing_column_or_unknown_format(tmp_path):
+    """
+    Test if a missing text column or an unknown file extension is reported before scoring.
+    """
+    input_path = tmp_path / 'input.csv'
+    input_path.write_text('id,comment\n1,good\n', encoding='utf-8')
+    with pytest.raises(ValueError):
+        bk.score_file(str(input_path), str(tmp_path / 'output.csv'), 'text', worker_count=1)
+    with pytest.raises(ValueError):
+        bk.get_file_format('input.xlsx')
+
+
+def test_parquet_file_scoring(tmp_path):
+    """
+    Test if every Parquet row group is written followed by the scores of its texts.
+    """
+    sentences = __get_sentences()
+    input_path = tmp_path / 'input.parquet'
+    pd.DataFrame({'text': sentences}).to_parquet(input_path, row_group_size=50)
+    output_path = tmp_path / 'output.parquet'
+    assert bk.score_file(str(input_path), str(output_path), 'text', worker_count=1) == len(sentences)
+    output = pd.read_parquet(output_path)
+    assert output[['sentiment'] + ex.POLARITY_KEYS].values.tolist() == [__get_expected_row(sentence)
+                                                                       for sentence in sentences]
@@ -0,0 +1,82 @@
+import random
+
+import pandas as pd
+
+from services import analyzer_service as an
+from services import cascade_service as cas
+from services import engine_service as es
+from services import extractor_service as ex
+from tests import fake_constants_service as fct
+
+# Texts of the accuracy test dataset the cascade margin is calibrated on
+calibration_texts = pd.read_csv(fct.get_cascade_calibration_data_path())['text_snippet'].tolist()
+
+
+def test_cascade_gives_vader_labels_on_calibration_texts():
+    """
+    Test if the cascade engine gives every calibration text the label of the VADER engine,
+    escalating only part of them.
+    """
+    cascade_engine = es.get_engine(es.CascadeEngine.name)
+    stats_before = cascade_engine.get_stats()
+    assert ex.get_sentiments(calibration_texts, es.CascadeEngine.name) == ex.get_sentiments(calibration_texts, 'vader')
+    stats = cascade_engine.get_stats()
+    assert stats['texts'] == stats_before['texts'] + len(calibration_texts)
+    assert 0 < stats['escalated'] - stats_before['escalated'] < len(calibration_texts) / 2
+    assert 0 < stats['escalated_fraction'] < 1
+
+
+def test_configured_margin_is_calibrated():
+    """
+    Test if the configured margin is at least the calibrated one and gives no label flip on the calibration texts,
+    a wider margin escalating more texts.
+    """
+    assert cas.calibrate_margin(calibration_texts) <= fct.get_cascade_margin()
+    report = cas.get_calibration_report(calibration_texts)
+    assert report['flips'] == 0
+    assert cas.get_calibration_report(calibration_texts, 0.5)['escalated'] > report['escalated']
+
+
+def test_sign_changing_rules_are_escalated():
+    """
+    Test if texts with a negation, a "but", "least", "no" or "kind of" word or a VADER phrase have no estimate.
+    """
+    analyzer = an.get_analyzer()
+    for text in ['The food is not good', 'The food is good but the service is bad', 'At least it is good',
+                 'No good', 'It is kind of good', 'This party is the bomb, great']:
+        assert analyzer.estimate_scores(text) is None
+    assert cas.get_estimate('The food is not good') is None
+
+
+def test_estimate_range_holds_vader_compound():
+    """
+    Test if the estimate of a text without booster nor emphasis word is its VADER polarities,
+    caps and punctuation emphasis included, and if the compound range of other texts holds their VADER compound.
+    """
+    analyzer = an.get_analyzer()
+    for text in ['The food is GOOD and the view is lovely!!', 'Horrible weather, sad day?? ugh', 'ok', 'GREAT', '']:
+        estimate = analyzer.estimate_scores(text)
+        assert estimate.scores == analyzer.polarity_scores(text)
+        assert estimate.lowest_compound == estimate.highest_compound == estimate.scores['compound']
+    for text in ['The food is VERY good, hurt people, so cute', 'lol so ready, the hell u want her!?', 'barely ok']:
+        estimate = analyzer.estimate_scores(text)
+        assert estimate.lowest_compound <= analyzer.polarity_scores(text)['compound'] <= estimate.highest_compound
+    assert cas.get_estimate('The box is blue') == {'neg': 0.0, 'neu': 1.0, 'pos': 0.0, 'compound': 0.0}
+    assert cas.is_label_uncertain(analyzer.estimate_scores('lol so ready, the hell u want her!?'))
+    assert not cas.is_label_uncertain(analyzer.estimate_scores('The food is great'))
+
+
+def test_estimate_range_holds_vader_compound_of_generated_texts():
+    """
+    Test if the compound range of the estimate of generated texts, dense in booster, emphasis and upper case words,
+    holds their VADER compound, so that the cascade gives them the VADER label whatever the margin.
+    """
+    analyzer = an.get_analyzer()
+    generator = random.Random(0)
+    words = ' '.join(calibration_texts).split()
+    words += ['very', 'so', 'this', 'barely', 'kinda', 'VERY', 'SO', 'GREAT', '!!!']
+    for _ in range(3000):
+        text = ' '.join(generator.choice(words) for _ in range(generator.randint(1, 30)))
+        estimate = analyzer.estimate_scores(text)
+        if estimate is not None:
+            assert estimate.lowest_compound <= analyzer.polarity_scores(text)['compound'] <= estimate.highest_compound
@@ -156,4 +156,22 @@ def test_index_content_type():
     """
     expected_index_content_type = fct.get_index_content_type()
     index_content_type = ct.get_index_content_type()
-    assert index_content_type == expected_index_content_type
\ No newline at end of file
+    assert index_content_type == expected_index_content_type
+
+
+def test_lexicon_snapshot_version():
+    """
+    Test if the binary lexicon snapshot format version is still the expected one.
+    """
+    expected_lexicon_snapshot_version = fct.get_lexicon_snapshot_version()
+    lexicon_snapshot_version = ct.get_lexicon_snapshot_version()
+    assert lexicon_snapshot_version == expected_lexicon_snapshot_version
+
+
+def test_mapped_lexicon_version():
+    """
+    Test if the memory-mapped lexicon format version is still the expected one.
+    """
+    expected_mapped_lexicon_version = fct.get_mapped_lexicon_version()
+    mapped_lexicon_version = ct.get_mapped_lexicon_version()
+    assert mapped_lexicon_version == expected_mapped_lexicon_version
\ No newline at end of file
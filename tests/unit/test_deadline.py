@@ -0,0 +1,132 @@
+import time
+
+import pandas as pd
+import pytest
+
+from routes import analyzer_route as ar
+from services import analyzer_service as an
+from services import deadline_service as dl
+from services import document_service as ds
+from services import extractor_service as ex
+from tests import fake_constants_service as fct
+
+# Texts of the accuracy test dataset
+accuracy_texts = pd.read_csv(fct.get_cascade_calibration_data_path())['text_snippet'].tolist()
+
+
+def test_budget_comes_from_header_or_configuration(monkeypatch):
+    """
+    Test if the budget of a request is its deadline header value, or else the configured default one,
+    a null default budget meaning no budget, and if invalid header values are rejected.
+    """
+    assert dl.get_budget('250') == 0.25
+    assert dl.get_budget() is None
+    monkeypatch.setenv('SENTIMENT_DEADLINE_MS', '40')
+    assert dl.get_budget() == 0.04
+    assert dl.get_budget('1.5') == 0.0015
+    for header_value in ['0', '-3', 'soon', 'nan', 'inf', '']:
+        with pytest.raises(ValueError):
+            dl.get_budget(header_value)
+        assert ar.is_invalid_deadline_header(header_value)
+    assert not ar.is_invalid_deadline_header(None)
+    assert not ar.is_invalid_deadline_header('10')
+
+
+def test_deadline_degrades_and_counts_requests():
+    """
+    Test if only the requests whose scoring would end after their deadline are degraded,
+    and if the requests with a budget and the degraded ones are counted.
+    """
+    stats_before = dl.get_stats()
+    start = time.perf_counter()
+    assert not dl.check_deadline(100000, start, None)
+    assert dl.get_stats() == stats_before
+    assert not dl.check_deadline(20, start, 10.0)
+    assert dl.check_deadline(100000, start, dl.predict_cost(100000) / 2)
+    assert dl.check_deadline(20, start - 1, 0.5)
+    stats = dl.get_stats()
+    assert stats['budgeted'] == stats_before['budgeted'] + 3
+    assert stats['degraded'] == stats_before['degraded'] + 2
+    assert 0 < stats['degraded_fraction'] <= 1
+
+
+def test_degraded_polarities_are_approximated(monkeypatch):
+    """
+    Test if the polarities of a request over its deadline are approximated without scoring the input,
+    and if a request within its deadline gets the scored polarities.
+    """
+    user_input = 'The food is not good but the view is VERY lovely!!'
+    start = time.perf_counter()
+    assert dl.get_polarities(user_input, None, start, 10.0) == (ex.get_polarities(user_input), False)
+
+    def get_polarities(text, engine_name=None):
+        raise AssertionError(f'"{text}" was scored')
+
+    monkeypatch.setattr(ex, 'get_polarities', get_polarities)
+    monkeypatch.setattr(ex, 'get_all_polarities', get_polarities)
+    polarities, is_degraded = dl.get_polarities(user_input, None, start - 1, 0.5)
+    assert is_degraded
+    assert polarities == an.get_analyzer().approximate_scores(user_input)
+    document_polarities, sentences = ds.get_document_polarities('Great food. Horrible view!', None, True)
+    assert [sentence for sentence, _ in sentences] == ['Great food.', 'Horrible view!']
+    assert sentences[0][1]['compound'] > 0 > sentences[1][1]['compound']
+
+
+def test_approximation_is_the_estimate_and_mostly_keeps_labels():
+    """
+    Test if the approximated polarities are the cascade estimate of the texts having one,
+    and if they get the label of the VADER polarities for most of the accuracy test texts.
+    """
+    analyzer = an.get_analyzer()
+    agreement_count = 0
+    for text in accuracy_texts + ['The food is GOOD and the view is lovely!!', 'Horrible weather?? ugh', '']:
+        estimate = analyzer.estimate_scores(text)
+        approximated_scores = analyzer.approximate_scores(text)
+        if estimate is not None:
+            assert approximated_scores == estimate.scores
+        agreement_count += ex.get_label(approximated_scores['compound']) == \
+            ex.get_label(analyzer.polarity_scores(text)['compound'])
+    assert agreement_count >= 0.9 * len(accuracy_texts)
+
+
+def test_cost_per_character_is_measured_unless_configured(monkeypatch):
+    """
+    Test if the scoring cost per character is measured on the generated calibration texts, denser in lexicon tokens
+    than usual texts, and if a configured cost replaces it.
+    """
+    texts = dl.get_calibration_texts(20)
+    assert texts == dl.get_calibration_texts(20) and len(texts) == 20
+    analyzer = an.get_analyzer()
+    assert sum(token in analyzer.lexicon for text in texts for token in text.lower().split()) > 0
+    monkeypatch.delenv('SENTIMENT_DEADLINE_COST_PER_CHARACTER_US', raising=False)
+    cost = dl.calibrate(texts)
+    assert 0 < cost < 1e-4
+    assert dl.get_cost_per_character() == cost
+    assert dl.predict_cost(1000) == 1000 * cost
+    monkeypatch.setenv('SENTIMENT_DEADLINE_COST_PER_CHARACTER_US', '2')
+    assert dl.get_cost_per_character() == 2e-6
+
+
+
+def test_cost_is_measured_once_when_a_budget_is_first_applied(monkeypatch):
+    """
+    Test if the scoring cost per character is not measured for requests without a budget,
+    and is measured only once, by the first request with a budget.
+    """
+    monkeypatch.delenv('SENTIMENT_DEADLINE_COST_PER_CHARACTER_US', raising=False)
+    monkeypatch.setattr(dl, '__cost_per_character', None)
+    calibrate = dl.calibrate
+    calibration_count = 0
+
+    def count_calibration(texts=None):
+        nonlocal calibration_count
+        calibration_count += 1
+        return calibrate(texts)
+
+    monkeypatch.setattr(dl, 'calibrate', count_calibration)
+    start = time.perf_counter()
+    dl.check_deadline(100, start, None)
+    assert calibration_count == 0
+    dl.check_deadline(100, start, 10.0)
+    dl.check_deadline(100, start, 10.0)
+    assert calibration_count == 1
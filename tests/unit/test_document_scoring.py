@@ -0,0 +1,110 @@
+import time
+
+import pandas as pd
+
+from routes import analyzer_route as ar
+from services import analyzer_service as an
+from services import cache_service as cs
+from services import document_service as ds
+from services import pool_service as ps
+from services import text_service as tx
+from tests import fake_constants_service as fct
+
+
+def __get_sentences(text: str) -> list[str]:
+    """
+    Return the sentences of the provided text split by the sentence splitter.
+    :param text: input document
+    :return: the list of sentences
+    """
+    return [text[start:end] for start, end in tx.split_sentences(text)]
+
+
+def test_split_sentences_at_end_punctuation():
+    """
+    Test if sentences end after ".", "!" or "?" and their closing quotes when followed by whitespaces.
+    """
+    text = '  It was great. Was it?  "Really!" she said...\tYes'
+    assert __get_sentences(text) == ['It was great.', 'Was it?', '"Really!"', 'she said...', 'Yes']
+
+
+def test_split_sentences_at_blank_lines():
+    """
+    Test if sentences end at blank lines even without end punctuation, and not at single line breaks.
+    """
+    text = 'A title\n\nA paragraph\ngoing on  \n \n  the end'
+    assert __get_sentences(text) == ['A title', 'A paragraph\ngoing on', 'the end']
+
+
+def test_split_sentences_keeps_inner_punctuation():
+    """
+    Test if punctuation not followed by a whitespace does not end a sentence.
+    """
+    assert __get_sentences('Version 1.2 is out!!!Great, isn\'t it?') == ['Version 1.2 is out!!!Great, isn\'t it?']
+
+
+def test_split_blank_text_returns_no_sentence():
+    """
+    Test if an empty or blank text has no sentence.
+    """
+    assert __get_sentences('') == []
+    assert __get_sentences(' \n\n\t ') == []
+
+
+def test_split_sentences_is_linear():
+    """
+    Test if splitting adversarial texts made of one repeated end or closing character stays fast.
+    """
+    for text in ['!' * 1000000, '.' + '"' * 1000000 + 'x', '\n ' * 500000, 'Word. ' * 10000]:
+        start = time.perf_counter()
+        tx.split_sentences(text)
+        assert time.perf_counter() - start < 1
+
+
+def test_document_polarities_are_length_weighted():
+    """
+    Test if the document polarities are the sentence polarities weighted by the sentence lengths.
+    """
+    analyzer = an.get_analyzer()
+    document = 'This is a great book. It is terrible and boring, really awful. Meh.'
+    document_polarities, sentences = ds.get_document_polarities(document)
+    assert [sentence for sentence, _ in sentences] == __get_sentences(document)
+    assert all(polarities == analyzer.polarity_scores(sentence) for sentence, polarities in sentences)
+    lengths = [len(sentence) for sentence, _ in sentences]
+    compound = sum(length * polarities['compound'] for length, (_, polarities) in zip(lengths, sentences))
+    assert document_polarities['compound'] == round(compound / sum(lengths), 4)
+
+
+def test_empty_document_has_null_polarities():
+    """
+    Test if a document without sentences has null polarities.
+    """
+    document_polarities, sentences = ds.get_document_polarities('   ')
+    assert sentences == []
+    assert document_polarities == {'neg': 0.0, 'neu': 0.0, 'pos': 0.0, 'compound': 0.0}
+
+
+def test_parallel_scoring_matches_analyzer(monkeypatch):
+    """
+    Test if scoring sentences across worker processes gives the analyzer polarities in input order.
+    """
+    monkeypatch.setenv('SENTIMENT_POOL_WORKERS', '2')
+    monkeypatch.setenv('SENTIMENT_POOL_MIN_TEXTS', '1')
+    cs.get_result_cache().clear()
+    analyzer = an.get_analyzer()
+    sentences = pd.read_csv('./tests/unit/data/accuracy_test_data.csv')['text_snippet'].tolist()[:100]
+    try:
+        assert ps.score_texts(sentences) == [analyzer.polarity_scores(sentence) for sentence in sentences]
+    finally:
+        ps.shutdown()
+
+
+def test_too_big_document_returns_its_message():
+    """
+    Test if a document longer than the max document length is rejected with the expected message.
+    """
+    input_key = fct.get_analyzer_endpoint_key()
+    request_json = {input_key: 'x' * (fct.get_max_document_length() + 1)}
+    expected_data = {fct.get_response_message_key(): fct.get_too_big_document_length_message()}
+    assert ar.get_document_response_400_data_by_reason(request_json) == expected_data
+    assert ar.get_document_response_400_data_by_reason({input_key: 'x' * 1000}) is None
@@ -0,0 +1,95 @@
+import random
+
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from services import analyzer_service as an
+from services import text_service as tx
+
+# Texts exercising the emoji spacing rules
+emoji_texts = ['Catch utf-8 emoji such as 💘 and 💋 and 😁',
+               '😁😁 at the start, then in the middle😁 and at the end 😁',
+               'tab\t😁, line break\n😁 and no break space 😁',
+               'multi code point emojis ☺️ 👶🏻 and flags 🇫🇷',
+               'café crème, naïve façade and 日本語 without any emoji',
+               '  😁  ',
+               '😁',
+               'plain ASCII text :) with an emoticon',
+               '']
+
+
+def __replace_emojis(text: str, emojis: dict[str, str]) -> str:
+    """
+    Return the provided text with its emojis replaced character by character, as the stock VADER analyzer does.
+    :param text: input text
+    :param emojis: emoji to description mapping
+    :return: the text without emojis
+    """
+    text_no_emoji = ''
+    prev_space = True
+    for character in text:
+        if character in emojis:
+            if not prev_space:
+                text_no_emoji += ' '
+            text_no_emoji += emojis[character]
+            prev_space = False
+        else:
+            text_no_emoji += character
+            prev_space = character == ' '
+    return text_no_emoji.strip()
+
+
+def __get_random_texts(emojis: dict[str, str], count: int) -> list[str]:
+    """
+    Return random texts mixing emojis, ASCII and non ASCII characters and whitespaces.
+    :param emojis: emoji to description mapping
+    :param count: number of texts
+    :return: the list of texts
+    """
+    generator = random.Random(0)
+    alphabet = list(emojis)[:200] + list('ab !?.é \t\n') + [' '] * 5
+    return [''.join(generator.choice(alphabet) for _ in range(generator.randrange(12))) for _ in range(count)]
+
+
+def test_replacement_matches_stock_analyzer():
+    """
+    Test if the single pass emoji replacement gives exactly the text of the stock character by character one.
+    """
+    replacer = an.get_analyzer().emoji_replacer
+    emojis = an.get_analyzer().emojis
+    for text in emoji_texts + __get_random_texts(emojis, 5000):
+        assert replacer.replace(text) == __replace_emojis(text, emojis)
+        assert replacer.has_emoji(text) == any(character in emojis for character in text)
+
+
+def test_ascii_texts_are_not_scanned():
+    """
+    Test if pure ASCII texts are only stripped, unless the emoji table holds ASCII characters.
+    """
+    replacer = tx.EmojiReplacer({'💘': 'heart with arrow'})
+    assert replacer.replace('  no emoji here :)  ') == 'no emoji here :)'
+    ascii_replacer = tx.EmojiReplacer({'<3': 'heart', '+': 'plus'})
+    assert ascii_replacer.replace('one + two <3') == 'one plus two <3'
+    assert not tx.EmojiReplacer({}).has_emoji('💘')
+
+
+def test_description_spacing():
+    """
+    Test if emojis following emojis, spaces or other characters are spaced exactly,
+    whatever their descriptions are.
+    """
+    spaced_emojis = {'💘': 'heart ', '💋': '', '😁': ' grin'}
+    replacer = tx.EmojiReplacer(spaced_emojis)
+    for text in __get_random_texts(spaced_emojis, 1000):
+        assert replacer.replace(text) == __replace_emojis(text, spaced_emojis)
+
+
+def test_emoji_scores_match_stock_analyzer():
+    """
+    Test if texts holding emojis get exactly the stock VADER polarities.
+    """
+    analyzer = an.get_analyzer()
+    stock_analyzer = SentimentIntensityAnalyzer.__new__(SentimentIntensityAnalyzer)
+    stock_analyzer.lexicon = analyzer.lexicon
+    stock_analyzer.emojis = analyzer.emojis
+    for text in emoji_texts + __get_random_texts(analyzer.emojis, 1000):
+        assert analyzer.polarity_scores(text) == stock_analyzer.polarity_scores(text)
@@ -0,0 +1,79 @@
+import pandas as pd
+import pytest
+
+from services import engine_service as es
+from tests import fake_constants_service as fct
+
+# Texts every engine must score, including empty, whitespace only, emoji and non ASCII texts
+texts = ['I love this product, it is great!', 'This is the worst, most awful experience ever.', 'The box is blue',
+         '', '   ', 'x', 'GREAT job :) \U0001F600', 'Not good at all...', 'très bien', 'I love it but it is broken']
+
+
+@pytest.fixture(params=es.get_engine_names())
+def engine(request) -> es.Engine:
+    """
+    Return each registered engine, warmed up.
+    :return: the Engine instance
+    """
+    engine = es.get_engine(request.param)
+    engine.warm_up()
+    return engine
+
+
+def __assert_polarities(polarities: dict[str, float]):
+    """
+    Assert that the provided polarities hold the expected keys and values within the expected ranges.
+    :param polarities: polarities returned by an engine
+    """
+    assert list(polarities) == es.POLARITY_KEYS
+    assert all(isinstance(polarities[key], float) for key in es.POLARITY_KEYS)
+    assert all(0 <= polarities[key] <= 1 for key in ['neg', 'neu', 'pos'])
+    assert -1 <= polarities['compound'] <= 1
+
+
+def test_engine_polarities(engine):
+    """
+    Test if an engine gives each text its "neg", "neu" and "pos" polarities between 0 and 1
+    and its compound score between -1 and 1.
+    """
+    for text in texts:
+        __assert_polarities(engine.score(text))
+
+
+def test_engine_score_many_matches_score(engine):
+    """
+    Test if an engine scores a list of texts, repeated texts included, as it scores each text, in input order.
+    """
+    many_texts = texts + list(reversed(texts))
+    assert engine.score_many(many_texts) == [engine.score(text) for text in many_texts]
+    assert engine.score_many([]) == []
+
+
+def test_engine_is_deterministic(engine):
+    """
+    Test if an engine gives the same polarities to the same text, warming it up again changing nothing.
+    """
+    first_polarities = [engine.score(text) for text in texts]
+    engine.warm_up()
+    assert [engine.score(text) for text in texts] == first_polarities
+
+
+def test_engine_orders_sentiments(engine):
+    """
+    Test if an engine scores the positive texts of the accuracy test dataset above its negative texts on average.
+    """
+    df = pd.read_csv('./tests/unit/data/accuracy_test_data.csv')
+    df['compound'] = [polarities['compound'] for polarities in engine.score_many(df['text_snippet'].tolist())]
+    positive_compounds = df[df['mean_sentiment_rating'] >= fct.get_threshold()]['compound']
+    negative_compounds = df[df['mean_sentiment_rating'] <= -fct.get_threshold()]['compound']
+    assert positive_compounds.mean() > 0 > negative_compounds.mean()
+
+
+def test_engine_registry():
+    """
+    Test if the configured engine is registered by default and an unknown engine name is rejected.
+    """
+    assert 'vader' in es.get_engine_names()
+    assert es.get_engine().name == es.get_engine(None).name
+    with pytest.raises(ValueError):
+        es.get_engine('unknown')
@@ -0,0 +1,163 @@
+import sqlite3
+import time
+from concurrent.futures.process import BrokenProcessPool
+from types import SimpleNamespace
+
+import pytest
+
+from services import cache_service as cs
+from services import extractor_service as ex
+from services import job_service as js
+from tests import fake_constants_service as fct
+
+
+class Interruption(BaseException):
+    """
+    Simulates the worker process being killed while scoring a job.
+    """
+
+
+@pytest.fixture(autouse=True)
+def job_database(tmp_path, monkeypatch):
+    """
+    Store the jobs of every test in its own temporary database, with small chunks.
+    """
+    monkeypatch.setenv('SENTIMENT_JOB_DATABASE', str(tmp_path / 'jobs.sqlite3'))
+    monkeypatch.setenv('SENTIMENT_JOB_CHUNK_SIZE', '2')
+
+
+def __submit(user_inputs: list) -> str:
+    """
+    Submit a job scoring the provided valid inputs.
+    :param user_inputs: the inputs of the job
+    :return: the id of the job
+    """
+    return js.submit_job(user_inputs, [None] * len(user_inputs))
+
+
+def test_submitted_job_is_queued():
+    """
+    Test if a submitted job is queued with no scored input.
+    """
+    job_id = __submit(['This is a great book', 'This is a terrible book'])
+    assert js.get_job(job_id) == {'status': js.QUEUED, 'total': 2, 'done': 0, 'error': None}
+    assert js.get_job_results(job_id, 0, 10) == []
+
+
+def test_unknown_job_returns_none():
+    """
+    Test if the status of a job that does not exist is None.
+    """
+    assert js.get_job('unknown') is None
+
+
+def test_processed_job_results_are_in_input_order():
+    """
+    Test if processing a job stores the sentiment of every input, or its error message, in input order.
+    """
+    user_inputs = ['This is a great book', None, 'This is a terrible book', 'x', 'This is a great book']
+    error_messages = [None, fct.get_none_batch_input_message(), None, None, None]
+    job_id = js.submit_job(user_inputs, error_messages)
+    assert js.process_next_job('worker')
+    sentiment_key = fct.get_response_sentiment_key()
+    expected_results = [{sentiment_key: fct.get_positivity_label()},
+                        {fct.get_response_message_key(): fct.get_none_batch_input_message()},
+                        {sentiment_key: fct.get_negativity_label()},
+                        {sentiment_key: fct.get_neutrality_label()},
+                        {sentiment_key: fct.get_positivity_label()}]
+    assert js.get_job(job_id) == {'status': js.DONE, 'total': 5, 'done': 5, 'error': None}
+    assert js.get_job_results(job_id, 0, 10) == expected_results
+    assert js.get_job_results(job_id, 3, 1) == expected_results[3:4]
+    assert not js.process_next_job('worker')
+
+
+def test_interrupted_job_resumes_from_checkpoint(monkeypatch):
+    """
+    Test if a job interrupted after its first chunk is resumed from its second chunk once its lease expires,
+    without scoring its first chunk again.
+    """
+    cs.get_result_cache().clear()
+    get_all_polarities = ex.get_all_polarities
+    scored_inputs = []
+
+    def score_then_interrupt(user_inputs: list[str]) -> list[dict[str, float]]:
+        if scored_inputs:
+            raise Interruption()
+        scored_inputs.extend(user_inputs)
+        return get_all_polarities(user_inputs)
+
+    job_id = __submit(['good 1', 'good 2', 'bad 3', 'bad 4', 'fine 5'])
+    monkeypatch.setattr(ex, 'get_all_polarities', score_then_interrupt)
+    with pytest.raises(Interruption):
+        js.process_next_job('first worker')
+    assert js.get_job(job_id)['status'] == js.RUNNING
+    assert js.get_job(job_id)['done'] == 2
+    assert not js.process_next_job('second worker')
+    lease_duration = fct.get_job_lease_duration()
+    monkeypatch.setattr(js, 'time', SimpleNamespace(time=lambda: time.time() + lease_duration + 1))
+    monkeypatch.setattr(ex, 'get_all_polarities', lambda user_inputs: scored_inputs.extend(user_inputs)
+                        or get_all_polarities(user_inputs))
+    assert js.process_next_job('second worker')
+    assert scored_inputs == ['good 1', 'good 2', 'bad 3', 'bad 4', 'fine 5']
+    assert js.get_job(job_id)['status'] == js.DONE
+    assert len(js.get_job_results(job_id, 0, 10)) == 5
+
+
+def test_failing_job_is_marked_failed(monkeypatch):
+    """
+    Test if a job whose inputs can not be scored is marked failed with the error message.
+    """
+    job_id = __submit(['This is a great book'])
+
+    def fail(user_inputs: list[str]) -> list[dict[str, float]]:
+        raise ValueError('invalid input')
+
+    monkeypatch.setattr(ex, 'get_all_polarities', fail)
+    assert js.process_next_job('worker')
+    job = js.get_job(job_id)
+    assert job['status'] == js.FAILED
+    assert job['error'] == 'invalid input'
+
+
+@pytest.mark.parametrize('error', [sqlite3.OperationalError('database is locked'), BrokenProcessPool('restarting')])
+def test_transient_error_requeues_job_with_its_progress(monkeypatch, error):
+    """
+    Test if a job whose scoring raises a transient error is put back in the queue with its stored progress,
+    and then resumed from its last stored chunk.
+    """
+    cs.get_result_cache().clear()
+    get_all_polarities = ex.get_all_polarities
+    scored_inputs = []
+
+    def score_then_fail(user_inputs: list[str]) -> list[dict[str, float]]:
+        if scored_inputs:
+            raise error
+        scored_inputs.extend(user_inputs)
+        return get_all_polarities(user_inputs)
+
+    job_id = __submit(['good 1', 'good 2', 'bad 3'])
+    monkeypatch.setattr(ex, 'get_all_polarities', score_then_fail)
+    assert not js.process_next_job('first worker')
+    assert js.get_job(job_id) == {'status': js.QUEUED, 'total': 3, 'done': 2, 'error': None}
+    monkeypatch.setattr(ex, 'get_all_polarities', get_all_polarities)
+    assert js.process_next_job('second worker')
+    assert js.get_job(job_id)['status'] == js.DONE
+    assert len(js.get_job_results(job_id, 0, 10)) == 3
+
+
+def test_worker_threads_process_submitted_jobs(monkeypatch):
+    """
+    Test if the job worker threads process the jobs submitted while they run.
+    """
+    monkeypatch.setenv('SENTIMENT_JOB_POLL_INTERVAL', '0.01')
+    js.start_workers(2)
+    try:
+        job_ids = [__submit(['This is a great book'] * 5) for _ in range(3)]
+        for job_id in job_ids:
+            for _ in range(500):
+                if js.get_job(job_id)['status'] == js.DONE:
+                    break
+                time.sleep(0.01)
+            assert js.get_job(job_id)['status'] == js.DONE
+    finally:
+        js.stop_workers()
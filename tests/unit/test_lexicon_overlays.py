@@ -0,0 +1,169 @@
+import threading
+import time
+from types import MappingProxyType
+
+import pytest
+
+from routes import lexicon_route as lr
+from services import analyzer_service as an
+from services import cache_service as cs
+from services import extractor_service as ex
+from services import overlay_service as ov
+from services import pool_service as ps
+
+
+@pytest.fixture
+def overlay_path(tmp_path, monkeypatch):
+    """
+    Return the path of a lexicon overlay file applied by the next reload, the overlays being removed after the test.
+    """
+    path = tmp_path / 'overlay.txt'
+    path.write_text('', encoding='utf-8')
+    monkeypatch.setenv('SENTIMENT_LEXICON_OVERLAYS', str(path))
+    yield path
+    monkeypatch.delenv('SENTIMENT_LEXICON_OVERLAYS')
+    an.reload()
+    ps.shutdown()
+
+
+def test_overlay_files_are_parsed_in_order(tmp_path):
+    """
+    Test if overlay files are read like the VADER lexicon file, comments and blank lines skipped,
+    tokens lower cased and later files overriding earlier ones.
+    """
+    first_path = tmp_path / 'first.txt'
+    first_path.write_text('# product slang\nFire\t2.5\t0.5\t[2, 3]\n\nmid\t-1.0\n', encoding='utf-8')
+    second_path = tmp_path / 'second.txt'
+    second_path.write_text('mid\t-2.0\n', encoding='utf-8')
+    assert ov.load_overlays([str(first_path), str(second_path)]) == {'fire': 2.5, 'mid': -2.0}
+    invalid_path = tmp_path / 'invalid.txt'
+    invalid_path.write_text('fire 2.5\n', encoding='utf-8')
+    with pytest.raises(ValueError):
+        ov.load_overlays([str(invalid_path)])
+
+
+def test_overlays_override_lexicon():
+    """
+    Test if overlays add and replace valences, a dictionary lexicon being copied
+    and another mapping being looked up after the overlays.
+    """
+    lexicon = {'good': 1.9, 'bad': -2.5}
+    overlaid_lexicon = ov.apply_overlays(lexicon, {'bad': 1.0, 'mid': -2.0})
+    assert overlaid_lexicon == {'good': 1.9, 'bad': 1.0, 'mid': -2.0}
+    assert lexicon == {'good': 1.9, 'bad': -2.5}
+    chained_lexicon = ov.apply_overlays(MappingProxyType(lexicon), {'bad': 1.0})
+    assert chained_lexicon['bad'] == 1.0 and chained_lexicon['good'] == 1.9
+    assert ov.apply_overlays(lexicon, {}) is lexicon
+    assert ov.get_changed_tokens({'bad': 1.0, 'fire': 2.5}, {'bad': 1.0, 'mid': -2.0}) == {'fire', 'mid'}
+
+
+def test_reload_applies_overlays_and_swaps_analyzer(overlay_path):
+    """
+    Test if a reload scores with the new overlays under the next lexicon version,
+    requests holding the previous analyzer finishing with the previous lexicon.
+    """
+    previous_analyzer = an.get_analyzer()
+    overlay_path.write_text('mid\t-2.5\n', encoding='utf-8')
+    analyzer = an.reload()
+    assert analyzer.lexicon_version == previous_analyzer.lexicon_version + 1
+    assert an.get_lexicon_stats() == {'version': analyzer.lexicon_version, 'overlay_tokens': 1}
+    assert ex.get_sentiment('The new phone is mid') == 'Negative'
+    assert previous_analyzer.polarity_scores('The new phone is mid')['compound'] == 0.0
+    assert an.reload().lexicon_version == analyzer.lexicon_version
+
+
+def test_reload_invalidates_only_affected_cache_entries(overlay_path):
+    """
+    Test if, after a reload, the cached polarities of a text holding a token whose valence changed
+    are scored again while the other cached polarities are still hit.
+    """
+    result_cache = cs.get_result_cache()
+    result_cache.clear()
+    ex.get_sentiments(['This phone is fire', 'This phone is great'])
+    overlay_path.write_text('fire\t2.8\n', encoding='utf-8')
+    an.reload()
+    assert ex.get_sentiment('This phone is fire') == 'Positive'
+    assert ex.get_sentiment('This phone is great') == 'Positive'
+    stats = result_cache.get_stats()
+    assert stats['invalidations'] == 1
+    assert stats['hits'] == 1
+    assert ex.get_sentiment('This phone is fire') == 'Positive'
+    assert result_cache.get_stats()['hits'] == 2
+
+
+def test_cache_entries_of_other_versions():
+    """
+    Test if cached polarities of another lexicon version are missed unless they are still valid,
+    in which case they are tagged with the current version.
+    """
+    cache = cs.ResultCache(cs.ENTRY_SIZE * 10)
+    cache.put('This is a great book', (0.0, 0.423, 0.577, 0.6249), 1)
+    assert cache.get('This is a great book', 2) is None
+    assert cache.get('This is a great book', 2, lambda text, version: False) is None
+    validations = []
+    assert cache.get('This is a great book', 2, lambda text, version: validations.append(version) or True) == \
+           (0.0, 0.423, 0.577, 0.6249)
+    assert cache.get('This is a great book', 2, lambda text, version: validations.append(version) or True) == \
+           (0.0, 0.423, 0.577, 0.6249)
+    assert validations == [1]
+    assert cache.get_stats()['invalidations'] == 2
+
+
+def test_pool_workers_score_with_reloaded_overlays(overlay_path, monkeypatch):
+    """
+    Test if the process pool is replaced after a reload and its workers score with the reloaded overlays.
+    """
+    monkeypatch.setenv('SENTIMENT_POOL_WORKERS', '2')
+    monkeypatch.setenv('SENTIMENT_POOL_MIN_TEXTS', '1')
+    executor = ps.get_executor()
+    overlay_path.write_text('mid\t-2.5\n', encoding='utf-8')
+    an.reload()
+    assert ps.get_executor() is not executor
+    polarities = ps.score_texts(['The new phone is mid', 'The old phone is mid too'])
+    assert all(scores['compound'] < 0 for scores in polarities)
+
+
+def test_concurrent_reloads_share_a_rebuild(overlay_path, monkeypatch):
+    """
+    Test if the reloads requested while a reload is running wait for it and share a single rebuild,
+    which reads the overlay files after their requests, and if they all get its analyzer.
+    """
+    build_analyzer = getattr(an, '__build_analyzer')
+    build_count = 0
+    build_started = threading.Event()
+    build_released = threading.Event()
+
+    def build_slowly(overlays):
+        nonlocal build_count
+        build_count += 1
+        build_started.set()
+        build_released.wait(5)
+        return build_analyzer(overlays)
+
+    monkeypatch.setattr(an, '__build_analyzer', build_slowly)
+    analyzers = []
+    first_reload = threading.Thread(target=lambda: analyzers.append(an.reload()))
+    first_reload.start()
+    build_started.wait(5)
+    waiting_reloads = [threading.Thread(target=lambda: analyzers.append(an.reload())) for _ in range(4)]
+    for reload_thread in waiting_reloads:
+        reload_thread.start()
+    time.sleep(0.1)
+    build_released.set()
+    for reload_thread in [first_reload] + waiting_reloads:
+        reload_thread.join()
+    assert build_count == 2
+    assert len(analyzers) == 5 and all(analyzer is an.get_analyzer() for analyzer in analyzers[1:])
+
+
+def test_reload_requires_the_configured_token(monkeypatch):
+    """
+    Test if a lexicon reload is only authorized with the configured reload token, and never without one.
+    """
+    monkeypatch.delenv('SENTIMENT_LEXICON_RELOAD_TOKEN', raising=False)
+    assert not lr.is_authorized_reload('')
+    assert not lr.is_authorized_reload(None)
+    monkeypatch.setenv('SENTIMENT_LEXICON_RELOAD_TOKEN', 's3cret')
+    assert lr.is_authorized_reload('s3cret')
+    for reload_token in [None, '', 's3cre', 's3cret ', 'S3CRET']:
+        assert not lr.is_authorized_reload(reload_token)
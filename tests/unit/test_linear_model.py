@@ -0,0 +1,118 @@
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from services import linear_service as ls
+
+sentences = ['This is a great book', 'This is NOT a terrible book!!', 'I love it 😍', 'x', '']
+
+
+def __train_model() -> ls.LinearModel:
+    """
+    Return a small model trained on the accuracy test dataset, for the tests of the model mechanics only.
+    :return: the trained LinearModel
+    """
+    df = pd.read_csv('./tests/unit/data/accuracy_test_data.csv')
+    return ls.train_model(df['text_snippet'].tolist(), df['mean_sentiment_rating'].tolist(), 2 ** 12)
+
+
+def test_saved_model_scores_like_trained_model(tmp_path):
+    """
+    Test if the model loaded from its artifact outputs the same polarities as the trained model,
+    the artifact only holding its non zero weight rows.
+    """
+    model = __train_model()
+    model_path = ls.save_model(model, str(tmp_path / 'linear_model.npz'))
+    loaded_model = ls.load_model(model_path)
+    assert loaded_model.score_many(sentences) == model.score_many(sentences)
+    with np.load(model_path) as artifact:
+        assert len(artifact['features']) == np.count_nonzero(model.weights.any(axis=1))
+
+
+def test_batch_scoring_matches_single_text_scoring():
+    """
+    Test if scoring texts together gives each text the polarities it gets alone,
+    the class probabilities summing to 1.
+    """
+    model = __train_model()
+    all_polarities = model.score_many(sentences)
+    assert all_polarities == [model.score_many([sentence])[0] for sentence in sentences]
+    assert all(abs(polarities['neg'] + polarities['neu'] + polarities['pos'] - 1) < 0.01
+               for polarities in all_polarities)
+    assert model.score_many([]) == []
+
+
+def test_two_class_training_data_gives_null_missing_class_probability():
+    """
+    Test if a model trained without neutral texts never gives a neutral probability.
+    """
+    model = ls.train_model(['I love it', 'great', 'I hate it', 'awful'], [0.8, 0.6, -0.7, -0.9], 2 ** 10)
+    polarities = model.score_many(['I love it', 'awful'])
+    assert [scores['neu'] for scores in polarities] == [0.0, 0.0]
+    assert polarities[0]['compound'] > 0 > polarities[1]['compound']
+
+
+def test_missing_or_stale_model_returns_none(tmp_path):
+    """
+    Test if loading an artifact that does not exist, is not an artifact or was written
+    with other features returns None.
+    """
+    assert ls.load_model(str(tmp_path / 'missing.npz')) is None
+    corrupted_path = tmp_path / 'corrupted.npz'
+    corrupted_path.write_bytes(b'not an artifact')
+    assert ls.load_model(str(corrupted_path)) is None
+    model_path = ls.save_model(__train_model(), str(tmp_path / 'stale.npz'))
+    with np.load(model_path) as artifact:
+        arrays = dict(artifact)
+    arrays['parameters'] = np.array(str(arrays['parameters']).replace('"ngram_range": [1, 2]', '"ngram_range": [1, 3]'))
+    np.savez_compressed(model_path, **arrays)
+    assert ls.load_model(model_path) is None
+
+
+def __write_training_data(path, is_learnable: bool) -> str:
+    """
+    Write a training CSV file of generated texts, whose ratings follow their words if they are learnable,
+    else are drawn at random with a majority of neutral ratings.
+    :param path: path of the file to write
+    :param is_learnable: whether the ratings depend on the texts
+    :return: the path of the written file
+    """
+    generator = random.Random(0)
+    words = {0.8: ['great', 'lovely', 'wonderful'], -0.8: ['awful', 'horrible', 'sad'], 0.0: ['blue', 'table', 'car']}
+    texts, ratings = [], []
+    for _ in range(300):
+        rating = generator.choice([0.8, -0.8, 0.0, 0.0])
+        texts.append(f'the {generator.choice(words[rating])} {generator.choice(words[0.0])}')
+        ratings.append(rating if is_learnable else generator.choice([0.8, -0.8, 0.0, 0.0]))
+    pd.DataFrame({'text_snippet': texts, 'mean_sentiment_rating': ratings}).to_csv(path, index=False)
+    return str(path)
+
+
+def test_only_models_beating_the_majority_label_are_selectable(tmp_path, monkeypatch):
+    """
+    Test if a model trained from a file is evaluated on held-out texts, and if its artifact makes
+    the linear engine selectable only when it beats the majority label.
+    """
+    monkeypatch.setenv('SENTIMENT_LINEAR_FEATURES', str(2 ** 12))
+    model = ls.train_model_from_file(__write_training_data(tmp_path / 'learnable.csv', True))
+    assert model.accuracy > model.baseline
+    model_path = ls.save_model(model, str(tmp_path / 'learnable.npz'))
+    assert ls.beats_baseline(model_path)
+    assert (ls.load_model(model_path).accuracy, ls.load_model(model_path).baseline) == (model.accuracy, model.baseline)
+    model = ls.train_model_from_file(__write_training_data(tmp_path / 'random.csv', False))
+    assert model.accuracy <= model.baseline
+    assert not ls.beats_baseline(ls.save_model(model, str(tmp_path / 'random.npz')))
+    assert not ls.beats_baseline(ls.save_model(__train_model(), str(tmp_path / 'unevaluated.npz')))
+    assert not ls.beats_baseline(str(tmp_path / 'missing.npz'))
+
+
+def test_training_data_is_required(monkeypatch):
+    """
+    Test if training a model from a file without configured training data raises a ValueError.
+    """
+    monkeypatch.delenv('SENTIMENT_LINEAR_TRAINING_DATA', raising=False)
+    with pytest.raises(ValueError):
+        ls.train_model_from_file()
+
@@ -0,0 +1,81 @@
+import threading
+import time
+
+from routes import live_route as lr
+from services import document_service as ds
+from services import live_service as ls
+
+
+def test_only_changed_sentences_are_scored():
+    """
+    Test if a live session only scores the sentences that changed since its previous scoring,
+    and gives the same polarities as scoring the whole text as a document.
+    """
+    session = ls.LiveSession()
+    texts = ['I love this phone.',
+             'I love this phone. The battery is',
+             'I love this phone. The battery is awful!',
+             'I love this phone. The battery is awful! I love this phone.']
+    rescored_counts = []
+    for text in texts:
+        polarities, sentences, rescored_count = session.score(text)
+        assert (polarities, sentences) == ds.get_document_polarities(text)
+        rescored_counts.append(rescored_count)
+    assert rescored_counts == [1, 1, 1, 0]
+
+
+def test_updates_are_debounced():
+    """
+    Test if a burst of updates is returned once, as its last text, after the debounce delay without change.
+    """
+    session = ls.LiveSession()
+    assert session.wait_for_text(0.05, 0.05) is None
+
+    def type_text():
+        for length in range(1, 6):
+            session.update('hello'[:length])
+            time.sleep(0.01)
+
+    typist = threading.Thread(target=type_text)
+    start = time.monotonic()
+    typist.start()
+    assert session.wait_for_text(0.1, 5) == 'hello'
+    assert time.monotonic() - start >= 0.14
+    typist.join()
+    assert session.wait_for_text(0.1, 0.1) is None
+
+
+def test_idle_sessions_expire(monkeypatch):
+    """
+    Test if sessions whose text was not updated for longer than the timeout are removed, even while their event stream
+    waits for a change, and if no session is created once the max number of sessions is reached.
+    """
+    monkeypatch.setenv('SENTIMENT_MAX_LIVE_SESSIONS', '1')
+    first_session_id = ls.create_session()
+    first_session = ls.get_session(first_session_id)
+    assert first_session is not None
+    assert ls.create_session() is None
+    monkeypatch.setenv('SENTIMENT_LIVE_SESSION_TIMEOUT', '0.05')
+    assert first_session.wait_for_text(0.01, 0.1) is None
+    second_session_id = ls.create_session()
+    assert ls.get_session(first_session_id) is None and ls.get_session(second_session_id) is not None
+    time.sleep(0.1)
+    assert ls.get_session(second_session_id) is None
+
+
+def test_event_streams_end(monkeypatch):
+    """
+    Test if the event stream of a live session ends once it lasted for the max stream duration,
+    and once the session expired although the stream kept it waiting.
+    """
+    monkeypatch.setenv('SENTIMENT_LIVE_STREAM_MAX_DURATION', '0.1')
+    session_id = ls.create_session()
+    start = time.monotonic()
+    assert set(lr.generate_live_events(session_id)) <= {': keep-alive\n\n'}
+    assert 0.1 <= time.monotonic() - start < 1
+    monkeypatch.setenv('SENTIMENT_LIVE_STREAM_MAX_DURATION', '600')
+    monkeypatch.setenv('SENTIMENT_LIVE_SESSION_TIMEOUT', '0')
+    time.sleep(0.01)
+    assert list(lr.generate_live_events(session_id)) == []
+    assert ls.get_session(session_id) is None
+
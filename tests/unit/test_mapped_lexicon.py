@@ -0,0 +1,68 @@
+import pickle
+
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from services import mapped_lexicon_service as ml
+
+lexicon = {'good': 1.9, 'bad': -2.5, 'zzz': -1.2, ':)': 2.0, 'café': 0.4}
+
+
+def test_mapped_lexicon_returns_valences(tmp_path):
+    """
+    Test if the mapped lexicon returns the valence of every word it was built from.
+    """
+    mapped_lexicon = ml.open_mapped_lexicon(ml.build_mapped_lexicon(lexicon, str(tmp_path / 'lexicon.map')))
+    assert len(mapped_lexicon) == len(lexicon)
+    assert dict(mapped_lexicon) == lexicon
+
+
+def test_mapped_lexicon_missing_words(tmp_path):
+    """
+    Test if the mapped lexicon does not contain words, or non string keys, it was not built from.
+    """
+    mapped_lexicon = ml.open_mapped_lexicon(ml.build_mapped_lexicon(lexicon, str(tmp_path / 'lexicon.map')))
+    assert 'goods' not in mapped_lexicon
+    assert '' not in mapped_lexicon
+    assert 1.9 not in mapped_lexicon
+    assert mapped_lexicon.get('average') is None
+
+
+def test_mapped_lexicon_matches_vader_lexicon(tmp_path):
+    """
+    Test if the mapped lexicon built from the VADER lexicon holds exactly the same valences.
+    """
+    vader_lexicon = SentimentIntensityAnalyzer().lexicon
+    mapped_lexicon = ml.open_mapped_lexicon(ml.build_mapped_lexicon(vader_lexicon, str(tmp_path / 'lexicon.map')))
+    assert dict(mapped_lexicon) == vader_lexicon
+
+
+def test_mapped_lexicon_is_picklable(tmp_path):
+    """
+    Test if a pickled mapped lexicon maps the same file again when unpickled.
+    """
+    mapped_lexicon = ml.open_mapped_lexicon(ml.build_mapped_lexicon(lexicon, str(tmp_path / 'lexicon.map')))
+    unpickled_lexicon = pickle.loads(pickle.dumps(mapped_lexicon))
+    assert dict(unpickled_lexicon) == lexicon
+
+
+def test_analyzer_with_mapped_lexicon_scores_like_vader(tmp_path):
+    """
+    Test if an analyzer reading valences from the mapped lexicon outputs the same polarities
+    as the stock analyzer.
+    """
+    text_analyzer = SentimentIntensityAnalyzer()
+    mapped_analyzer = SentimentIntensityAnalyzer()
+    mapped_lexicon_path = ml.build_mapped_lexicon(text_analyzer.lexicon, str(tmp_path / 'lexicon.map'))
+    mapped_analyzer.lexicon = ml.open_mapped_lexicon(mapped_lexicon_path)
+    for sentence in ['This is a GOOD book, but not great!', 'no good at all', 'I kind of like it :)']:
+        assert mapped_analyzer.polarity_scores(sentence) == text_analyzer.polarity_scores(sentence)
+
+
+def test_invalid_mapped_lexicon_returns_none(tmp_path):
+    """
+    Test if opening a missing or invalid mapped lexicon file returns None.
+    """
+    invalid_path = tmp_path / 'invalid.map'
+    invalid_path.write_bytes(b'not a mapped lexicon')
+    assert ml.open_mapped_lexicon(str(tmp_path / 'missing.map')) is None
+    assert ml.open_mapped_lexicon(str(invalid_path)) is None
@@ -0,0 +1,82 @@
+import random
+import string
+
+import pandas as pd
+import vaderSentiment.vaderSentiment as vader
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from services import analyzer_service as an
+from services import cache_service as cs
+from services import extractor_service as ex
+from tests import fake_constants_service as fct
+
+# Inputs without any sentiment-bearing token
+neutral_inputs = ['x', '', '   ', '42', 'a1b2c3d4-e5f6', 'https://example.com/path?query=1',
+                  'ORDER-2024-0001', 'the of and', 'very very', 'not never', 'but but',
+                  '!!! ???', 'just enough']
+
+# Inputs with a lexicon token, an emoticon or an emoji
+polar_inputs = ['good', 'x GOOD!', ':)', 'not bad', 'no', '😁', 'the bomb', 'kind']
+
+
+def __get_stock_analyzer() -> SentimentIntensityAnalyzer:
+    """
+    Return a stock VADER analyzer sharing the lexicon and emoji table of the shared analyzer.
+    :return: the stock SentimentIntensityAnalyzer
+    """
+    shared_analyzer = an.get_analyzer()
+    stock_analyzer = SentimentIntensityAnalyzer.__new__(SentimentIntensityAnalyzer)
+    stock_analyzer.lexicon = shared_analyzer.lexicon
+    stock_analyzer.emojis = shared_analyzer.emojis
+    return stock_analyzer
+
+
+def test_neutral_inputs_are_proven_neutral():
+    """
+    Test if inputs without sentiment-bearing tokens pass the neutral pre-filter.
+    """
+    analyzer = an.get_analyzer()
+    assert all(analyzer.is_neutral(user_input) for user_input in neutral_inputs)
+
+
+def test_polar_inputs_are_not_proven_neutral():
+    """
+    Test if inputs with a lexicon token, an emoticon or an emoji do not pass the neutral pre-filter.
+    """
+    analyzer = an.get_analyzer()
+    assert not any(analyzer.is_neutral(user_input) for user_input in polar_inputs)
+
+
+def test_proven_neutral_inputs_have_null_compound():
+    """
+    Test if every input passing the neutral pre-filter has a null compound score with the stock analyzer,
+    on the accuracy test dataset, on known inputs and on random texts built from the rule words and punctuation.
+    """
+    analyzer = an.get_analyzer()
+    stock_analyzer = __get_stock_analyzer()
+    words = [*vader.NEGATE, *vader.BOOSTER_DICT, 'no', 'but', 'least', 'at', 'the', 'x', 'ID-42', 'N\'T', ':-',
+             'bus', 'stop', 'kind', 'of', *string.punctuation]
+    generator = random.Random(0)
+    texts = pd.read_csv('./tests/unit/data/accuracy_test_data.csv')['text_snippet'].tolist()
+    texts += neutral_inputs + polar_inputs
+    texts += [' '.join(generator.choice(words) for _ in range(generator.randint(0, 8))) for _ in range(5000)]
+    proven_neutral_count = 0
+    for text in texts:
+        if analyzer.is_neutral(text):
+            proven_neutral_count += 1
+            assert stock_analyzer.polarity_scores(text)['compound'] == 0.0
+    assert proven_neutral_count > len(neutral_inputs)
+
+
+def test_proven_neutral_inputs_skip_scoring_and_cache(monkeypatch):
+    """
+    Test if extracting the sentiment of a proven neutral input returns the neutral label
+    without scoring it nor looking it up in the result cache.
+    """
+    analyzer = an.get_analyzer()
+    result_cache = cs.get_result_cache()
+    result_cache.clear()
+    monkeypatch.setattr(analyzer, 'polarity_scores', lambda text: None)
+    assert ex.get_sentiment('x') == fct.get_neutrality_label()
+    assert ex.get_sentiments(['x', 'ORDER-42']) == [fct.get_neutrality_label()] * 2
+    assert result_cache.get_stats()['misses'] == 0
@@ -0,0 +1,77 @@
+import random
+
+import vaderSentiment.vaderSentiment as vader
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from services import phrase_service as ph
+from services import scorer_service as sc
+
+# Words of the VADER phrases, lexicon words, boosters, negations and rule words the phrase-dense texts are made of
+phrase_words = sorted({word for phrase in list(vader.SPECIAL_CASES) + list(vader.BOOSTER_DICT)
+                       for word in phrase.split(' ')})
+rule_words = ['good', 'bad', 'great', 'horrible', 'love', 'die', 'death', 'kiss', 'heart', 'shit', 'bomb', 'right',
+              'yeah', 'not', 'never', 'so', 'this', 'very', 'no', 'least', 'at', 'but', 'kind', 'of', 'GOOD', 'BAD',
+              'without', 'doubt', 'or', 'nor', 'the', 'stop', 'bus', 'enough', 'just', 'sort', 'to', 'for', '!', '?']
+
+
+def __get_phrase_dense_texts(count: int, length: int) -> list[str]:
+    """
+    Return reproducible random texts mostly made of VADER phrase words and rule words.
+    :param count: number of texts
+    :param length: number of words per text
+    :return: the list of texts
+    """
+    generator = random.Random(21)
+    vocabulary = phrase_words + rule_words
+    return [' '.join(generator.choice(vocabulary) for _ in range(length)) for _ in range(count)]
+
+
+def __find_by_windows(phrases: list[str], words: list[str]) -> dict[tuple[int, int], str]:
+    """
+    Return every phrase occurring in the provided words by comparing each word window with each phrase.
+    :param phrases: phrases to find
+    :param words: words of a text
+    :return: the dictionary of phrases keyed by (end position, number of words) tuples
+    """
+    matches = {}
+    for phrase in phrases:
+        length = len(phrase.split(' '))
+        for end in range(length - 1, len(words)):
+            if ' '.join(words[end - length + 1:end + 1]) == phrase:
+                matches[end, length] = phrase
+    return matches
+
+
+def test_matcher_finds_overlapping_phrases():
+    """
+    Test if the matcher finds every occurrence of phrases sharing words, prefixes and suffixes,
+    and ignores single words.
+    """
+    phrases = ['kiss of death', 'of death', 'kind of', 'kind of death wish', 'death wish', 'single']
+    matcher = ph.PhraseMatcher(phrases)
+    words = 'a kind of kiss of death wish kind of death wish single'.split(' ')
+    assert matcher.find(words) == __find_by_windows(phrases[:-1], words)
+    assert matcher.find([]) == {}
+
+
+def test_vader_matcher_finds_every_window_phrase():
+    """
+    Test if the VADER phrase matcher finds the same phrases as a scan of every word window.
+    """
+    phrases = [phrase for phrase in list(vader.SPECIAL_CASES) + list(vader.BOOSTER_DICT) if ' ' in phrase]
+    for text in __get_phrase_dense_texts(300, 40):
+        words = text.lower().split()
+        assert ph.VADER_PHRASE_MATCHER.find(words) == __find_by_windows(phrases, words)
+
+
+def test_phrase_dense_texts_score_like_stock_analyzer():
+    """
+    Test if texts dense in special case and booster phrases get exactly the polarities of the stock analyzer.
+    """
+    stock_analyzer = SentimentIntensityAnalyzer()
+    analyzer = sc.MemoizedAnalyzer(stock_analyzer.lexicon, stock_analyzer.emojis, 1000)
+    texts = __get_phrase_dense_texts(2000, 12) + __get_phrase_dense_texts(50, 300) + [
+        'That movie was the bomb, to die for, not the kiss of death', 'Yeah right, this is the shit',
+        'It is kind of good and sort of bad', 'The bus stop is a beating heart of the city', 'The Bomb was GOOD']
+    for text in texts:
+        assert analyzer.polarity_scores(text) == stock_analyzer.polarity_scores(text)
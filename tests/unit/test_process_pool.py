@@ -0,0 +1,83 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+import pytest
+
+from services import analyzer_service as an
+from services import pool_service as ps
+
+
+@pytest.fixture
+def two_workers(monkeypatch):
+    """
+    Score every list of texts with a pool of two worker processes, stopped after the test.
+    """
+    monkeypatch.setenv('SENTIMENT_POOL_WORKERS', '2')
+    monkeypatch.setenv('SENTIMENT_POOL_MIN_TEXTS', '1')
+    yield
+    ps.shutdown()
+
+
+def __get_sentences() -> list[str]:
+    """
+    Return the sentences of the accuracy test dataset.
+    :return: the list of sentences
+    """
+    return pd.read_csv('./tests/unit/data/accuracy_test_data.csv')['text_snippet'].tolist()
+
+
+def test_chunks_keep_input_order():
+    """
+    Test if the chunks hold every text once, in input order.
+    """
+    sentences = __get_sentences()
+    chunks = ps.get_chunks(sentences, 4)
+    assert [sentence for chunk in chunks for sentence in chunk] == sentences
+
+
+def test_chunks_are_shared_between_workers(monkeypatch):
+    """
+    Test if every worker gets a chunk when the texts are shorter than one chunk,
+    and if chunks hold about the configured number of characters when texts are longer.
+    """
+    sentences = __get_sentences()
+    assert len(ps.get_chunks(sentences[:40], 4)) >= 4
+    monkeypatch.setenv('SENTIMENT_POOL_CHUNK_LENGTH', '1000')
+    chunks = ps.get_chunks(sentences, 4)
+    assert all(sum(len(sentence) for sentence in chunk[:-1]) < 1000 for chunk in chunks)
+    assert len(chunks) >= sum(len(sentence) for sentence in sentences) // (1000 + 500)
+
+
+def test_pool_scores_match_analyzer_in_order(two_workers, monkeypatch):
+    """
+    Test if texts scored by the worker processes in small chunks get the analyzer polarities in input order.
+    """
+    monkeypatch.setenv('SENTIMENT_POOL_CHUNK_LENGTH', '500')
+    analyzer = an.get_analyzer()
+    sentences = __get_sentences()[:200]
+    assert ps.score_texts(sentences) == [analyzer.polarity_scores(sentence) for sentence in sentences]
+
+
+def test_crashed_worker_is_restarted(two_workers):
+    """
+    Test if scoring texts after a worker process crashed restarts the pool and still returns every polarity.
+    """
+    analyzer = an.get_analyzer()
+    sentences = __get_sentences()[:50]
+    ps.warm_up()
+    with pytest.raises(BrokenProcessPool):
+        ps.get_executor().submit(os._exit, 1).result()
+    restart_count = ps.get_stats()['restarts']
+    assert ps.score_texts(sentences) == [analyzer.polarity_scores(sentence) for sentence in sentences]
+    assert ps.get_stats()['restarts'] == restart_count + 1
+
+
+def test_disabled_pool_scores_in_process(monkeypatch):
+    """
+    Test if texts are scored without starting the pool when it has a single worker.
+    """
+    monkeypatch.setenv('SENTIMENT_POOL_WORKERS', '1')
+    ps.shutdown()
+    ps.score_texts(__get_sentences())
+    assert not ps.get_stats()['started']
@@ -0,0 +1,112 @@
+from services import cache_service as cs
+from services import extractor_service as ex
+
+
+def test_cache_returns_put_compound():
+    """
+    Test if cached polarities are returned for the same text and not for another one.
+    """
+    cache = cs.ResultCache(cs.ENTRY_SIZE * 10)
+    cache.put('This is a great book', (0.0, 0.423, 0.577, 0.6249))
+    assert cache.get('This is a great book') == (0.0, 0.423, 0.577, 0.6249)
+    assert cache.get('This is a terrible book') is None
+
+
+def test_cache_never_exceeds_capacity():
+    """
+    Test if the cache evicts entries once it holds as many entries as its memory budget allows,
+    the cached texts being counted, and if a text bigger than the whole budget is not cached.
+    """
+    cache = cs.ResultCache(cs.get_entry_size('text 00') * 10)
+    for index in range(100):
+        cache.put(f'text {index:02}', (0.0, 1.0, 0.0, 0.0))
+    stats = cache.get_stats()
+    assert stats['entries'] == 10
+    assert stats['bytes'] == stats['max_bytes']
+    assert stats['evictions'] == 90
+    cache.put('long text ' * 1000, (0.0, 1.0, 0.0, 0.0))
+    assert cache.get('long text ' * 1000) is None
+    cache.put('text 00' + ' ' * 50, (0.0, 1.0, 0.0, 0.0))
+    stats = cache.get_stats()
+    assert stats['entries'] < 10 and stats['bytes'] <= stats['max_bytes']
+
+
+def test_texts_with_the_same_hash_do_not_share_polarities():
+    """
+    Test if the cache returns the polarities of a text only for that text, and not for another text
+    having the same hash.
+    """
+
+    class CollidingText(str):
+        def __hash__(self):
+            return 0
+
+    cache = cs.ResultCache(cs.ENTRY_SIZE * 10)
+    cache.put(CollidingText('This is a great book'), (0.0, 0.423, 0.577, 0.6249))
+    assert hash(CollidingText('This is a terrible book')) == hash(CollidingText('This is a great book'))
+    assert cache.get(CollidingText('This is a terrible book')) is None
+    assert cache.get(CollidingText('This is a great book')) == (0.0, 0.423, 0.577, 0.6249)
+
+
+def test_frequent_entry_survives_scan():
+    """
+    Test if an entry hit again after being cached is not evicted by a scan of one-off inputs.
+    """
+    cache = cs.ResultCache(cs.ENTRY_SIZE * 10)
+    cache.put('frequent text', (0.0, 0.5, 0.5, 0.5))
+    assert cache.get('frequent text') == (0.0, 0.5, 0.5, 0.5)
+    for index in range(100):
+        cache.put(f'one-off text {index}', (0.0, 1.0, 0.0, 0.0))
+    assert cache.get('frequent text') == (0.0, 0.5, 0.5, 0.5)
+
+
+def test_disabled_cache_stores_nothing():
+    """
+    Test if a cache with a null memory budget never returns polarities.
+    """
+    cache = cs.ResultCache(0)
+    cache.put('This is a great book', (0.0, 0.423, 0.577, 0.6249))
+    assert cache.get('This is a great book') is None
+    assert cache.get_stats()['entries'] == 0
+
+
+def test_cache_counts_hits_and_misses():
+    """
+    Test if the cache statistics count hits and misses and compute the hit rate.
+    """
+    cache = cs.ResultCache(cs.ENTRY_SIZE * 10)
+    cache.put('cached text', (0.0, 0.9, 0.1, 0.1))
+    cache.get('cached text')
+    cache.get('cached text')
+    cache.get('missing text')
+    stats = cache.get_stats()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 1
+    assert stats['hit_rate'] == 2 / 3
+
+
+def test_get_sentiment_uses_result_cache():
+    """
+    Test if extracting the same sentiment twice scores the input once and then hits the cache.
+    """
+    cache = cs.get_result_cache()
+    cache.clear()
+    first_sentiment = ex.get_sentiment('This is a great book')
+    second_sentiment = ex.get_sentiment('This is a great book')
+    stats = cache.get_stats()
+    assert first_sentiment == second_sentiment
+    assert stats['misses'] == 1
+    assert stats['hits'] == 1
+
+
+def test_get_sentiments_matches_get_sentiment():
+    """
+    Test if extracting a batch of sentiments through the cache gives the single input sentiments.
+    """
+    cs.get_result_cache().clear()
+    user_inputs = ['This is a great book', 'This is a terrible book', 'x']
+    ex.get_sentiment(user_inputs[0])
+    expected_sentiments = [ex.get_sentiment(user_input) for user_input in user_inputs]
+    cs.get_result_cache().clear()
+    ex.get_sentiment(user_inputs[1])
+    assert ex.get_sentiments(user_inputs) == expected_sentiments
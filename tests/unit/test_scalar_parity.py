@@ -0,0 +1,107 @@
+import random
+
+import pandas as pd
+import vaderSentiment.vaderSentiment as vader
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from services import scorer_service as sc
+
+# Max absolute difference allowed between the polarities of the stock analyzer and of the memoized one
+tolerance = 1e-9
+
+# Stock analyzer the memoized analyzer is compared with
+stock_analyzer = SentimentIntensityAnalyzer()
+
+# Rule words and punctuation the generated texts are made of, along with lexicon words and emojis
+rule_words = sorted(set(vader.NEGATE) | set(vader.BOOSTER_DICT) | {
+    'but', 'BUT', 'But', 'least', 'at', 'very', 'no', 'No', 'never', 'so', 'this', 'without', 'doubt', 'or', 'nor',
+    'kind', 'of', 'the', 'bomb', 'shit', 'kiss', 'death', 'yeah', 'right', 'die', 'for', 'to', 'bus', 'stop'})
+punctuation = ['', '', '', '!', '!!', '?', '?!', '.', '...', ',', ':)', "'s"]
+
+
+def __get_analyzer(memo_size: int = 1000) -> sc.MemoizedAnalyzer:
+    """
+    Return a memoized analyzer sharing the lexicon and emoji table of the stock analyzer.
+    :param memo_size: maximum number of memoized tokens
+    :return: the MemoizedAnalyzer
+    """
+    return sc.MemoizedAnalyzer(stock_analyzer.lexicon, stock_analyzer.emojis, memo_size)
+
+
+def __assert_same_polarities(analyzer: sc.MemoizedAnalyzer, texts: list[str]):
+    """
+    Assert that the memoized analyzer gives each text the polarities of the stock analyzer.
+    :param analyzer: the memoized analyzer
+    :param texts: input texts
+    """
+    for text in texts:
+        scores = analyzer.polarity_scores(text)
+        expected_scores = stock_analyzer.polarity_scores(text)
+        assert all(abs(scores[key] - expected_scores[key]) <= tolerance for key in expected_scores), text
+
+
+def __get_generated_texts(count: int, max_length: int, seed: int) -> list[str]:
+    """
+    Return reproducible random texts mixing lexicon words in every casing, rule words, punctuation and emojis.
+    :param count: number of texts
+    :param max_length: max number of tokens per text
+    :param seed: seed of the random generator
+    :return: the list of texts
+    """
+    generator = random.Random(seed)
+    lexicon_words = sorted(stock_analyzer.lexicon)
+    emojis = sorted(emoji for emoji in stock_analyzer.emojis if len(emoji) == 1)
+    texts = []
+    for _ in range(count):
+        tokens = []
+        for _ in range(generator.randint(0, max_length)):
+            kind = generator.random()
+            if kind < 0.45:
+                word = generator.choice(lexicon_words)
+                word = generator.choice([word, word, word.upper(), word.title()])
+            elif kind < 0.85:
+                word = generator.choice(rule_words)
+            elif kind < 0.92:
+                word = generator.choice(emojis)
+            else:
+                word = generator.choice(['book', 'the', 'a', 'x', 'IT', 'is', '42', 'café', ''])
+            tokens.append(word + generator.choice(punctuation))
+        texts.append(' '.join(tokens))
+    return texts
+
+
+def test_generated_texts_score_like_stock_analyzer():
+    """
+    Test if thousands of random texts, short and long, get the polarities of the stock analyzer,
+    with and without the token memo.
+    """
+    texts = __get_generated_texts(3000, 25, 22) + __get_generated_texts(40, 400, 23)
+    __assert_same_polarities(__get_analyzer(), texts)
+    __assert_same_polarities(__get_analyzer(0), texts[:500])
+
+
+def test_real_texts_score_like_stock_analyzer():
+    """
+    Test if the accuracy test dataset sentences, alone and joined into documents holding several "but",
+    get the polarities of the stock analyzer.
+    """
+    sentences = pd.read_csv('./tests/unit/data/accuracy_test_data.csv')['text_snippet'].tolist()
+    documents = [' but '.join(sentences[start:start + 20]) for start in range(0, len(sentences), 20)]
+    __assert_same_polarities(__get_analyzer(), sentences + documents)
+
+
+def test_but_rule_updates_first_position_of_equal_values():
+    """
+    Test if, like the stock rule, the "but" rule dampens again a dampened sentiment equal to a later one,
+    leaving that later one unchanged instead of emphasizing it.
+    """
+    lexicon = stock_analyzer.lexicon
+    words = {valence: word for word, valence in sorted(lexicon.items()) if word.isalpha() and word.islower()}
+    word, half_word = next((word, words[valence / 2]) for valence, word in sorted(words.items())
+                           if valence > 0 and valence / 2 in words)
+    text = f'{word} but {half_word}'
+    half_valence = lexicon[half_word]
+    scores = __get_analyzer().polarity_scores(text)
+    assert scores == stock_analyzer.polarity_scores(text)
+    assert scores['compound'] == round(vader.normalize(half_valence * 0.5 + half_valence), 4)
+    assert scores['compound'] != round(vader.normalize(half_valence + half_valence * 1.5), 4)
@@ -0,0 +1,81 @@
+from routes import analyzer_route as ar
+from services import analyzer_service as an
+from services import cache_service as cs
+from services import extractor_service as ex
+from tests import fake_constants_service as fct
+
+
+def test_custom_threshold_changes_label():
+    """
+    Test if a compound below the default threshold but above a custom one gets a polar label.
+    """
+    assert ex.get_label(0.04) == fct.get_neutrality_label()
+    assert ex.get_label(0.04, threshold=0.01) == fct.get_positivity_label()
+    assert ex.get_label(-0.04, threshold=0.01) == fct.get_negativity_label()
+    assert ex.get_label(0.3, threshold=0.5) == fct.get_neutrality_label()
+
+
+def test_custom_labels_replace_default_names():
+    """
+    Test if the provided label names replace the default ones, missing ones keeping their default name.
+    """
+    labels = {fct.get_positivity_label_key(): 'good', fct.get_negativity_label_key(): 'bad'}
+    assert ex.get_label(0.5, labels=labels) == 'good'
+    assert ex.get_label(-0.5, labels=labels) == 'bad'
+    assert ex.get_label(0.0, labels=labels) == fct.get_neutrality_label()
+
+
+def test_polarities_match_analyzer_scores():
+    """
+    Test if the extracted polarities are the analyzer ones, whether they come from the result cache or not,
+    and for a proven neutral input.
+    """
+    cs.get_result_cache().clear()
+    analyzer = an.get_analyzer()
+    for user_input in ['This is a great book', 'This is a great book', 'x', '']:
+        assert ex.get_polarities(user_input) == analyzer.polarity_scores(user_input)
+
+
+def test_changing_threshold_does_not_rescore(monkeypatch):
+    """
+    Test if labelling a cached input with other thresholds never scores it again.
+    """
+    cs.get_result_cache().clear()
+    compound = ex.get_polarities('This is a rather nice book')['compound']
+    monkeypatch.setattr(an.get_analyzer(), 'polarity_scores', lambda text: None)
+    for threshold in [0.1, 0.5, 0.9]:
+        assert ex.get_label(ex.get_polarities('This is a rather nice book')['compound'], threshold) \
+               == ex.get_label(compound, threshold)
+
+
+def test_valid_options_return_false():
+    """
+    Test if a request JSON with valid "scores", "threshold" and "labels" components is valid.
+    """
+    request_json = {fct.get_analyzer_endpoint_key(): 'This is a great book',
+                    fct.get_analyzer_endpoint_scores_key(): True,
+                    fct.get_analyzer_endpoint_threshold_key(): 0.2,
+                    fct.get_analyzer_endpoint_labels_key(): {fct.get_neutrality_label_key(): 'meh'}}
+    assert not ar.is_invalid_request_json(request_json)
+
+
+def test_invalid_options_return_their_message():
+    """
+    Test if an invalid "scores", "threshold" or "labels" component makes the request invalid
+    with the corresponding 400 Bad Request message.
+    """
+    input_key = fct.get_analyzer_endpoint_key()
+    message_key = fct.get_response_message_key()
+    invalid_options = [(fct.get_analyzer_endpoint_scores_key(), 'yes', fct.get_not_boolean_scores_flag_message()),
+                       (fct.get_analyzer_endpoint_threshold_key(), 0, fct.get_invalid_threshold_message()),
+                       (fct.get_analyzer_endpoint_threshold_key(), 1.5, fct.get_invalid_threshold_message()),
+                       (fct.get_analyzer_endpoint_threshold_key(), True, fct.get_invalid_threshold_message()),
+                       (fct.get_analyzer_endpoint_threshold_key(), '0.2', fct.get_invalid_threshold_message()),
+                       (fct.get_analyzer_endpoint_labels_key(), 'good', fct.get_invalid_labels_message()),
+                       (fct.get_analyzer_endpoint_labels_key(), {'great': 'good'}, fct.get_invalid_labels_message()),
+                       (fct.get_analyzer_endpoint_labels_key(), {fct.get_positivity_label_key(): 1},
+                        fct.get_invalid_labels_message())]
+    for option_key, option_value, expected_message in invalid_options:
+        request_json = {input_key: 'This is a great book', option_key: option_value}
+        assert ar.is_invalid_request_json(request_json)
+        assert ar.get_response_400_data_by_reason(request_json) == {message_key: expected_message}
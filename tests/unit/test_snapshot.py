@@ -0,0 +1,78 @@
+import marshal
+import struct
+
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from services import snapshot_service as ss
+
+sentences = ['This is a great book', 'This is NOT a terrible book!!', 'I love it 😍', 'x']
+
+
+def test_snapshot_contains_lexicon_and_emojis(tmp_path):
+    """
+    Test if a built snapshot contains only the same lexicon and emoji table as the VADER text files,
+    and if no temporary file is left next to it.
+    """
+    snapshot_path = ss.build_snapshot(str(tmp_path / 'lexicon.snapshot'))
+    snapshot = ss.load_snapshot(snapshot_path)
+    analyzer = SentimentIntensityAnalyzer()
+    assert snapshot['lexicon'] == analyzer.lexicon
+    assert snapshot['emojis'] == analyzer.emojis
+    assert sorted(snapshot) == sorted(ss.SNAPSHOT_SECTIONS)
+    assert [path.name for path in tmp_path.iterdir()] == ['lexicon.snapshot']
+
+
+def test_snapshot_analyzer_scores_like_text_analyzer(tmp_path):
+    """
+    Test if the analyzer loaded from a snapshot outputs the same polarities
+    as the analyzer built from the VADER text files.
+    """
+    snapshot_path = ss.build_snapshot(str(tmp_path / 'lexicon.snapshot'))
+    snapshot_analyzer = ss.load_analyzer(snapshot_path)
+    text_analyzer = SentimentIntensityAnalyzer()
+    for sentence in sentences:
+        assert snapshot_analyzer.polarity_scores(sentence) == text_analyzer.polarity_scores(sentence)
+
+
+def test_missing_snapshot_returns_none(tmp_path):
+    """
+    Test if loading a snapshot that does not exist returns None.
+    """
+    assert ss.load_snapshot(str(tmp_path / 'missing.snapshot')) is None
+    assert ss.load_analyzer(str(tmp_path / 'missing.snapshot')) is None
+
+
+def test_corrupted_snapshot_returns_none(tmp_path):
+    """
+    Test if loading a snapshot that is not a valid snapshot file returns None.
+    """
+    snapshot_path = tmp_path / 'corrupted.snapshot'
+    snapshot_path.write_bytes(ss.SNAPSHOT_MAGIC + b'not a marshalled dictionary')
+    assert ss.load_snapshot(str(snapshot_path)) is None
+
+
+def test_stale_snapshot_returns_none(tmp_path):
+    """
+    Test if loading a snapshot built from other lexicon sources returns None.
+    """
+    snapshot_path = tmp_path / 'stale.snapshot'
+    fingerprint = marshal.dumps('stale')
+    snapshot_path.write_bytes(ss.SNAPSHOT_MAGIC + struct.pack('=I', len(fingerprint)) + fingerprint)
+    assert ss.load_snapshot(str(snapshot_path)) is None
+
+
+def test_source_fingerprint_is_computed_once():
+    """
+    Test if the fingerprint of the snapshot sources is computed once per process.
+    """
+    assert ss.get_source_fingerprint() is ss.get_source_fingerprint()
+
+
+def test_snapshot_without_lexicon_section(tmp_path):
+    """
+    Test if a snapshot loaded without its lexicon section still contains the emoji table.
+    """
+    snapshot_path = ss.build_snapshot(str(tmp_path / 'lexicon.snapshot'))
+    snapshot = ss.load_snapshot(snapshot_path, with_lexicon=False)
+    assert 'lexicon' not in snapshot
+    assert snapshot['emojis'] == SentimentIntensityAnalyzer().emojis
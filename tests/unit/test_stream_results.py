@@ -0,0 +1,69 @@
+import io
+import json
+from itertools import count, islice
+
+from routes import analyzer_route as ar
+from tests import fake_constants_service as fct
+
+
+def __get_line(user_input) -> bytes:
+    """
+    Return the newline-delimited JSON request line of the provided input.
+    :param user_input: the "input" value of the line
+    :return: the encoded line
+    """
+    return json.dumps({fct.get_analyzer_endpoint_key(): user_input}).encode('utf-8')
+
+
+def test_stream_results_are_in_input_order():
+    """
+    Test if the streamed results follow the order of the request lines, across chunks.
+    """
+    sentences = ['This is a great book', 'This is a terrible book', 'x'] * 5
+    lines = [__get_line(sentence) for sentence in sentences]
+    streamed = ''.join(ar.generate_stream_results(lines, chunk_size=4))
+    results = [json.loads(result) for result in streamed.splitlines()]
+    sentiment_key = fct.get_response_sentiment_key()
+    expected_sentiments = [fct.get_positivity_label(), fct.get_negativity_label(), fct.get_neutrality_label()] * 5
+    assert [result[sentiment_key] for result in results] == expected_sentiments
+
+
+def test_stream_results_contain_line_errors():
+    """
+    Test if each invalid request line gets its own error message result.
+    """
+    lines = [b'not json', b'[1, 2]', b'{}', __get_line(None), __get_line('x' * (fct.get_max_input_length() + 1))]
+    streamed = ''.join(ar.generate_stream_results(lines, chunk_size=2))
+    results = [json.loads(result)[fct.get_response_message_key()] for result in streamed.splitlines()]
+    assert results == [fct.get_invalid_json_line_message(),
+                       fct.get_invalid_json_line_message(),
+                       fct.get_missing_input_key_message(),
+                       fct.get_none_batch_input_message(),
+                       fct.get_too_big_input_length_message()]
+
+
+def test_stream_results_consume_lines_lazily():
+    """
+    Test if the streamed results of an unbounded request only consume one chunk of lines per chunk of results.
+    """
+    consumed_lines = []
+
+    def unbounded_lines():
+        for index in count():
+            consumed_lines.append(index)
+            yield __get_line('This is a great book')
+
+    chunk_size = 10
+    results = ar.generate_stream_results(unbounded_lines(), chunk_size)
+    first_chunks = list(islice(results, 3))
+    assert len(first_chunks) == 3
+    assert len(consumed_lines) == 3 * chunk_size
+
+
+def test_read_lines_skips_empty_lines_and_truncates_long_lines():
+    """
+    Test if reading the request stream skips empty lines and truncates too long lines.
+    """
+    stream = io.BytesIO(b'{"input": "a"}\n\n  \n' + b'x' * 50 + b'\n{"input": "b"}')
+    lines = list(ar.read_lines(stream, max_line_size=20))
+    assert lines == [b'{"input": "a"}', b'x' * 20, b'{"input": "b"}']
@@ -0,0 +1,90 @@
+import pandas as pd
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from services import analyzer_service as an
+from services import scorer_service as sc
+
+# Sentences exercising every VADER rule
+rule_sentences = ['VADER is VERY SMART, uber handsome, and FRIGGIN FUNNY!!!',
+                  'VADER is not smart, handsome, nor funny.',
+                  'At least it isn\'t a horrible book.',
+                  'The book was only kind of good.',
+                  'The plot was good, but the characters are uncompelling and the dialog is not great.',
+                  'Today only kinda sux! But I\'ll get by, lol',
+                  'Make sure you :) or :D today!',
+                  'Catch utf-8 emoji such as 💘 and 💋 and 😁',
+                  'Sentiment analysis has never been this good!',
+                  'With VADER, sentiment analysis is the shit!',
+                  'Without a doubt, excellent idea.',
+                  'Roger Dodger is one of the least compelling variations on this theme.',
+                  'No good, no bad or horrible stuff',
+                  'It was sort of good, good but good',
+                  '']
+
+
+def __get_stock_analyzer() -> SentimentIntensityAnalyzer:
+    """
+    Return a stock VADER analyzer sharing the lexicon and emoji table of the shared analyzer.
+    :return: the stock SentimentIntensityAnalyzer
+    """
+    shared_analyzer = an.get_analyzer()
+    stock_analyzer = SentimentIntensityAnalyzer.__new__(SentimentIntensityAnalyzer)
+    stock_analyzer.lexicon = shared_analyzer.lexicon
+    stock_analyzer.emojis = shared_analyzer.emojis
+    return stock_analyzer
+
+
+def test_shared_analyzer_is_memoized():
+    """
+    Test if the shared analyzer memoizes its per-token work.
+    """
+    assert isinstance(an.get_analyzer(), sc.MemoizedAnalyzer)
+
+
+def test_memoized_scores_match_stock_analyzer():
+    """
+    Test if the memoized analyzer gives exactly the stock VADER polarities on the accuracy test dataset
+    and on sentences exercising every rule, with a cold and with a warm memo.
+    """
+    shared_analyzer = an.get_analyzer()
+    analyzer = sc.MemoizedAnalyzer(shared_analyzer.lexicon, shared_analyzer.emojis, 100000)
+    stock_analyzer = __get_stock_analyzer()
+    sentences = pd.read_csv('./tests/unit/data/accuracy_test_data.csv')['text_snippet'].tolist() + rule_sentences
+    for _ in range(2):
+        for sentence in sentences:
+            assert analyzer.polarity_scores(sentence) == stock_analyzer.polarity_scores(sentence)
+
+
+def test_token_memo_is_bounded():
+    """
+    Test if the token memo never holds more tokens than its capacity and still scores exactly.
+    """
+    shared_analyzer = an.get_analyzer()
+    analyzer = sc.MemoizedAnalyzer(shared_analyzer.lexicon, shared_analyzer.emojis, 4)
+    stock_analyzer = __get_stock_analyzer()
+    for sentence in rule_sentences:
+        assert analyzer.polarity_scores(sentence) == stock_analyzer.polarity_scores(sentence)
+        assert analyzer.get_memo_stats()['entries'] <= 4
+
+
+def test_disabled_token_memo_stores_nothing():
+    """
+    Test if an analyzer with a null memo size memoizes no token.
+    """
+    shared_analyzer = an.get_analyzer()
+    analyzer = sc.MemoizedAnalyzer(shared_analyzer.lexicon, shared_analyzer.emojis, 0)
+    analyzer.polarity_scores('This is a great book')
+    assert analyzer.get_memo_stats()['entries'] == 0
+
+
+def test_token_info_strips_punctuation():
+    """
+    Test if the memoized token facts are the ones of the token stripped from its punctuation.
+    """
+    token_info = an.get_analyzer().get_token_info('GREAT!!')
+    assert token_info.word == 'GREAT'
+    assert token_info.lower == 'great'
+    assert token_info.valence == 3.1
+    assert token_info.is_upper
+    assert not token_info.booster
+    assert not token_info.is_negation
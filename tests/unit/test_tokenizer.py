@@ -0,0 +1,94 @@
+import random
+
+import pandas as pd
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer, SentiText
+
+from services import analyzer_service as an
+from services import scorer_service as sc
+from services import text_service as tx
+
+# Texts exercising punctuation stripping, emoticons, caps differential and emphasis
+tokenizer_texts = ['VADER is VERY SMART, uber handsome, and FRIGGIN FUNNY!!!',
+                   'ALL CAPS TEXT!!!!!!',
+                   'Make sure you :) or :D today!',
+                   'Really?? Are you sure??? Why????',
+                   '!!! ?!? ... :-) <3 --- !a! ?b?',
+                   "Today only kinda sux! But I'll get by, lol",
+                   'no, but NOT bad but good',
+                   '   spaced\tout\ntext   ',
+                   '',
+                   '!']
+
+
+def __get_random_texts(count: int) -> list[str]:
+    """
+    Return random texts mixing lexicon words, upper case words, punctuation and emoticons.
+    :param count: number of texts
+    :return: the list of texts
+    """
+    generator = random.Random(0)
+    vocabulary = ['good', 'GOOD', 'bad', 'BAD', 'not', 'but', 'But', 'very', 'kind', 'of', 'no', 'never', 'so',
+                  ':)', ':(', ':D', '!', '?', '!!', '??', '...', 'ok!', 'why?', '"great"', "isn't", 'HATE!!',
+                  '(love)', 'least', 'at', 'yes']
+    return [' '.join(generator.choice(vocabulary) for _ in range(generator.randrange(15))) for _ in range(count)]
+
+
+def __get_texts() -> list[str]:
+    """
+    Return the accuracy test dataset sentences, the tokenizer texts and random texts.
+    :return: the list of texts
+    """
+    sentences = pd.read_csv('./tests/unit/data/accuracy_test_data.csv')['text_snippet'].tolist()
+    return sentences + tokenizer_texts + __get_random_texts(3000)
+
+
+def test_tokens_match_stock_tokenization():
+    """
+    Test if the fused tokenizer gives exactly the tokens and caps differential of the VADER SentiText
+    and the exclamation point and question mark counts of the text.
+    """
+    analyzer = an.get_analyzer()
+    for text in __get_texts():
+        text = analyzer.emoji_replacer.replace(text)
+        tokenized_text = analyzer.tokenize(text)
+        senti_text = SentiText(text)
+        assert [token.word for token in tokenized_text.tokens] == senti_text.words_and_emoticons
+        assert tokenized_text.lowers == [word.lower() for word in senti_text.words_and_emoticons]
+        assert tokenized_text.is_cap_diff == senti_text.is_cap_diff
+        assert tokenized_text.exclamation_count == text.count('!')
+        assert tokenized_text.question_count == text.count('?')
+
+
+def test_tokens_do_not_depend_on_the_memo():
+    """
+    Test if texts are tokenized the same with a cold, a warm and a disabled token memo.
+    """
+    shared_analyzer = an.get_analyzer()
+    analyzers = [sc.MemoizedAnalyzer(shared_analyzer.lexicon, shared_analyzer.emojis, memo_size)
+                 for memo_size in [100000, 3, 0]]
+    for text in tokenizer_texts * 2:
+        assert analyzers[0].tokenize(text) == analyzers[1].tokenize(text) == analyzers[2].tokenize(text)
+
+
+def test_emphasis_amplifier_matches_stock_analyzer():
+    """
+    Test if the emphasis amplifier of the punctuation counts is exactly the one of the stock analyzer.
+    """
+    stock_analyzer = SentimentIntensityAnalyzer.__new__(SentimentIntensityAnalyzer)
+    for exclamation_count in range(8):
+        for question_count in range(8):
+            text = '!' * exclamation_count + '?' * question_count
+            assert tx.get_emphasis_amplifier(exclamation_count, question_count) == \
+                   stock_analyzer._punctuation_emphasis(text)
+
+
+def test_scores_match_stock_analyzer():
+    """
+    Test if texts scored from the fused tokenization get exactly the stock VADER polarities.
+    """
+    analyzer = an.get_analyzer()
+    stock_analyzer = SentimentIntensityAnalyzer.__new__(SentimentIntensityAnalyzer)
+    stock_analyzer.lexicon = analyzer.lexicon
+    stock_analyzer.emojis = analyzer.emojis
+    for text in __get_texts():
+        assert analyzer.polarity_scores(text) == stock_analyzer.polarity_scores(text)